@@ -0,0 +1,169 @@
+"""Local stand-in for the model registry REST server, used by the benchmarks.
+
+Only the handful of endpoints exercised by the benchmarks are served, always from canned payloads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+
+BASE_PATH = "/api/model_registry/v1alpha3"
+
+
+def registered_model(i: int) -> dict:
+    return {
+        "id": str(i),
+        "name": f"model-{i}",
+        "owner": "bench",
+        "state": "LIVE",
+        "createTimeSinceEpoch": "1700000000000",
+        "lastUpdateTimeSinceEpoch": "1700000000000",
+        "customProperties": {
+            "team": {"string_value": "ml", "metadataType": "MetadataStringValue"}
+        },
+    }
+
+
+def model_version(i: int, rm_id: str = "1") -> dict:
+    return {
+        "id": str(i),
+        "name": f"v{i}",
+        "author": "bench",
+        "state": "LIVE",
+        "registeredModelId": rm_id,
+        "createTimeSinceEpoch": "1700000000000",
+        "lastUpdateTimeSinceEpoch": "1700000000000",
+    }
+
+
+def model_artifact(i: int, n_props: int = 0) -> dict:
+    return {
+        "id": str(i),
+        "name": f"artifact-{i}",
+        "uri": f"s3://bucket/models/{i}",
+        "state": "LIVE",
+        "artifactType": "model-artifact",
+        "modelFormatName": "onnx",
+        "modelFormatVersion": "1",
+        "createTimeSinceEpoch": "1700000000000",
+        "lastUpdateTimeSinceEpoch": "1700000000000",
+        "customProperties": {
+            f"prop-{p}": {"int_value": str(p), "metadataType": "MetadataIntValue"}
+            for p in range(n_props)
+        },
+    }
+
+
+def page(items: list[dict]) -> dict:
+    return {
+        "items": items,
+        "nextPageToken": "",
+        "pageSize": len(items),
+        "size": len(items),
+    }
+
+
+def make_app(
+    latency: float = 0.0,
+    page_size: int = 100,
+    n_props: int = 0,
+    n_models: int | None = None,
+    found: bool = True,
+) -> web.Application:
+    """Build the stand-in app.
+
+    Args:
+        latency: Artificial delay added to every response, in seconds.
+        page_size: Number of items returned by list endpoints.
+        n_props: Number of custom properties set on each artifact.
+        n_models: If set, registered models are paged through this many models following the `pageSize` and
+            `nextPageToken` query parameters, instead of always returning the same page.
+        found: Whether lookups by name find anything, otherwise they're answered with a 404 as for new models.
+    """
+    bodies = {
+        "registered_model": json.dumps(registered_model(1)),
+        "model_version": json.dumps(model_version(1)),
+        "model_artifact": json.dumps(model_artifact(1)),
+        "not_found": json.dumps({"code": "404", "message": "not found"}),
+        "registered_models": json.dumps(
+            page([registered_model(i) for i in range(page_size)])
+        ),
+        "model_versions": json.dumps(
+            page([model_version(i) for i in range(page_size)])
+        ),
+        "model_artifacts": json.dumps(
+            page([model_artifact(i, n_props) for i in range(page_size)])
+        ),
+    }
+
+    def handler(key: str, status: int = 200):
+        async def handle(_: web.Request) -> web.Response:
+            if latency:
+                await asyncio.sleep(latency)
+            return web.Response(
+                text=bodies[key], status=status, content_type="application/json"
+            )
+
+        return handle
+
+    async def paged_models(request: web.Request) -> web.Response:
+        assert n_models is not None
+        if latency:
+            await asyncio.sleep(latency)
+        size = int(request.query.get("pageSize", page_size))
+        start = int(request.query.get("nextPageToken") or 0)
+        end = min(start + size, n_models)
+        body = page([registered_model(i) for i in range(start, end)])
+        body["nextPageToken"] = str(end) if end < n_models else ""
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get(
+        f"{BASE_PATH}/registered_model",
+        handler("registered_model") if found else handler("not_found", 404),
+    )
+    app.router.add_post(
+        f"{BASE_PATH}/registered_models", handler("registered_model", 201)
+    )
+    app.router.add_get(
+        f"{BASE_PATH}/registered_models/{{id}}", handler("registered_model")
+    )
+    app.router.add_get(
+        f"{BASE_PATH}/registered_models",
+        paged_models if n_models is not None else handler("registered_models"),
+    )
+    app.router.add_get(
+        f"{BASE_PATH}/model_version",
+        handler("model_version") if found else handler("not_found", 404),
+    )
+    app.router.add_post(f"{BASE_PATH}/model_versions", handler("model_version", 201))
+    app.router.add_post(
+        f"{BASE_PATH}/model_versions/{{id}}/artifacts",
+        handler("model_artifact", 201),
+    )
+    app.router.add_get(f"{BASE_PATH}/model_versions/{{id}}", handler("model_version"))
+    app.router.add_get(f"{BASE_PATH}/model_versions", handler("model_versions"))
+    app.router.add_get(
+        f"{BASE_PATH}/registered_models/{{id}}/versions", handler("model_versions")
+    )
+    app.router.add_get(f"{BASE_PATH}/model_artifacts", handler("model_artifacts"))
+    return app
+
+
+@asynccontextmanager
+async def serve(**kwargs) -> AsyncIterator[tuple[str, int]]:
+    """Serve the stand-in app on a random local port, yielding its address and port."""
+    runner = web.AppRunner(make_app(**kwargs), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        yield "http://127.0.0.1", port
+    finally:
+        await runner.cleanup()
@@ -0,0 +1,54 @@
+"""Walking every registered model with on-demand vs. prefetched pages.
+
+Each page takes `--latency` seconds to arrive and each item `--work` seconds to process, so prefetching should
+overlap the two.
+
+Usage:
+    python benchmarks/bench_prefetch.py [--models N] [--page-size S] [--latency L] [--work W] [--depth D]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from _server import serve
+
+from model_registry.core import ModelRegistryAPIClient
+from model_registry.types import Pager
+
+
+async def walk(
+    client: ModelRegistryAPIClient, page_size: int, work: float, depth: int
+) -> tuple[int, float]:
+    pager = Pager(client.get_registered_models).page_size(page_size).prefetch(depth)
+    count = 0
+    start = time.perf_counter()
+    async for _ in pager:
+        count += 1
+        await asyncio.sleep(work)
+    return count, time.perf_counter() - start
+
+
+async def main(
+    models: int, page_size: int, latency: float, work: float, depth: int
+) -> None:
+    async with serve(latency=latency, n_models=models) as (host, port):
+        client = ModelRegistryAPIClient.insecure_connection(host, port)
+        async with client:
+            for name, d in (("on demand", 0), (f"prefetch({depth})", depth)):
+                count, elapsed = await walk(client, page_size, work, d)
+                assert count == models
+                print(f"{name:<12} {elapsed:6.2f} s ({count / elapsed:8.0f} models/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=2000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--work", type=float, default=0.0005)
+    parser.add_argument("--depth", type=int, default=2)
+    args = parser.parse_args()
+    asyncio.run(main(args.models, args.page_size, args.latency, args.work, args.depth))
@@ -0,0 +1,53 @@
+"""Registering new models with lookup-first vs. optimistic (create-first) registration.
+
+Every request takes `--latency` seconds to be answered, so registration time is dominated by round-trips.
+
+Usage:
+    python benchmarks/bench_register.py [--models N] [--latency L]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from _server import serve
+
+from model_registry import AsyncModelRegistry
+
+
+async def register(host: str, port: int, models: int, optimistic: bool) -> float:
+    registry = AsyncModelRegistry(
+        host,
+        port,
+        author="bench",
+        is_secure=False,
+        optimistic_registration=optimistic,
+    )
+    async with registry:
+        start = time.perf_counter()
+        for i in range(models):
+            await registry.register_model(
+                f"model-{i}",
+                "s3://bucket/model",
+                model_format_name="onnx",
+                model_format_version="1",
+                version="v1",
+            )
+        return time.perf_counter() - start
+
+
+async def main(models: int, latency: float) -> None:
+    async with serve(latency=latency, found=False) as (host, port):
+        for name, optimistic in (("lookup first", False), ("optimistic", True)):
+            elapsed = await register(host, port, models, optimistic)
+            print(f"{name:<13} {elapsed * 1000 / models:7.2f} ms/model")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.models, args.latency))
@@ -0,0 +1,64 @@
+"""Requests per second with a pooled session vs. a fresh session per call.
+
+Usage:
+    python benchmarks/bench_session.py [--calls N] [--concurrency C]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from _server import serve
+
+from model_registry.core import ModelRegistryAPIClient
+from mr_openapi import ApiClient, ModelRegistryServiceApi
+
+
+class PerCallSessionClient(ModelRegistryAPIClient):
+    """Reproduces the previous behaviour: one `ApiClient` (and TCP connector) per call."""
+
+    @asynccontextmanager
+    async def get_client(self) -> AsyncIterator[ModelRegistryServiceApi]:
+        api_client = ApiClient(self.config)
+        try:
+            yield ModelRegistryServiceApi(api_client)
+        finally:
+            await api_client.close()
+
+
+async def run(client: ModelRegistryAPIClient, calls: int, concurrency: int) -> float:
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            assert await client.get_registered_model_by_params("model-1")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    elapsed = time.perf_counter() - start
+    await client.close()
+    return calls / elapsed
+
+
+async def main(calls: int, concurrency: int) -> None:
+    async with serve() as (host, port):
+        before = await run(
+            PerCallSessionClient.insecure_connection(host, port), calls, concurrency
+        )
+        after = await run(
+            ModelRegistryAPIClient.insecure_connection(host, port), calls, concurrency
+        )
+    print(f"per-call session: {before:8.1f} req/s")
+    print(f"pooled session:   {after:8.1f} req/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency))
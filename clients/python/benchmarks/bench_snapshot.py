@@ -0,0 +1,60 @@
+"""Restoring a registry mirror from a snapshot file.
+
+Builds a mirror of `--models` models with one version and artifact each, saves it, and measures restoring it and
+looking objects up afterwards.
+
+Usage:
+    python benchmarks/bench_snapshot.py [--models N] [--lookups L]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from _server import model_artifact, model_version, registered_model
+
+from model_registry.mirror import RegistryMirror
+from model_registry.types import ModelArtifact, RegisteredModel
+
+
+def build(models: int) -> RegistryMirror:
+    mirror = RegistryMirror(None)  # type: ignore[arg-type]
+    for i in range(models):
+        mirror._put_model(RegisteredModel.from_payload(registered_model(i)))
+        mirror._put_version(model_version(i, str(i)) | {"name": "v1"})
+        ma = model_artifact(i, n_props=5) | {"name": f"model-{i}"}
+        mirror._put_artifact(str(i), ModelArtifact.from_payload(ma))
+    return mirror
+
+
+def main(models: int, lookups: int) -> None:
+    mirror = build(models)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "registry.snap")
+        start = time.perf_counter()
+        mirror.save(path)
+        print(f"save          {time.perf_counter() - start:7.3f} s")
+        print(f"size          {os.path.getsize(path) / 2**20:7.1f} MiB")
+
+        restored = RegistryMirror(None)  # type: ignore[arg-type]
+        start = time.perf_counter()
+        restored.load_snapshot(path)
+        print(f"restore       {time.perf_counter() - start:7.3f} s")
+
+        start = time.perf_counter()
+        for i in range(lookups):
+            assert restored.get_model_artifact(f"model-{i % models}", "v1")
+        elapsed = time.perf_counter() - start
+        print(f"{lookups} lookups {elapsed:7.3f} s (first access decodes)")
+        restored._snapshot.close()  # type: ignore[union-attr]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--models", type=int, default=50_000)
+    parser.add_argument("--lookups", type=int, default=1_000)
+    args = parser.parse_args()
+    main(args.models, args.lookups)
@@ -0,0 +1,93 @@
+"""Thread scaling of the sync `ModelRegistry` facade.
+
+Compares the background event-loop runner against the previous approach of driving a loop per calling thread with
+`run_until_complete`.
+
+Usage:
+    python benchmarks/bench_threads.py [--calls N] [--threads 1,2,4,8,16] [--latency SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from _server import serve
+
+from model_registry import ModelRegistry
+
+
+class PerThreadLoopRegistry(ModelRegistry):
+    """Reproduces the previous runner: each thread blocks on an event loop of its own."""
+
+    _local = threading.local()
+
+    def async_runner(self, coro: Any) -> Any:
+        loop = getattr(self._local, "loop", None)
+        if loop is None:
+            loop = self._local.loop = asyncio.new_event_loop()
+        return loop.run_until_complete(coro)
+
+
+def run(registry: ModelRegistry, threads: int, calls: int) -> float:
+    def work(_: int) -> None:
+        assert registry.get_registered_model("model-1")
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(work, range(calls)))
+    return calls / (time.perf_counter() - start)
+
+
+def main(calls: int, threads: list[int], latency: float) -> None:
+    ready = threading.Event()
+    stop: asyncio.Future | None = None
+    address: tuple[str, int] = ("", 0)
+
+    async def server() -> None:
+        nonlocal stop, address
+        stop = asyncio.get_running_loop().create_future()
+        async with serve(latency=latency) as address:
+            ready.set()
+            await stop
+
+    loop = asyncio.new_event_loop()
+    server_thread = threading.Thread(target=loop.run_until_complete, args=(server(),))
+    server_thread.start()
+    ready.wait()
+    host, port = address
+
+    # the per-thread loops are never closed cleanly, which is part of the problem being measured
+    logging.getLogger("asyncio").setLevel(logging.CRITICAL)
+
+    print(f"{'threads':>8} {'per-thread loop':>16} {'background loop':>16}")
+    for n in threads:
+        before = run(
+            PerThreadLoopRegistry(
+                host, port, author="bench", is_secure=False, user_token="x"
+            ),
+            n,
+            calls,
+        )
+        with ModelRegistry(
+            host, port, author="bench", is_secure=False, user_token="x"
+        ) as registry:
+            after = run(registry, n, calls)
+        print(f"{n:>8} {before:>12.1f} r/s {after:>12.1f} r/s")
+
+    loop.call_soon_threadsafe(stop.set_result, None)  # type: ignore[union-attr]
+    server_thread.join()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--threads", default="1,2,4,8,16")
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+    main(args.calls, [int(t) for t in args.threads.split(",")], args.latency)
@@ -0,0 +1,61 @@
+"""Listing throughput with validated vs. trusted-server decoding.
+
+Pages through model versions and model artifacts (with custom properties) served by the stand-in server, once with
+the default pydantic validation and once with `Configuration.trusted_server` set.
+
+Usage:
+    python benchmarks/bench_trusted.py [--pages N] [--page-size S] [--props P]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from _server import serve
+
+from model_registry.core import ModelRegistryAPIClient
+from model_registry.types import ListOptions
+
+
+async def run(client: ModelRegistryAPIClient, pages: int) -> tuple[float, float]:
+    async with client:
+        start = time.perf_counter()
+        for _ in range(pages):
+            assert await client.get_model_versions("1", ListOptions())
+        versions = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(pages):
+            assert await client.get_model_artifacts(options=ListOptions())
+        artifacts = time.perf_counter() - start
+    return versions, artifacts
+
+
+async def main(pages: int, page_size: int, props: int) -> None:
+    async with serve(page_size=page_size, n_props=props) as (host, port):
+        validated = await run(
+            ModelRegistryAPIClient.insecure_connection(host, port), pages
+        )
+        trusted_client = ModelRegistryAPIClient.insecure_connection(host, port)
+        trusted_client.config.trusted_server = True
+        trusted = await run(trusted_client, pages)
+
+    items = pages * page_size
+    for name, before, after in zip(
+        ("model versions", "model artifacts"), validated, trusted
+    ):
+        print(
+            f"{name:<16} validated: {items / before:8.0f} items/s  "
+            f"trusted: {items / after:8.0f} items/s ({before / after:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--props", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.pages, args.page_size, args.props))
@@ -2,8 +2,9 @@
 
 __version__ = "0.2.8a1"
 
-from ._client import ModelRegistry
+from ._client import AsyncModelRegistry, ModelRegistry
 
 __all__ = [
+    "AsyncModelRegistry",
     "ModelRegistry",
 ]
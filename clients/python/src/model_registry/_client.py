@@ -2,29 +2,158 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Awaitable, Iterable, Mapping
 from pathlib import Path
-from typing import Any, TypeVar, Union, get_args
+from typing import Any, Callable, TypeVar, Union, cast, get_args
 from warnings import warn
 
+from mr_openapi.exceptions import ApiException
+
+from ._runner import AsyncRunner
+from .cache import EntityCache
 from .core import ModelRegistryAPIClient
 from .exceptions import StoreError
+from .resolver import PathResolver, Resolved
 from .types import (
+    InferenceService,
     ListOptions,
     ModelArtifact,
     ModelVersion,
     Pager,
     RegisteredModel,
+    RegistrationResult,
+    RegistrationSpec,
+    ServingEnvironment,
     SupportedTypes,
 )
+from .watch import WatchEvent, watch
 
 ModelTypes = Union[RegisteredModel, ModelVersion, ModelArtifact]
 TModel = TypeVar("TModel", bound=ModelTypes)
+T = TypeVar("T")
 
 
-class ModelRegistry:
-    """Model registry client."""
+def _is_conflict(e: ApiException) -> bool:
+    """Whether the server rejected a create because the object already exists."""
+    # depending on the version, the server reports it as a conflict or with the store error
+    return e.status == 409 or (
+        e.status in (400, 500) and "already exists" in (e.body or "").lower()
+    )
+
+
+def _connect(
+    server_address: str,
+    port: int,
+    *,
+    is_secure: bool,
+    user_token: str | None,
+    custom_ca: str | None,
+) -> ModelRegistryAPIClient:
+    if not user_token:
+        # /var/run/secrets/kubernetes.io/serviceaccount/token
+        sa_token = os.environ.get("KF_PIPELINES_SA_TOKEN_PATH")
+        if sa_token:
+            user_token = Path(sa_token).read_text()
+        else:
+            warn("User access token is missing", stacklevel=3)
+
+    if is_secure:
+        root_ca = None
+        if not custom_ca:
+            if cert := os.getenv("CERT"):
+                root_ca = cert
+                # client might have a default CA setup
+        else:
+            root_ca = custom_ca
+
+        if not user_token:
+            msg = "user token must be provided for secure connection"
+            raise StoreError(msg)
+
+        return ModelRegistryAPIClient.secure_connection(
+            server_address, port, user_token=user_token, custom_ca=root_ca
+        )
+    if custom_ca:
+        msg = "Custom CA provided without secure connection, conflicting options"
+        raise StoreError(msg)
+    return ModelRegistryAPIClient.insecure_connection(server_address, port, user_token)
+
+
+def _hf_model_source(
+    repo: str, path: str, git_ref: str, author: str | None
+) -> tuple[str, str, str, dict[str, Any]]:
+    """Look up a Hugging Face model.
+
+    Returns:
+        The model ID, its author, the source URI and the metadata to register it with.
+    """
+    try:
+        from huggingface_hub import HfApi, hf_hub_url, utils
+    except ImportError as e:
+        msg = """package `huggingface-hub` is not installed.
+        To import models from Hugging Face Hub, start by installing the `huggingface-hub` package, either directly or as an
+        extra (available as `model-registry[hf]`), e.g.:
+        ```sh
+        !pip install --pre model-registry[hf]
+        ```
+        or
+        ```sh
+        !pip install huggingface-hub
+        ```
+        """
+        raise StoreError(msg) from e
+
+    api = HfApi()
+    try:
+        model_info = api.model_info(repo, revision=git_ref)
+    except utils.RepositoryNotFoundError as e:
+        msg = f"Repository {repo} does not exist"
+        raise StoreError(msg) from e
+    except utils.RevisionNotFoundError as e:
+        # TODO: as all hf-hub client calls default to using main, should we provide a tip?
+        msg = f"Revision {git_ref} does not exist"
+        raise StoreError(msg) from e
+
+    if not author:
+        # model author can be None if the repo is in a "global" namespace (i.e. no / in repo).
+        if model_info.author is None:
+            model_author = "unknown"
+            warn(
+                "Model author is unknown. This is likely because the model is in a global namespace.",
+                stacklevel=3,
+            )
+        else:
+            model_author = model_info.author
+    else:
+        model_author = author
+    source_uri = hf_hub_url(repo, path, revision=git_ref)
+    metadata = {
+        "repo": repo,
+        "source_uri": source_uri,
+        "model_origin": "huggingface_hub",
+        "model_author": model_author,
+    }
+    # card_data is the new field, but let's use the old one for backwards compatibility.
+    if card_data := model_info.cardData:
+        metadata.update(
+            {
+                k: v
+                for k, v in card_data.to_dict().items()
+                # TODO: (#151) preserve tags, possibly other complex metadata
+                if isinstance(v, get_args(SupportedTypes))
+            }
+        )
+    return model_info.id, model_author, source_uri, metadata
+
+
+class AsyncModelRegistry:
+    """Async model registry client.
+
+    Mirrors {py:class}`ModelRegistry`, with every method being a coroutine and every pager being async.
+    All calls share the connection pool of the underlying {py:class}`model_registry.core.ModelRegistryAPIClient`.
+    """
 
     def __init__(
         self,
@@ -35,6 +164,8 @@ class ModelRegistry:
         is_secure: bool = True,
         user_token: str | None = None,
         custom_ca: str | None = None,
+        cache: EntityCache | None = None,
+        optimistic_registration: bool = False,
     ):
         """Constructor.
 
@@ -47,57 +178,64 @@ class ModelRegistry:
             is_secure: Whether to use a secure connection. Defaults to True.
             user_token: The PEM-encoded user token as a string. Defaults to content of path on envvar KF_PIPELINES_SA_TOKEN_PATH.
             custom_ca: Path to the PEM-encoded root certificates as a string. Defaults to path on envvar CERT.
+            cache: Cache for registry lookups. Defaults to no caching.
+            optimistic_registration: Register models and versions by trying to create them first, only looking them
+                up if they already exist. Saves a round-trip per registration when they're usually new.
         """
-        import nest_asyncio
-
-        nest_asyncio.apply()
-
         # TODO: get remaining args from env
         self._author = author
+        self._optimistic = optimistic_registration
+        self._api = _connect(
+            server_address,
+            port,
+            is_secure=is_secure,
+            user_token=user_token,
+            custom_ca=custom_ca,
+        )
+        self._api.cache = cache
+        self._resolver = PathResolver(self._api)
 
-        if not user_token:
-            # /var/run/secrets/kubernetes.io/serviceaccount/token
-            sa_token = os.environ.get("KF_PIPELINES_SA_TOKEN_PATH")
-            if sa_token:
-                user_token = Path(sa_token).read_text()
-            else:
-                warn("User access token is missing", stacklevel=2)
-
-        if is_secure:
-            root_ca = None
-            if not custom_ca:
-                if cert := os.getenv("CERT"):
-                    root_ca = cert
-                    # client might have a default CA setup
-            else:
-                root_ca = custom_ca
-
-            if not user_token:
-                msg = "user token must be provided for secure connection"
-                raise StoreError(msg)
-
-            self._api = ModelRegistryAPIClient.secure_connection(
-                server_address, port, user_token=user_token, custom_ca=root_ca
-            )
-        elif custom_ca:
-            msg = "Custom CA provided without secure connection, conflicting options"
-            raise StoreError(msg)
-        else:
-            self._api = ModelRegistryAPIClient.insecure_connection(
-                server_address, port, user_token
-            )
+    @classmethod
+    def _from_api(
+        cls,
+        api: ModelRegistryAPIClient,
+        author: str,
+        optimistic_registration: bool = False,
+    ) -> AsyncModelRegistry:
+        registry = cls.__new__(cls)
+        registry._author = author
+        registry._optimistic = optimistic_registration
+        registry._api = api
+        registry._resolver = PathResolver(api)
+        return registry
 
-    def async_runner(self, coro: Any) -> Any:
-        import asyncio
+    async def __aenter__(self) -> AsyncModelRegistry:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
 
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(coro)
+    async def close(self) -> None:
+        """Close the connections held by this client.
+
+        The client can still be used afterwards, in which case new connections are opened.
+        """
+        await self._api.close()
 
     async def _register_model(self, name: str, **kwargs) -> RegisteredModel:
+        if self._optimistic:
+            try:
+                return await self._api.upsert_registered_model(
+                    RegisteredModel(name=name, **kwargs)
+                )
+            except ApiException as e:
+                if not _is_conflict(e):
+                    raise
+            if rm := await self._api.get_registered_model_by_params(name):
+                return rm
+            msg = f"Model {name} already exists, but could not be found"
+            raise StoreError(msg)
+
         if rm := await self._api.get_registered_model_by_params(name):
             return rm
 
@@ -109,8 +247,18 @@ class ModelRegistry:
         self, rm: RegisteredModel, version: str, author: str, /, **kwargs
     ) -> ModelVersion:
         assert rm.id is not None, "Registered model must have an ID"
+        msg = f"Version {version} already exists"
+        if self._optimistic:
+            try:
+                return await self._api.upsert_model_version(
+                    ModelVersion(name=version, author=author, **kwargs), rm.id
+                )
+            except ApiException as e:
+                if _is_conflict(e):
+                    raise StoreError(msg) from e
+                raise
+
         if await self._api.get_model_version_by_params(rm.id, version):
-            msg = f"Version {version} already exists"
             raise StoreError(msg)
 
         return await self._api.upsert_model_version(
@@ -125,6 +273,535 @@ class ModelRegistry:
             ModelArtifact(name=name, uri=uri, **kwargs), mv.id
         )
 
+    async def register_model(
+        self,
+        name: str,
+        uri: str,
+        *,
+        model_format_name: str,
+        model_format_version: str,
+        version: str,
+        storage_key: str | None = None,
+        storage_path: str | None = None,
+        service_account_name: str | None = None,
+        author: str | None = None,
+        owner: str | None = None,
+        description: str | None = None,
+        metadata: Mapping[str, SupportedTypes] | None = None,
+    ) -> RegisteredModel:
+        """Register a model.
+
+        See {py:meth}`ModelRegistry.register_model`.
+
+        Args:
+            name: Name of the model.
+            uri: URI of the model.
+
+        Keyword Args:
+            version: Version of the model. Has to be unique.
+            model_format_name: Name of the model format.
+            model_format_version: Version of the model format.
+            description: Description of the model.
+            author: Author of the model. Defaults to the client author.
+            owner: Owner of the model. Defaults to the client author.
+            storage_key: Storage key.
+            storage_path: Storage path.
+            service_account_name: Service account name.
+            metadata: Additional version metadata. Defaults to values returned by `default_metadata()`.
+
+        Returns:
+            Registered model.
+        """
+        spec = RegistrationSpec(
+            name,
+            uri,
+            model_format_name=model_format_name,
+            model_format_version=model_format_version,
+            version=version,
+            storage_key=storage_key,
+            storage_path=storage_path,
+            service_account_name=service_account_name,
+            author=author,
+            description=description,
+            metadata=metadata,
+        )
+        rm = await self._register_model(name, owner=owner or self._author)
+        await self._register_version(spec, rm, RegistrationResult(spec, rm))
+        return rm
+
+    async def _register_version(
+        self, spec: RegistrationSpec, rm: RegisteredModel, result: RegistrationResult
+    ) -> None:
+        """Register the version and artifact of a spec, filling in the result as it goes."""
+        result.version = await self._register_new_version(
+            rm,
+            spec.version,
+            spec.author or self._author,
+            description=spec.description,
+            custom_properties=spec.metadata or {},
+        )
+        result.artifact = await self._register_model_artifact(
+            result.version,
+            spec.name,
+            spec.uri,
+            model_format_name=spec.model_format_name,
+            model_format_version=spec.model_format_version,
+            storage_key=spec.storage_key,
+            storage_path=spec.storage_path,
+            service_account_name=spec.service_account_name,
+        )
+
+    async def register_models(
+        self, specs: Iterable[RegistrationSpec], *, concurrency: int = 10
+    ) -> list[RegistrationResult]:
+        """Register many models concurrently.
+
+        See {py:meth}`ModelRegistry.register_models`.
+
+        Args:
+            specs: Models to register.
+
+        Keyword Args:
+            concurrency: Maximum number of registrations in flight at once.
+
+        Returns:
+            One result per spec, in the same order.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        limit = asyncio.Semaphore(concurrency)
+        # specs sharing a name share the lookup (or creation) of their registered model
+        models: dict[str, asyncio.Future[RegisteredModel]] = {}
+
+        async def register_model(spec: RegistrationSpec) -> RegisteredModel:
+            async with limit:
+                return await self._register_model(
+                    spec.name, owner=spec.owner or self._author
+                )
+
+        async def register(spec: RegistrationSpec) -> RegistrationResult:
+            result = RegistrationResult(spec)
+            if spec.name not in models:
+                models[spec.name] = asyncio.ensure_future(register_model(spec))
+            try:
+                result.model = await models[spec.name]
+                async with limit:
+                    await self._register_version(spec, result.model, result)
+            except Exception as e:
+                result.error = e
+            return result
+
+        return list(await asyncio.gather(*(register(spec) for spec in specs)))
+
+    async def update(self, model: TModel) -> TModel:
+        """Update a model."""
+        if not model.id:
+            msg = "Model must have an ID"
+            raise StoreError(msg)
+        if not isinstance(model, get_args(ModelTypes)):
+            msg = f"Model must be one of {get_args(ModelTypes)}"
+            raise StoreError(msg)
+        if isinstance(model, RegisteredModel):
+            return cast(TModel, await self._api.upsert_registered_model(model))
+        if isinstance(model, ModelVersion):
+            return cast(TModel, await self._api.upsert_model_version(model, None))
+        return cast(TModel, await self._api.upsert_model_artifact(model))
+
+    async def register_hf_model(
+        self,
+        repo: str,
+        path: str,
+        *,
+        version: str,
+        model_format_name: str,
+        model_format_version: str,
+        author: str | None = None,
+        owner: str | None = None,
+        model_name: str | None = None,
+        description: str | None = None,
+        git_ref: str = "main",
+    ) -> RegisteredModel:
+        """Register a Hugging Face model.
+
+        See {py:meth}`ModelRegistry.register_hf_model`. The Hugging Face Hub lookup runs in a worker thread.
+
+        Args:
+            repo: Name of the repository from Hugging Face hub.
+            path: URI of the model.
+
+        Keyword Args:
+            version: Version of the model. Has to be unique.
+            model_format_name: Name of the model format.
+            model_format_version: Version of the model format.
+            author: Author of the model. Defaults to repo owner.
+            owner: Owner of the model. Defaults to the client author.
+            model_name: Name of the model. Defaults to the repo name.
+            description: Description of the model.
+            git_ref: Git reference to use. Defaults to `main`.
+
+        Returns:
+            Registered model.
+        """
+        model_id, model_author, source_uri, metadata = await asyncio.to_thread(
+            _hf_model_source, repo, path, git_ref, author
+        )
+        return await self.register_model(
+            model_name or model_id,
+            source_uri,
+            author=author or model_author,
+            owner=owner or self._author,
+            version=version,
+            model_format_name=model_format_name,
+            model_format_version=model_format_version,
+            description=description,
+            storage_path=path,
+            metadata=metadata,
+        )
+
+    async def get_registered_model(self, name: str) -> RegisteredModel | None:
+        """Get a registered model.
+
+        Args:
+            name: Name of the model.
+
+        Returns:
+            Registered model.
+        """
+        return await self._api.get_registered_model_by_params(name)
+
+    async def get_model_version(self, name: str, version: str) -> ModelVersion | None:
+        """Get a model version.
+
+        Args:
+            name: Name of the model.
+            version: Version of the model.
+
+        Returns:
+            Model version.
+
+        Raises:
+            StoreException: If the model does not exist.
+        """
+        if mv := await self._resolver.model_version(name, version):
+            return mv
+        if not await self.get_registered_model(name):
+            msg = f"Model {name} does not exist"
+            raise StoreError(msg)
+        return None
+
+    async def get_model_artifact(self, name: str, version: str) -> ModelArtifact | None:
+        """Get a model artifact.
+
+        Args:
+            name: Name of the model.
+            version: Version of the model.
+
+        Returns:
+            Model artifact.
+
+        Raises:
+            StoreException: If either the model or the version don't exist.
+        """
+        if ma := await self._resolver.model_artifact(name, version):
+            return ma
+        if not await self.get_model_version(name, version):
+            msg = f"Version {version} does not exist"
+            raise StoreError(msg)
+        return None
+
+    async def resolve(self, path: str) -> Resolved | None:
+        """Resolve a path to a registered model, model version or model artifact.
+
+        The IDs of the models and versions along the way are kept for a few minutes, so resolving other paths under
+        them takes a single request.
+
+        Args:
+            path: `model`, `model/version` or `model/version/artifact`.
+
+        Returns:
+            Registered model, model version or model artifact, or None if any part of the path doesn't exist.
+
+        Raises:
+            ValueError: If the path is malformed.
+        """
+        return await self._resolver.resolve(path)
+
+    async def get_registered_models(self) -> Pager[RegisteredModel]:
+        """Get a pager for registered models.
+
+        Returns:
+            Async iterable pager for registered models.
+        """
+        return Pager[RegisteredModel](
+            self._api.get_registered_models,
+            raw_page_fn=self._api.get_registered_models_raw,
+        )
+
+    async def get_model_versions(self, name: str) -> Pager[ModelVersion]:
+        """Get a pager for model versions.
+
+        Args:
+            name: Name of the model.
+
+        Returns:
+            Async iterable pager for model versions.
+
+        Raises:
+            StoreException: If the model does not exist.
+        """
+        if not (rm := await self.get_registered_model(name)):
+            msg = f"Model {name} does not exist"
+            raise StoreError(msg)
+
+        async def rm_versions(options: ListOptions) -> list[ModelVersion]:
+            # type checkers can't restrict the type inside a nested function: https://mypy.readthedocs.io/en/stable/common_issues.html#narrowing-and-inner-functions
+            assert rm.id
+            return await self._api.get_model_versions(rm.id, options)
+
+        async def raw_rm_versions(
+            options: ListOptions, as_bytes: bool
+        ) -> list[dict[str, Any]] | bytes:
+            assert rm.id
+            return await self._api.get_model_versions_raw(
+                rm.id, options, as_bytes=as_bytes
+            )
+
+        return Pager[ModelVersion](rm_versions, raw_page_fn=raw_rm_versions)
+
+    def watch_registered_models(
+        self,
+        *,
+        since: int | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[WatchEvent[RegisteredModel]]:
+        """Watch registered models for changes.
+
+        See {py:func}`model_registry.watch.watch` for how the registry is polled.
+
+        Keyword Args:
+            since: Report changes made from this time on, in milliseconds since epoch. Defaults to changes made from now
+                on.
+            min_interval: Shortest interval between polls, in seconds.
+            max_interval: Longest interval between polls, in seconds.
+
+        Returns:
+            Async iterator of changes, oldest first.
+        """
+        return watch(
+            self._api.get_registered_models,
+            since=since,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    async def watch_model_versions(
+        self,
+        name: str,
+        *,
+        since: int | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[WatchEvent[ModelVersion]]:
+        """Watch the versions of a model for changes.
+
+        See {py:func}`model_registry.watch.watch` for how the registry is polled.
+
+        Args:
+            name: Name of the model.
+
+        Keyword Args:
+            since: Report changes made from this time on, in milliseconds since epoch. Defaults to changes made from now
+                on.
+            min_interval: Shortest interval between polls, in seconds.
+            max_interval: Longest interval between polls, in seconds.
+
+        Yields:
+            Changes, oldest first.
+
+        Raises:
+            StoreException: If the model does not exist.
+        """
+        if not (rm := await self.get_registered_model(name)):
+            msg = f"Model {name} does not exist"
+            raise StoreError(msg)
+
+        async def rm_versions(options: ListOptions) -> list[ModelVersion]:
+            assert rm.id
+            return await self._api.get_model_versions(rm.id, options)
+
+        async for event in watch(
+            rm_versions,
+            since=since,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        ):
+            yield event
+
+    def watch_inference_services(
+        self,
+        *,
+        since: int | None = None,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+    ) -> AsyncIterator[WatchEvent[InferenceService]]:
+        """Watch inference services of every serving environment for changes.
+
+        See {py:func}`model_registry.watch.watch` for how the registry is polled.
+
+        Keyword Args:
+            since: Report changes made from this time on, in milliseconds since epoch. Defaults to changes made from now
+                on.
+            min_interval: Shortest interval between polls, in seconds.
+            max_interval: Longest interval between polls, in seconds.
+
+        Returns:
+            Async iterator of changes, oldest first.
+        """
+        return watch(
+            self._api.get_inference_services,
+            since=since,
+            min_interval=min_interval,
+            max_interval=max_interval,
+        )
+
+    async def get_serving_environments(self) -> Pager[ServingEnvironment]:
+        """Get a pager for serving environments.
+
+        Returns:
+            Async iterable pager for serving environments.
+        """
+        return Pager[ServingEnvironment](self._api.get_serving_environments)
+
+    async def get_inference_services(
+        self, serving_environment: str | None = None
+    ) -> Pager[InferenceService]:
+        """Get a pager for inference services.
+
+        Args:
+            serving_environment: Name of the serving environment to list the services of. Defaults to every environment.
+
+        Returns:
+            Async iterable pager for inference services.
+
+        Raises:
+            StoreException: If the serving environment does not exist.
+        """
+        if serving_environment is None:
+            return Pager[InferenceService](
+                self._api.get_inference_services,
+                raw_page_fn=self._api.get_inference_services_raw,
+            )
+        se = await self._api.get_serving_environment_by_params(serving_environment)
+        if not se:
+            msg = f"Serving environment {serving_environment} does not exist"
+            raise StoreError(msg)
+
+        async def env_services(options: ListOptions) -> list[InferenceService]:
+            assert se.id
+            return await self._api.get_environment_inference_services(se.id, options)
+
+        async def raw_env_services(
+            options: ListOptions, as_bytes: bool
+        ) -> list[dict[str, Any]] | bytes:
+            assert se.id
+            return await self._api.get_environment_inference_services_raw(
+                se.id, options, as_bytes=as_bytes
+            )
+
+        return Pager[InferenceService](env_services, raw_page_fn=raw_env_services)
+
+
+class ModelRegistry:
+    """Model registry client.
+
+    Calls are driven by a dedicated event loop running on a background thread, so this client is safe to use from any
+    thread. Use {py:class}`AsyncModelRegistry` from async code instead.
+    """
+
+    def __init__(
+        self,
+        server_address: str,
+        port: int = 443,
+        *,
+        author: str,
+        is_secure: bool = True,
+        user_token: str | None = None,
+        custom_ca: str | None = None,
+        cache: EntityCache | None = None,
+        optimistic_registration: bool = False,
+    ):
+        """Constructor.
+
+        Args:
+            server_address: Server address.
+            port: Server port. Defaults to 443.
+
+        Keyword Args:
+            author: Name of the author.
+            is_secure: Whether to use a secure connection. Defaults to True.
+            user_token: The PEM-encoded user token as a string. Defaults to content of path on envvar KF_PIPELINES_SA_TOKEN_PATH.
+            custom_ca: Path to the PEM-encoded root certificates as a string. Defaults to path on envvar CERT.
+            cache: Cache for registry lookups. Defaults to no caching.
+            optimistic_registration: Register models and versions by trying to create them first, only looking them
+                up if they already exist. Saves a round-trip per registration when they're usually new.
+        """
+        # all calls are driven by a dedicated event loop, so connections are kept alive between calls
+        self._runner = AsyncRunner()
+
+        # TODO: get remaining args from env
+        self._author = author
+        self._api = _connect(
+            server_address,
+            port,
+            is_secure=is_secure,
+            user_token=user_token,
+            custom_ca=custom_ca,
+        )
+        self._api.cache = cache
+        self._registry = AsyncModelRegistry._from_api(
+            self._api, author, optimistic_registration
+        )
+
+    def __enter__(self) -> ModelRegistry:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connections held by this client and stop its event loop.
+
+        The client can still be used afterwards, in which case new connections are opened.
+        """
+        self.async_runner(self._registry.close())
+        self._runner.close()
+
+    def async_runner(self, coro: Any) -> Any:
+        """Run a coroutine on the client event loop and wait for its result.
+
+        This is safe to call from any thread, including threads with a running event loop of their own.
+        """
+        return self._runner.run(coro)
+
+    def _sync_pager(self, pager: Pager[T]) -> Pager[T]:
+        page_fn = cast(Callable[[ListOptions], Awaitable[list[T]]], pager.page_fn)
+        raw_page_fn = cast(
+            Union[Callable[[ListOptions, bool], Awaitable[Any]], None],
+            pager.raw_page_fn,
+        )
+
+        def sync_raw_page_fn(options: ListOptions, as_bytes: bool) -> Any:
+            assert raw_page_fn
+            return self.async_runner(raw_page_fn(options, as_bytes))
+
+        return Pager[T](
+            lambda options: self.async_runner(page_fn(options)),
+            pager.options,
+            raw_page_fn=sync_raw_page_fn if raw_page_fn else None,
+        )
+
     def register_model(
         self,
         name: str,
@@ -170,44 +847,49 @@ class ModelRegistry:
         Returns:
             Registered model.
         """
-        rm = self.async_runner(self._register_model(name, owner=owner or self._author))
-        mv = self.async_runner(
-            self._register_new_version(
-                rm,
-                version,
-                author or self._author,
-                description=description,
-                custom_properties=metadata or {},
-            )
-        )
-        self.async_runner(
-            self._register_model_artifact(
-                mv,
+        return self.async_runner(
+            self._registry.register_model(
                 name,
                 uri,
                 model_format_name=model_format_name,
                 model_format_version=model_format_version,
+                version=version,
                 storage_key=storage_key,
                 storage_path=storage_path,
                 service_account_name=service_account_name,
+                author=author,
+                owner=owner,
+                description=description,
+                metadata=metadata,
             )
         )
 
-        return rm
+    def register_models(
+        self, specs: Iterable[RegistrationSpec], *, concurrency: int = 10
+    ) -> list[RegistrationResult]:
+        """Register many models concurrently.
+
+        Each spec is registered like with `register_model`, with up to `concurrency` registrations in flight at once.
+        Specs sharing a model name share the lookup (or creation) of that registered model, which is created with the
+        owner of the first of them.
+        A failed registration doesn't stop the others, its error is reported in its result instead.
+
+        Args:
+            specs: Models to register.
+
+        Keyword Args:
+            concurrency: Maximum number of registrations in flight at once.
+
+        Returns:
+            One result per spec, in the same order.
+        """
+        return self.async_runner(
+            self._registry.register_models(specs, concurrency=concurrency)
+        )
 
     def update(self, model: TModel) -> TModel:
         """Update a model."""
-        if not model.id:
-            msg = "Model must have an ID"
-            raise StoreError(msg)
-        if not isinstance(model, get_args(ModelTypes)):
-            msg = f"Model must be one of {get_args(ModelTypes)}"
-            raise StoreError(msg)
-        if isinstance(model, RegisteredModel):
-            return self.async_runner(self._api.upsert_registered_model(model))
-        if isinstance(model, ModelVersion):
-            return self.async_runner(self._api.upsert_model_version(model, None))
-        return self.async_runner(self._api.upsert_model_artifact(model))
+        return self.async_runner(self._registry.update(model))
 
     def register_hf_model(
         self,
@@ -245,64 +927,11 @@ class ModelRegistry:
         Returns:
             Registered model.
         """
-        try:
-            from huggingface_hub import HfApi, hf_hub_url, utils
-        except ImportError as e:
-            msg = """package `huggingface-hub` is not installed.
-            To import models from Hugging Face Hub, start by installing the `huggingface-hub` package, either directly or as an
-            extra (available as `model-registry[hf]`), e.g.:
-            ```sh
-            !pip install --pre model-registry[hf]
-            ```
-            or
-            ```sh
-            !pip install huggingface-hub
-            ```
-            """
-            raise StoreError(msg) from e
-
-        api = HfApi()
-        try:
-            model_info = api.model_info(repo, revision=git_ref)
-        except utils.RepositoryNotFoundError as e:
-            msg = f"Repository {repo} does not exist"
-            raise StoreError(msg) from e
-        except utils.RevisionNotFoundError as e:
-            # TODO: as all hf-hub client calls default to using main, should we provide a tip?
-            msg = f"Revision {git_ref} does not exist"
-            raise StoreError(msg) from e
-
-        if not author:
-            # model author can be None if the repo is in a "global" namespace (i.e. no / in repo).
-            if model_info.author is None:
-                model_author = "unknown"
-                warn(
-                    "Model author is unknown. This is likely because the model is in a global namespace.",
-                    stacklevel=2,
-                )
-            else:
-                model_author = model_info.author
-        else:
-            model_author = author
-        source_uri = hf_hub_url(repo, path, revision=git_ref)
-        metadata = {
-            "repo": repo,
-            "source_uri": source_uri,
-            "model_origin": "huggingface_hub",
-            "model_author": model_author,
-        }
-        # card_data is the new field, but let's use the old one for backwards compatibility.
-        if card_data := model_info.cardData:
-            metadata.update(
-                {
-                    k: v
-                    for k, v in card_data.to_dict().items()
-                    # TODO: (#151) preserve tags, possibly other complex metadata
-                    if isinstance(v, get_args(SupportedTypes))
-                }
-            )
+        model_id, model_author, source_uri, metadata = _hf_model_source(
+            repo, path, git_ref, author
+        )
         return self.register_model(
-            model_name or model_info.id,
+            model_name or model_id,
             source_uri,
             author=author or model_author,
             owner=owner or self._author,
@@ -323,7 +952,7 @@ class ModelRegistry:
         Returns:
             Registered model.
         """
-        return self.async_runner(self._api.get_registered_model_by_params(name))
+        return self.async_runner(self._registry.get_registered_model(name))
 
     def get_model_version(self, name: str, version: str) -> ModelVersion | None:
         """Get a model version.
@@ -338,11 +967,7 @@ class ModelRegistry:
         Raises:
             StoreException: If the model does not exist.
         """
-        if not (rm := self.get_registered_model(name)):
-            msg = f"Model {name} does not exist"
-            raise StoreError(msg)
-        assert rm.id
-        return self.async_runner(self._api.get_model_version_by_params(rm.id, version))
+        return self.async_runner(self._registry.get_model_version(name, version))
 
     def get_model_artifact(self, name: str, version: str) -> ModelArtifact | None:
         """Get a model artifact.
@@ -357,11 +982,24 @@ class ModelRegistry:
         Raises:
             StoreException: If either the model or the version don't exist.
         """
-        if not (mv := self.get_model_version(name, version)):
-            msg = f"Version {version} does not exist"
-            raise StoreError(msg)
-        assert mv.id
-        return self.async_runner(self._api.get_model_artifact_by_params(name, mv.id))
+        return self.async_runner(self._registry.get_model_artifact(name, version))
+
+    def resolve(self, path: str) -> Resolved | None:
+        """Resolve a path to a registered model, model version or model artifact.
+
+        The IDs of the models and versions along the way are kept for a few minutes, so resolving other paths under
+        them takes a single request.
+
+        Args:
+            path: `model`, `model/version` or `model/version/artifact`.
+
+        Returns:
+            Registered model, model version or model artifact, or None if any part of the path doesn't exist.
+
+        Raises:
+            ValueError: If the path is malformed.
+        """
+        return self.async_runner(self._registry.resolve(path))
 
     def get_registered_models(self) -> Pager[RegisteredModel]:
         """Get a pager for registered models.
@@ -369,11 +1007,9 @@ class ModelRegistry:
         Returns:
             Iterable pager for registered models.
         """
-
-        def rm_list(options: ListOptions) -> list[RegisteredModel]:
-            return self.async_runner(self._api.get_registered_models(options))
-
-        return Pager[RegisteredModel](rm_list)
+        return self._sync_pager(
+            self.async_runner(self._registry.get_registered_models())
+        )
 
     def get_model_versions(self, name: str) -> Pager[ModelVersion]:
         """Get a pager for model versions.
@@ -387,13 +1023,36 @@ class ModelRegistry:
         Raises:
             StoreException: If the model does not exist.
         """
-        if not (rm := self.get_registered_model(name)):
-            msg = f"Model {name} does not exist"
-            raise StoreError(msg)
+        return self._sync_pager(
+            self.async_runner(self._registry.get_model_versions(name))
+        )
 
-        def rm_versions(options: ListOptions) -> list[ModelVersion]:
-            # type checkers can't restrict the type inside a nested function: https://mypy.readthedocs.io/en/stable/common_issues.html#narrowing-and-inner-functions
-            assert rm.id
-            return self.async_runner(self._api.get_model_versions(rm.id, options))
+    def get_serving_environments(self) -> Pager[ServingEnvironment]:
+        """Get a pager for serving environments.
+
+        Returns:
+            Iterable pager for serving environments.
+        """
+        return self._sync_pager(
+            self.async_runner(self._registry.get_serving_environments())
+        )
+
+    def get_inference_services(
+        self, serving_environment: str | None = None
+    ) -> Pager[InferenceService]:
+        """Get a pager for inference services.
+
+        Args:
+            serving_environment: Name of the serving environment to list the services of. Defaults to every environment.
 
-        return Pager[ModelVersion](rm_versions)
+        Returns:
+            Iterable pager for inference services.
+
+        Raises:
+            StoreException: If the serving environment does not exist.
+        """
+        return self._sync_pager(
+            self.async_runner(
+                self._registry.get_inference_services(serving_environment)
+            )
+        )
@@ -0,0 +1,86 @@
+"""Background event loop used to drive the async client from sync code."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def _shutdown(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not threading.current_thread():
+        thread.join()
+        loop.close()
+
+
+class AsyncRunner:
+    """Run coroutines on an event loop owned by a daemon thread.
+
+    The loop is started on first use and lives until `close()` is called (or the runner is garbage collected), so
+    connection pools bound to it stay alive between calls.
+    It's safe to submit coroutines from any number of threads.
+    """
+
+    def __init__(self, name: str = "model-registry-loop") -> None:
+        """Constructor.
+
+        Args:
+            name: Name of the thread running the loop.
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._finalizer: weakref.finalize | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The event loop, started if needed."""
+        if (loop := self._loop) is not None:
+            return loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name=self._name, daemon=True
+                )
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._finalizer = weakref.finalize(self, _shutdown, loop, thread)
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the background loop, blocking until it's done.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The coroutine result.
+
+        Raises:
+            RuntimeError: If called from the background loop itself, as that would deadlock.
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            msg = "Cannot block on the runner loop from within itself, await the coroutine instead"
+            raise RuntimeError(msg)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+    def close(self) -> None:
+        """Stop the loop and join its thread.
+
+        The runner can still be used afterwards, in which case a new loop is started.
+        """
+        with self._lock:
+            finalizer, self._finalizer = self._finalizer, None
+            self._loop = self._thread = None
+        if finalizer is not None:
+            finalizer()
@@ -0,0 +1,250 @@
+"""Client-side cache for registry objects."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from .types.base import BaseResourceModel
+
+T = TypeVar("T", bound=BaseResourceModel)
+
+CacheKey = tuple[Hashable, ...]
+
+
+@dataclass
+class _Entry:
+    value: BaseResourceModel
+    expires: float
+    id_key: CacheKey
+
+
+class EntityCache:
+    """Bounded, expiring cache of registry objects.
+
+    Objects are indexed by ID and by each of their lookup keys (name, parent ID and name, external ID), so any of them
+    resolves without a round-trip to the server.
+    Entries expire `ttl` seconds after being stored, and the least recently used ones are evicted once there are more
+    than `max_size` keys.
+    Objects are copied in and out of the cache, so changes made by callers are never visible to other lookups.
+
+    Lookups that found nothing are remembered as well, for a much shorter `negative_ttl`, so repeatedly probing for
+    objects that don't exist yet doesn't go to the server either.
+    Storing an object under any of those keys (e.g. after creating it) forgets that it was missing.
+
+    Attributes:
+        hits: Number of lookups answered from the cache, including the ones known to be missing.
+        misses: Number of lookups that had to go to the server.
+        negative_hits: Number of lookups answered by remembering the object doesn't exist.
+        evictions: Number of keys evicted to stay within `max_size` or `negative_max_size`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_size: int = 1024,
+        *,
+        negative_ttl: float = 5.0,
+        negative_max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            ttl: Seconds an object is served from the cache after being stored.
+            max_size: Maximum number of keys kept.
+
+        Keyword Args:
+            negative_ttl: Seconds a lookup that found nothing is remembered for. Zero disables negative caching.
+            negative_max_size: Maximum number of missing keys kept.
+            clock: Monotonic clock used for expiry.
+        """
+        if ttl <= 0:
+            msg = f"Cache TTL must be positive, got {ttl}"
+            raise ValueError(msg)
+        if max_size < 1 or negative_max_size < 1:
+            msg = (
+                f"Cache size must be at least 1, got {min(max_size, negative_max_size)}"
+            )
+            raise ValueError(msg)
+        if negative_ttl < 0:
+            msg = f"Negative cache TTL can't be negative, got {negative_ttl}"
+            raise ValueError(msg)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.negative_ttl = negative_ttl
+        self.negative_max_size = negative_max_size
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        # expiry of keys known to be missing on the server
+        self._missing: OrderedDict[CacheKey, float] = OrderedDict()
+        # every key pointing at an object, by (kind, ID)
+        self._aliases: dict[CacheKey, set[CacheKey]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def id_key(kind: str, id: str) -> CacheKey:
+        """Key of an object by ID."""
+        return (kind, "id", id)
+
+    @staticmethod
+    def name_key(kind: str, name: str, parent_id: str | None = None) -> CacheKey:
+        """Key of an object by name, scoped to its parent for versions and artifacts."""
+        return (kind, "name", parent_id, name)
+
+    @staticmethod
+    def external_id_key(kind: str, external_id: str) -> CacheKey:
+        """Key of an object by external ID."""
+        return (kind, "external_id", external_id)
+
+    def get(self, key: CacheKey, cls: type[T]) -> T | None:
+        """Look up an object.
+
+        Args:
+            key: Lookup key.
+            cls: Expected type of the object, objects of any other type are treated as misses.
+
+        Returns:
+            A copy of the cached object, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None or not isinstance(entry.value, cls):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value.model_copy(deep=True)
+
+    def is_missing(self, key: CacheKey) -> bool:
+        """Whether a lookup is known to find nothing.
+
+        Counts as a hit if so, callers are expected to call `get` otherwise.
+        """
+        with self._lock:
+            expires = self._missing.get(key)
+            if expires is None:
+                return False
+            if expires <= self._clock():
+                del self._missing[key]
+                return False
+            self.hits += 1
+            self.negative_hits += 1
+            return True
+
+    def put_missing(self, key: CacheKey) -> None:
+        """Remember that a lookup found nothing."""
+        if not self.negative_ttl:
+            return
+        with self._lock:
+            self._remove(key)
+            self._missing[key] = self._clock() + self.negative_ttl
+            self._missing.move_to_end(key)
+            while len(self._missing) > self.negative_max_size:
+                self._missing.popitem(last=False)
+                self.evictions += 1
+
+    def put(
+        self,
+        kind: str,
+        value: BaseResourceModel,
+        *,
+        parent_id: str | None = None,
+        scoped: bool = False,
+    ) -> None:
+        """Store an object under all of its keys.
+
+        Keys previously pointing at the same object are dropped, unless they still match it.
+
+        Args:
+            kind: Kind of object, objects of the same kind share an ID space.
+            value: Object to store, it must have an ID.
+
+        Keyword Args:
+            parent_id: ID of the parent of a version or artifact, if known.
+            scoped: Whether names are scoped to a parent, in which case the object is only stored by name when
+                `parent_id` is given.
+        """
+        if value.id is None:
+            return
+        id_key = self.id_key(kind, value.id)
+        name = getattr(value, "name", None)
+        keys = {id_key}
+        if name is not None and (parent_id is not None or not scoped):
+            keys.add(self.name_key(kind, name, parent_id))
+        if value.external_id is not None:
+            keys.add(self.external_id_key(kind, value.external_id))
+
+        with self._lock:
+            if scoped and parent_id is None and name is not None:
+                self._forget_missing(kind, name)
+            for key in self._aliases.get(id_key, set()) - keys:
+                # the parent of a version or artifact never changes, so its name key still holds
+                if scoped and key[1] == "name" and key[3] == name:
+                    keys.add(key)
+                else:
+                    self._remove(key)
+
+            entry = _Entry(
+                value.model_copy(deep=True), self._clock() + self.ttl, id_key
+            )
+            for key in keys:
+                # a name or external ID may have moved over from another object
+                self._remove(key)
+                self._missing.pop(key, None)
+                self._entries[key] = entry
+            self._aliases[id_key] = keys
+            self._evict()
+
+    def invalidate(self, kind: str, id: str) -> None:
+        """Drop an object and every key pointing at it."""
+        with self._lock:
+            for key in self._aliases.pop(self.id_key(kind, id), set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached object, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._missing.clear()
+
+    def _evict(self) -> None:
+        """Evict the least recently used keys past `max_size`."""
+        while len(self._entries) > self.max_size:
+            key, evicted = self._entries.popitem(last=False)
+            self._unalias(key, evicted)
+            self.evictions += 1
+
+    def _forget_missing(self, kind: str, name: str) -> None:
+        """Forget an object was missing by name, under any parent."""
+        for key in [
+            k for k in self._missing if k[:2] == (kind, "name") and k[3] == name
+        ]:
+            del self._missing[key]
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._unalias(key, entry)
+
+    def _unalias(self, key: CacheKey, entry: _Entry) -> None:
+        keys = self._aliases.get(entry.id_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._aliases[entry.id_key]
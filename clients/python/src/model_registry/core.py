@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import AsyncIterator
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
-from typing import TypeVar, cast
+from dataclasses import dataclass, field
+from typing import Any, Literal, TypeVar, cast
 
 from typing_extensions import overload
 
@@ -17,24 +19,82 @@ from mr_openapi import (
 from mr_openapi import (
     exceptions as mr_exceptions,
 )
+from mr_openapi.codec import JSONCodec
+from mr_openapi.rest import RESTResponse, RESTResponseType
+from mr_openapi.transport import PoolStats
 
 from ._utils import required_args
+from .cache import CacheKey, EntityCache
 from .types import (
     Artifact,
+    InferenceService,
     ListOptions,
     ModelArtifact,
     ModelVersion,
     RegisteredModel,
+    ServeModel,
+    ServingEnvironment,
 )
+from .types.base import BaseResourceModel
 
 ArtifactT = TypeVar("ArtifactT", bound=Artifact)
+ResourceT = TypeVar("ResourceT", bound=BaseResourceModel)
+T = TypeVar("T")
+
+# cache kinds, artifacts of every type share an ID space
+_REGISTERED_MODEL = "registered_model"
+_MODEL_VERSION = "model_version"
+_ARTIFACT = "artifact"
+
+
+# lets raw pages be passed through without decoding the whole body
+_NEXT_PAGE_TOKEN = re.compile(rb'"nextPageToken"\s*:\s*"([^"]*)"')
+
+
+async def _read(response: RESTResponseType) -> bytes:
+    """Read a raw response, raising the same exceptions the generated API would."""
+    rest_response = RESTResponse(response)
+    data = await rest_response.read()
+    if not 200 <= rest_response.status <= 299:
+        raise mr_exceptions.ApiException.from_response(
+            http_resp=rest_response, body=data.decode(), data=None
+        )
+    return data
+
+
+async def _read_json(response: RESTResponseType, codec: JSONCodec) -> Any:
+    """Read and decode a raw response, raising the same exceptions the generated API would."""
+    return codec.loads(await _read(response))
 
 
 @dataclass
 class ModelRegistryAPIClient:
-    """Model registry API."""
+    """Model registry API.
+
+    A single pooled HTTP session is created lazily on first use and shared by every call made from the same event loop.
+    Call `close()` (or use the client as an async context manager) to release it.
+
+    With a `cache` set, lookups by ID, name and external ID are answered from it when possible, and every object read
+    or upserted is written through to it.
+
+    Identical reads by ID or by parameters made concurrently from the same event loop share a single request, unless
+    `coalesce_reads` is unset.
+    Every caller still gets its own copy of the object read.
+    """
 
     config: Configuration
+    cache: EntityCache | None = field(default=None, compare=False)
+    coalesce_reads: bool = field(default=True, compare=False)
+    _api_client: ApiClient | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _loop: asyncio.AbstractEventLoop | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # reads in flight, keyed by event loop, operation and arguments
+    _in_flight: dict[tuple[Any, ...], asyncio.Future[Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def secure_connection(
@@ -81,16 +141,238 @@ class ModelRegistryAPIClient:
             Configuration(host=f"{server_address}:{port}", access_token=user_token)
         )
 
+    async def __aenter__(self) -> ModelRegistryAPIClient:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session, if any.
+
+        The client can still be used afterwards, in which case a new session is created.
+        """
+        api_client, self._api_client, self._loop = self._api_client, None, None
+        if api_client is not None:
+            await api_client.close()
+
+    def pool_stats(self) -> PoolStats | None:
+        """Snapshot of the pooled HTTP session's connection pool, or None if there's no session yet.
+
+        Connection pool and timeout settings are taken from `config.transport` when the session is created, see
+        {py:mod}`mr_openapi.transport`.
+        """
+        return self._api_client.pool_stats() if self._api_client is not None else None
+
     @asynccontextmanager
     async def get_client(self) -> AsyncIterator[ModelRegistryServiceApi]:
-        """Get a client for the model registry."""
-        api_client = ApiClient(self.config)
-        client = ModelRegistryServiceApi(api_client)
+        """Get a client for the model registry.
+
+        The client reuses the pooled session bound to the running event loop.
+        Calls made from any other (live) event loop get a short-lived session instead, as aiohttp sessions can't be
+        shared across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._api_client is not None and self._loop is not loop:
+            if self._loop is not None and not self._loop.is_closed():
+                api_client = ApiClient(self.config)
+                try:
+                    yield ModelRegistryServiceApi(api_client)
+                finally:
+                    await api_client.close()
+                return
+            # the owning loop is gone, and so is any chance of closing its session cleanly
+            self._api_client = None
+
+        if self._api_client is None:
+            self._api_client = ApiClient(self.config)
+            self._loop = loop
+
+        yield ModelRegistryServiceApi(self._api_client)
+
+    async def _get(
+        self,
+        client: ModelRegistryServiceApi,
+        operation: str,
+        from_basemodel: Callable[[Any], T],
+        from_payload: Callable[[Any], T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Call a read operation.
+
+        With `config.trusted_server` set, the response is decoded straight into a domain object, skipping the
+        generated models.
+        Unless `coalesce_reads` is unset, concurrent calls with the same arguments share one request.
 
+        Args:
+            client: API client.
+            operation: Name of the API operation.
+            from_basemodel: Conversion from the generated model.
+            from_payload: Conversion from the decoded JSON object.
+            *args: Positional arguments of the operation.
+            **kwargs: Keyword arguments of the operation.
+        """
+        trusted = self.config.trusted_server
+
+        async def fetch() -> Any:
+            if trusted:
+                call = getattr(client, f"{operation}_without_preload_content")
+                return await _read_json(await call(*args, **kwargs), self.config.codec)
+            return await getattr(client, operation)(*args, **kwargs)
+
+        if self.coalesce_reads:
+            key = (operation, trusted, args, tuple(sorted(kwargs.items())))
+            data = await self._single_flight(key, fetch)
+        else:
+            data = await fetch()
+        # converted by each caller, so that none of them share the domain object
+        return from_payload(data) if trusted else from_basemodel(data)
+
+    async def _single_flight(
+        self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Share one call of `fetch` between concurrent callers with the same key.
+
+        The first caller makes the call, the others wait for its result or exception.
+        If that caller is cancelled, one of the waiting callers makes the call again.
+
+        Args:
+            key: Key of the call, e.g. the operation and its arguments.
+            fetch: Makes the call.
+        """
+        loop = asyncio.get_running_loop()
+        key = (loop, *key)
+        while (future := self._in_flight.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # the waiting caller was cancelled, not the call
+                    raise
+
+        future = loop.create_future()
+        self._in_flight[key] = future
         try:
-            yield client
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # raised by this caller, whether or not anyone is waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
         finally:
-            await api_client.close()
+            del self._in_flight[key]
+
+    async def _cached(
+        self,
+        key: CacheKey,
+        cls: type[ResourceT],
+        fetch: Callable[[], Awaitable[ResourceT | None]],
+        *,
+        parent_id: str | None = None,
+    ) -> ResourceT | None:
+        """Look up an object in the cache, fetching and caching it (or the fact it's missing) on a miss.
+
+        Args:
+            key: Cache key of the object.
+            cls: Type of the object.
+            fetch: Fetches the object from the server.
+
+        Keyword Args:
+            parent_id: ID of the parent of a version or artifact, if known.
+        """
+        if self.cache is None:
+            return await fetch()
+        if self.cache.is_missing(key):
+            return None
+        if (value := self.cache.get(key, cls)) is not None:
+            return value
+        value = await fetch()
+        if value is None:
+            self.cache.put_missing(key)
+        else:
+            self._cache_put(str(key[0]), value, parent_id=parent_id)
+        return value
+
+    def _cache_put(
+        self, kind: str, value: BaseResourceModel, *, parent_id: str | None = None
+    ) -> None:
+        """Write an object through to the cache, if any."""
+        if self.cache is not None:
+            self.cache.put(
+                kind,
+                value,
+                parent_id=parent_id,
+                scoped=kind != _REGISTERED_MODEL,
+            )
+
+    async def _get_page(
+        self,
+        client: ModelRegistryServiceApi,
+        operation: str,
+        from_basemodel: Callable[[Any], T],
+        from_payloads: Callable[[list[Any]], list[T]],
+        *args: Any,
+        options: ListOptions | None = None,
+    ) -> list[T]:
+        """Fetch one page of a list operation, updating the next page token in `options`.
+
+        See `_get` for the arguments, `from_payloads` converts the whole page at once.
+        """
+        kwargs = (options or ListOptions()).as_options()
+        if self.config.trusted_server:
+            call = getattr(client, f"{operation}_without_preload_content")
+            data = await _read_json(await call(*args, **kwargs), self.config.codec)
+            items = from_payloads(data.get("items") or [])
+            next_page_token = data.get("nextPageToken")
+        else:
+            page = await getattr(client, operation)(*args, **kwargs)
+            items = [from_basemodel(item) for item in page.items or []]
+            next_page_token = page.next_page_token
+
+        if options:
+            options.next_page_token = next_page_token
+        return items
+
+    async def _get_raw_page(
+        self,
+        operation: str,
+        *args: Any,
+        options: ListOptions | None = None,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Fetch one page of a list operation without converting its items.
+
+        Args:
+            operation: Name of the API operation.
+            *args: Positional arguments of the operation.
+            options: Options for listing, the next page token is updated in place.
+            as_bytes: Return the undecoded response body instead of the list of decoded items.
+        """
+        async with self.get_client() as client:
+            call = getattr(client, f"{operation}_without_preload_content")
+            body = await _read(
+                await call(*args, **(options or ListOptions()).as_options())
+            )
+
+        if as_bytes:
+            match = _NEXT_PAGE_TOKEN.search(body)
+            items: list[dict[str, Any]] | bytes = body
+            next_page_token = match.group(1).decode() if match else None
+        else:
+            data = self.config.codec.loads(body)
+            items = data.get("items") or []
+            next_page_token = data.get("nextPageToken")
+
+        if options:
+            options.next_page_token = next_page_token
+        return items
 
     async def upsert_registered_model(
         self, registered_model: RegisteredModel
@@ -113,7 +395,9 @@ class ModelRegistryAPIClient:
             else:
                 rm = await client.create_registered_model(registered_model.create())
 
-        return RegisteredModel.from_basemodel(rm)
+        registered_model = RegisteredModel.from_basemodel(rm)
+        self._cache_put(_REGISTERED_MODEL, registered_model)
+        return registered_model
 
     async def get_registered_model_by_id(self, id: str) -> RegisteredModel | None:
         """Fetch a registered model by its ID.
@@ -124,13 +408,23 @@ class ModelRegistryAPIClient:
         Returns:
             Registered model.
         """
-        async with self.get_client() as client:
-            try:
-                rm = await client.get_registered_model(id)
-            except mr_exceptions.NotFoundException:
-                return None
 
-        return RegisteredModel.from_basemodel(rm)
+        async def fetch() -> RegisteredModel | None:
+            async with self.get_client() as client:
+                try:
+                    return await self._get(
+                        client,
+                        "get_registered_model",
+                        RegisteredModel.from_basemodel,
+                        RegisteredModel.from_payload,
+                        id,
+                    )
+                except mr_exceptions.NotFoundException:
+                    return None
+
+        return await self._cached(
+            EntityCache.id_key(_REGISTERED_MODEL, id), RegisteredModel, fetch
+        )
 
     @overload
     async def get_registered_model_by_params(self, name: str): ...
@@ -151,15 +445,27 @@ class ModelRegistryAPIClient:
         Returns:
             Registered model.
         """
-        async with self.get_client() as client:
-            try:
-                rm = await client.find_registered_model(
-                    name=name, external_id=external_id
-                )
-            except mr_exceptions.NotFoundException:
-                return None
 
-        return RegisteredModel.from_basemodel(rm)
+        async def fetch() -> RegisteredModel | None:
+            async with self.get_client() as client:
+                try:
+                    return await self._get(
+                        client,
+                        "find_registered_model",
+                        RegisteredModel.from_basemodel,
+                        RegisteredModel.from_payload,
+                        name=name,
+                        external_id=external_id,
+                    )
+                except mr_exceptions.NotFoundException:
+                    return None
+
+        key = (
+            EntityCache.external_id_key(_REGISTERED_MODEL, external_id)
+            if external_id
+            else EntityCache.name_key(_REGISTERED_MODEL, cast(str, name))
+        )
+        return await self._cached(key, RegisteredModel, fetch)
 
     async def get_registered_models(
         self, options: ListOptions | None = None
@@ -173,14 +479,29 @@ class ModelRegistryAPIClient:
             Registered models.
         """
         async with self.get_client() as client:
-            rm_list = await client.get_registered_models(
-                **(options or ListOptions()).as_options()
+            return await self._get_page(
+                client,
+                "get_registered_models",
+                RegisteredModel.from_basemodel,
+                RegisteredModel.from_payloads,
+                options=options,
             )
 
-        if options:
-            options.next_page_token = rm_list.next_page_token
+    async def get_registered_models_raw(
+        self, options: ListOptions | None = None, as_bytes: bool = False
+    ) -> list[dict[str, Any]] | bytes:
+        """Fetch registered models as returned by the server.
 
-        return [RegisteredModel.from_basemodel(rm) for rm in rm_list.items or []]
+        Args:
+            options: Options for listing registered models.
+            as_bytes: Return the undecoded response body instead of the list of decoded JSON objects.
+
+        Returns:
+            Registered models as JSON objects, or the response body.
+        """
+        return await self._get_raw_page(
+            "get_registered_models", options=options, as_bytes=as_bytes
+        )
 
     async def upsert_model_version(
         self, model_version: ModelVersion, registered_model_id: str | None = None
@@ -209,7 +530,9 @@ class ModelRegistryAPIClient:
                 msg = f"Registered model ID required for creating a new model version: {model_version}"
                 raise ValueError(msg)
 
-        return ModelVersion.from_basemodel(mv)
+        model_version = ModelVersion.from_basemodel(mv)
+        self._cache_put(_MODEL_VERSION, model_version, parent_id=registered_model_id)
+        return model_version
 
     async def get_model_version_by_id(
         self, model_version_id: str
@@ -222,35 +545,109 @@ class ModelRegistryAPIClient:
         Returns:
             Model version.
         """
-        async with self.get_client() as client:
-            try:
-                mv = await client.get_model_version(model_version_id)
-            except mr_exceptions.NotFoundException:
-                return None
 
-        return ModelVersion.from_basemodel(mv)
+        async def fetch() -> ModelVersion | None:
+            async with self.get_client() as client:
+                try:
+                    return await self._get(
+                        client,
+                        "get_model_version",
+                        ModelVersion.from_basemodel,
+                        ModelVersion.from_payload,
+                        model_version_id,
+                    )
+                except mr_exceptions.NotFoundException:
+                    return None
+
+        return await self._cached(
+            EntityCache.id_key(_MODEL_VERSION, model_version_id), ModelVersion, fetch
+        )
 
     async def get_model_versions(
-        self, registered_model_id: str, options: ListOptions | None = None
+        self,
+        registered_model_id: str | None = None,
+        options: ListOptions | None = None,
     ) -> list[ModelVersion]:
         """Fetch model versions by registered model ID.
 
         Args:
-            registered_model_id: Registered model ID.
+            registered_model_id: Registered model ID. Fetches the versions of every model if not set.
             options: Options for listing model versions.
 
         Returns:
             Model versions.
         """
         async with self.get_client() as client:
-            mv_list = await client.get_registered_model_versions(
-                registered_model_id, **(options or ListOptions()).as_options()
+            if not registered_model_id:
+                return await self._get_page(
+                    client,
+                    "get_model_versions",
+                    ModelVersion.from_basemodel,
+                    ModelVersion.from_payloads,
+                    options=options,
+                )
+
+            return await self._get_page(
+                client,
+                "get_registered_model_versions",
+                ModelVersion.from_basemodel,
+                ModelVersion.from_payloads,
+                registered_model_id,
+                options=options,
             )
 
-        if options:
-            options.next_page_token = mv_list.next_page_token
+    @overload
+    async def get_model_versions_raw(
+        self,
+        registered_model_id: str | None = None,
+        options: ListOptions | None = None,
+        as_bytes: Literal[False] = False,
+    ) -> list[dict[str, Any]]: ...
+
+    @overload
+    async def get_model_versions_raw(
+        self,
+        registered_model_id: str | None = None,
+        options: ListOptions | None = None,
+        *,
+        as_bytes: Literal[True],
+    ) -> bytes: ...
+
+    @overload
+    async def get_model_versions_raw(
+        self,
+        registered_model_id: str | None = None,
+        options: ListOptions | None = None,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes: ...
+
+    async def get_model_versions_raw(
+        self,
+        registered_model_id: str | None = None,
+        options: ListOptions | None = None,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Fetch model versions by registered model ID, as returned by the server.
+
+        Args:
+            registered_model_id: Registered model ID. Fetches the versions of every model if not set.
+            options: Options for listing model versions.
+            as_bytes: Return the undecoded response body instead of the list of decoded JSON objects.
+
+        Returns:
+            Model versions as JSON objects, or the response body.
+        """
+        if not registered_model_id:
+            return await self._get_raw_page(
+                "get_model_versions", options=options, as_bytes=as_bytes
+            )
 
-        return [ModelVersion.from_basemodel(mv) for mv in mv_list.items or []]
+        return await self._get_raw_page(
+            "get_registered_model_versions",
+            registered_model_id,
+            options=options,
+            as_bytes=as_bytes,
+        )
 
     @overload
     async def get_model_version_by_params(
@@ -285,17 +682,31 @@ class ModelRegistryAPIClient:
         Returns:
             Model version.
         """
-        async with self.get_client() as client:
-            try:
-                mv = await client.find_model_version(
-                    name=name,
-                    external_id=external_id,
-                    parent_resource_id=registered_model_id,
-                )
-            except mr_exceptions.NotFoundException:
-                return None
 
-        return ModelVersion.from_basemodel(mv)
+        async def fetch() -> ModelVersion | None:
+            async with self.get_client() as client:
+                try:
+                    return await self._get(
+                        client,
+                        "find_model_version",
+                        ModelVersion.from_basemodel,
+                        ModelVersion.from_payload,
+                        name=name,
+                        external_id=external_id,
+                        parent_resource_id=registered_model_id,
+                    )
+                except mr_exceptions.NotFoundException:
+                    return None
+
+        if external_id:
+            key = EntityCache.external_id_key(_MODEL_VERSION, external_id)
+        else:
+            key = EntityCache.name_key(
+                _MODEL_VERSION, cast(str, name), registered_model_id
+            )
+        return await self._cached(
+            key, ModelVersion, fetch, parent_id=registered_model_id
+        )
 
     async def upsert_model_artifact(
         self, model_artifact: ModelArtifact
@@ -318,7 +729,9 @@ class ModelRegistryAPIClient:
                 ma = await client.update_model_artifact(
                     model_artifact.id, model_artifact.update()
                 )
-        return ModelArtifact.from_basemodel(ma)
+        model_artifact = ModelArtifact.from_basemodel(ma)
+        self._cache_put(_ARTIFACT, model_artifact)
+        return model_artifact
 
     async def upsert_model_version_artifact(
         self, artifact: ArtifactT, model_version_id: str
@@ -335,7 +748,7 @@ class ModelRegistryAPIClient:
             New model version artifact.
         """
         async with self.get_client() as client:
-            return cast(
+            artifact = cast(
                 ArtifactT,
                 Artifact.validate_artifact(
                     await client.upsert_model_version_artifact(
@@ -343,6 +756,8 @@ class ModelRegistryAPIClient:
                     )
                 ),
             )
+        self._cache_put(_ARTIFACT, artifact, parent_id=model_version_id)
+        return artifact
 
     async def get_model_artifact_by_id(self, id: str) -> ModelArtifact | None:
         """Fetch a model artifact by its ID.
@@ -353,13 +768,23 @@ class ModelRegistryAPIClient:
         Returns:
             Model artifact.
         """
-        async with self.get_client() as client:
-            try:
-                ma = await client.get_model_artifact(id)
-            except mr_exceptions.NotFoundException:
-                return None
 
-        return ModelArtifact.from_basemodel(ma)
+        async def fetch() -> ModelArtifact | None:
+            async with self.get_client() as client:
+                try:
+                    return await self._get(
+                        client,
+                        "get_model_artifact",
+                        ModelArtifact.from_basemodel,
+                        ModelArtifact.from_payload,
+                        id,
+                    )
+                except mr_exceptions.NotFoundException:
+                    return None
+
+        return await self._cached(
+            EntityCache.id_key(_ARTIFACT, id), ModelArtifact, fetch
+        )
 
     @overload
     async def get_model_artifact_by_params(
@@ -394,17 +819,27 @@ class ModelRegistryAPIClient:
         Returns:
             Model artifact.
         """
-        async with self.get_client() as client:
-            try:
-                ma = await client.find_model_artifact(
-                    name=name,
-                    parent_resource_id=model_version_id,
-                    external_id=external_id,
-                )
-            except mr_exceptions.NotFoundException:
-                return None
 
-        return ModelArtifact.from_basemodel(ma)
+        async def fetch() -> ModelArtifact | None:
+            async with self.get_client() as client:
+                try:
+                    return await self._get(
+                        client,
+                        "find_model_artifact",
+                        ModelArtifact.from_basemodel,
+                        ModelArtifact.from_payload,
+                        name=name,
+                        parent_resource_id=model_version_id,
+                        external_id=external_id,
+                    )
+                except mr_exceptions.NotFoundException:
+                    return None
+
+        if external_id:
+            key = EntityCache.external_id_key(_ARTIFACT, external_id)
+        else:
+            key = EntityCache.name_key(_ARTIFACT, cast(str, name), model_version_id)
+        return await self._cached(key, ModelArtifact, fetch, parent_id=model_version_id)
 
     async def get_model_artifacts(
         self,
@@ -422,24 +857,23 @@ class ModelRegistryAPIClient:
         """
         async with self.get_client() as client:
             if model_version_id:
-                art_list = await client.get_model_version_artifacts(
-                    model_version_id, **(options or ListOptions()).as_options()
+                artifacts = await self._get_page(
+                    client,
+                    "get_model_version_artifacts",
+                    Artifact.validate_artifact,
+                    Artifact.from_artifact_payloads,
+                    model_version_id,
+                    options=options,
                 )
-                if options:
-                    options.next_page_token = art_list.next_page_token
-                models = []
-                for art in art_list.items or []:
-                    converted = Artifact.validate_artifact(art)
-                    if isinstance(converted, ModelArtifact):
-                        models.append(converted)
-                return models
-
-            ma_list = await client.get_model_artifacts(
-                **(options or ListOptions()).as_options()
+                return [art for art in artifacts if isinstance(art, ModelArtifact)]
+
+            return await self._get_page(
+                client,
+                "get_model_artifacts",
+                ModelArtifact.from_basemodel,
+                ModelArtifact.from_payloads,
+                options=options,
             )
-            if options:
-                options.next_page_token = ma_list.next_page_token
-            return [ModelArtifact.from_basemodel(ma) for ma in ma_list.items or []]
 
     async def get_model_version_artifacts(
         self,
@@ -456,9 +890,373 @@ class ModelRegistryAPIClient:
             Model artifacts.
         """
         async with self.get_client() as client:
-            art_list = await client.get_model_version_artifacts(
-                model_version_id, **(options or ListOptions()).as_options()
+            return await self._get_page(
+                client,
+                "get_model_version_artifacts",
+                Artifact.validate_artifact,
+                Artifact.from_artifact_payloads,
+                model_version_id,
+                options=options,
+            )
+
+    async def get_model_version_artifacts_raw(
+        self,
+        model_version_id: str,
+        options: ListOptions | None = None,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Fetches model version artifacts, as returned by the server.
+
+        Args:
+            model_version_id: ID of the associated model version.
+            options: Options for listing artifacts.
+            as_bytes: Return the undecoded response body instead of the list of decoded JSON objects.
+
+        Returns:
+            Artifacts as JSON objects, or the response body.
+        """
+        return await self._get_raw_page(
+            "get_model_version_artifacts",
+            model_version_id,
+            options=options,
+            as_bytes=as_bytes,
+        )
+
+    async def upsert_serving_environment(
+        self, serving_environment: ServingEnvironment
+    ) -> ServingEnvironment:
+        """Upsert a serving environment.
+
+        Updates or creates a serving environment on the server.
+
+        Args:
+            serving_environment: Serving environment.
+
+        Returns:
+            New serving environment.
+        """
+        async with self.get_client() as client:
+            if serving_environment.id:
+                se = await client.update_serving_environment(
+                    serving_environment.id, serving_environment.update()
+                )
+            else:
+                se = await client.create_serving_environment(
+                    serving_environment.create()
+                )
+
+        return ServingEnvironment.from_basemodel(se)
+
+    async def get_serving_environment_by_id(self, id: str) -> ServingEnvironment | None:
+        """Fetch a serving environment by its ID.
+
+        Args:
+            id: Serving environment ID.
+
+        Returns:
+            Serving environment.
+        """
+        async with self.get_client() as client:
+            try:
+                return await self._get(
+                    client,
+                    "get_serving_environment",
+                    ServingEnvironment.from_basemodel,
+                    ServingEnvironment.from_payload,
+                    id,
+                )
+            except mr_exceptions.NotFoundException:
+                return None
+
+    @overload
+    async def get_serving_environment_by_params(self, name: str): ...
+
+    @overload
+    async def get_serving_environment_by_params(self, *, external_id: str): ...
+
+    @required_args(("name",), ("external_id",))
+    async def get_serving_environment_by_params(
+        self, name: str | None = None, external_id: str | None = None
+    ) -> ServingEnvironment | None:
+        """Fetch a serving environment by its name or external ID.
+
+        Args:
+            name: Serving environment name.
+            external_id: Serving environment external ID.
+
+        Returns:
+            Serving environment.
+        """
+        async with self.get_client() as client:
+            try:
+                return await self._get(
+                    client,
+                    "find_serving_environment",
+                    ServingEnvironment.from_basemodel,
+                    ServingEnvironment.from_payload,
+                    name=name,
+                    external_id=external_id,
+                )
+            except mr_exceptions.NotFoundException:
+                return None
+
+    async def get_serving_environments(
+        self, options: ListOptions | None = None
+    ) -> list[ServingEnvironment]:
+        """Fetch serving environments.
+
+        Args:
+            options: Options for listing serving environments.
+
+        Returns:
+            Serving environments.
+        """
+        async with self.get_client() as client:
+            return await self._get_page(
+                client,
+                "get_serving_environments",
+                ServingEnvironment.from_basemodel,
+                ServingEnvironment.from_payloads,
+                options=options,
+            )
+
+    async def upsert_inference_service(
+        self, inference_service: InferenceService
+    ) -> InferenceService:
+        """Upsert an inference service.
+
+        Updates or creates an inference service on the server.
+
+        Args:
+            inference_service: Inference service.
+
+        Returns:
+            New inference service.
+        """
+        async with self.get_client() as client:
+            if inference_service.id:
+                isvc = await client.update_inference_service(
+                    inference_service.id, inference_service.update()
+                )
+            else:
+                isvc = await client.create_inference_service(inference_service.create())
+
+        return InferenceService.from_basemodel(isvc)
+
+    async def upsert_inference_services(
+        self,
+        inference_services: Iterable[InferenceService],
+        *,
+        concurrency: int = 10,
+    ) -> list[InferenceService | Exception]:
+        """Upsert many inference services concurrently.
+
+        Services with an ID are updated, the others are created. Up to `concurrency` requests are kept in flight over
+        the shared session, and a failed upsert doesn't stop the others.
+
+        Args:
+            inference_services: Inference services.
+
+        Keyword Args:
+            concurrency: Maximum number of requests in flight.
+
+        Returns:
+            New inference services, in the order they were given. Failed upserts are replaced with the error that
+            stopped them.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upsert(inference_service: InferenceService) -> InferenceService:
+            async with semaphore:
+                return await self.upsert_inference_service(inference_service)
+
+        return await asyncio.gather(
+            *(upsert(isvc) for isvc in inference_services), return_exceptions=True
+        )
+
+    async def get_inference_service_by_id(self, id: str) -> InferenceService | None:
+        """Fetch an inference service by its ID.
+
+        Args:
+            id: Inference service ID.
+
+        Returns:
+            Inference service.
+        """
+        async with self.get_client() as client:
+            try:
+                return await self._get(
+                    client,
+                    "get_inference_service",
+                    InferenceService.from_basemodel,
+                    InferenceService.from_payload,
+                    id,
+                )
+            except mr_exceptions.NotFoundException:
+                return None
+
+    @overload
+    async def get_inference_service_by_params(
+        self, serving_environment_id: str, name: str
+    ): ...
+
+    @overload
+    async def get_inference_service_by_params(self, *, external_id: str): ...
+
+    @required_args(("serving_environment_id", "name"), ("external_id",))
+    async def get_inference_service_by_params(
+        self,
+        serving_environment_id: str | None = None,
+        name: str | None = None,
+        external_id: str | None = None,
+    ) -> InferenceService | None:
+        """Fetch an inference service by its name in a serving environment, or by its external ID.
+
+        Args:
+            serving_environment_id: Serving environment ID.
+            name: Inference service name.
+            external_id: Inference service external ID.
+
+        Returns:
+            Inference service.
+        """
+        async with self.get_client() as client:
+            try:
+                return await self._get(
+                    client,
+                    "find_inference_service",
+                    InferenceService.from_basemodel,
+                    InferenceService.from_payload,
+                    name=name,
+                    external_id=external_id,
+                    parent_resource_id=serving_environment_id,
+                )
+            except mr_exceptions.NotFoundException:
+                return None
+
+    async def get_inference_services(
+        self, options: ListOptions | None = None
+    ) -> list[InferenceService]:
+        """Fetch inference services of every serving environment.
+
+        Args:
+            options: Options for listing inference services.
+
+        Returns:
+            Inference services.
+        """
+        async with self.get_client() as client:
+            return await self._get_page(
+                client,
+                "get_inference_services",
+                InferenceService.from_basemodel,
+                InferenceService.from_payloads,
+                options=options,
+            )
+
+    async def get_inference_services_raw(
+        self, options: ListOptions | None = None, as_bytes: bool = False
+    ) -> list[dict[str, Any]] | bytes:
+        """Fetch inference services as returned by the server.
+
+        Args:
+            options: Options for listing inference services.
+            as_bytes: Return the undecoded response body instead of the list of decoded JSON objects.
+
+        Returns:
+            Inference services as JSON objects, or the response body.
+        """
+        return await self._get_raw_page(
+            "get_inference_services", options=options, as_bytes=as_bytes
+        )
+
+    async def get_environment_inference_services(
+        self, serving_environment_id: str, options: ListOptions | None = None
+    ) -> list[InferenceService]:
+        """Fetch inference services of a serving environment.
+
+        Args:
+            serving_environment_id: Serving environment ID.
+            options: Options for listing inference services.
+
+        Returns:
+            Inference services.
+        """
+        async with self.get_client() as client:
+            return await self._get_page(
+                client,
+                "get_environment_inference_services",
+                InferenceService.from_basemodel,
+                InferenceService.from_payloads,
+                serving_environment_id,
+                options=options,
+            )
+
+    async def get_environment_inference_services_raw(
+        self,
+        serving_environment_id: str,
+        options: ListOptions | None = None,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Fetch inference services of a serving environment, as returned by the server.
+
+        Args:
+            serving_environment_id: Serving environment ID.
+            options: Options for listing inference services.
+            as_bytes: Return the undecoded response body instead of the list of decoded JSON objects.
+
+        Returns:
+            Inference services as JSON objects, or the response body.
+        """
+        return await self._get_raw_page(
+            "get_environment_inference_services",
+            serving_environment_id,
+            options=options,
+            as_bytes=as_bytes,
+        )
+
+    async def create_serve_model(
+        self, serve_model: ServeModel, inference_service_id: str
+    ) -> ServeModel:
+        """Record the deployment of a model version by an inference service.
+
+        Serve models can't be updated.
+
+        Args:
+            serve_model: Serve model.
+            inference_service_id: ID of the inference service deploying the model version.
+
+        Returns:
+            New serve model.
+        """
+        async with self.get_client() as client:
+            sm = await client.create_inference_service_serve(
+                inference_service_id, serve_model.create()
+            )
+
+        return ServeModel.from_basemodel(sm)
+
+    async def get_serve_models(
+        self, inference_service_id: str, options: ListOptions | None = None
+    ) -> list[ServeModel]:
+        """Fetch the serve models of an inference service.
+
+        Args:
+            inference_service_id: Inference service ID.
+            options: Options for listing serve models.
+
+        Returns:
+            Serve models.
+        """
+        async with self.get_client() as client:
+            return await self._get_page(
+                client,
+                "get_inference_service_serves",
+                ServeModel.from_basemodel,
+                ServeModel.from_payloads,
+                inference_service_id,
+                options=options,
             )
-        if options:
-            options.next_page_token = art_list.next_page_token
-        return [Artifact.validate_artifact(art) for art in art_list.items or []]
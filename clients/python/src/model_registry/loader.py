@@ -0,0 +1,200 @@
+"""Batched lookups of registry objects by ID."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+from .core import ModelRegistryAPIClient
+from .types import (
+    InferenceService,
+    ListOptions,
+    ModelArtifact,
+    ModelVersion,
+    Pager,
+    RegisteredModel,
+)
+from .types.base import BaseResourceModel
+
+ResourceT = TypeVar("ResourceT", bound=BaseResourceModel)
+
+Scan = Callable[[ListOptions], Awaitable[list[ResourceT]]]
+
+
+class BatchLoader(Generic[ResourceT]):
+    """Loads registry objects by ID in batches.
+
+    Lookups made in the same event loop iteration (e.g. by coroutines started together with `asyncio.gather`) are
+    collected into a batch, deduplicated and then sent concurrently, with at most `concurrency` requests in flight.
+    Each lookup gets its own copy of the object, or None if there's no object with that ID.
+
+    With a `scan` set, batches of at least `scan_threshold` IDs are instead looked up by listing every object, which is
+    cheaper when the batch covers a good part of them.
+
+    A loader doesn't cache anything, batches only last until they're sent. It's bound to the event loop it's first
+    used from.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[ResourceT | None]],
+        *,
+        concurrency: int = 10,
+        scan: Scan[ResourceT] | None = None,
+        scan_threshold: int = 100,
+        page_size: int = 100,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            fetch: Fetches an object by ID, returning None if there's no such object.
+
+        Keyword Args:
+            concurrency: Maximum number of requests in flight.
+            scan: Fetches a page of every object, to look up large batches with.
+            scan_threshold: Minimum number of IDs in a batch to look it up with `scan`.
+            page_size: Page size used when scanning.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        self._fetch = fetch
+        self._concurrency = concurrency
+        self._scan = scan
+        self._scan_threshold = scan_threshold
+        self._page_size = page_size
+
+        self._batch: dict[str, asyncio.Future[ResourceT | None]] = {}
+        # created on first use, to bind to the running loop
+        self._limit: asyncio.Semaphore | None = None
+        # keeps batches being sent from being garbage collected
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @classmethod
+    def registered_models(
+        cls, api: ModelRegistryAPIClient, **kwargs: Any
+    ) -> BatchLoader[RegisteredModel]:
+        """Loader of registered models, see the constructor for the keyword arguments."""
+        return cls(
+            api.get_registered_model_by_id, scan=api.get_registered_models, **kwargs
+        )
+
+    @classmethod
+    def model_versions(
+        cls, api: ModelRegistryAPIClient, **kwargs: Any
+    ) -> BatchLoader[ModelVersion]:
+        """Loader of model versions, see the constructor for the keyword arguments."""
+
+        async def scan(options: ListOptions) -> list[ModelVersion]:
+            return await api.get_model_versions(options=options)
+
+        return cls(api.get_model_version_by_id, scan=scan, **kwargs)
+
+    @classmethod
+    def model_artifacts(
+        cls, api: ModelRegistryAPIClient, **kwargs: Any
+    ) -> BatchLoader[ModelArtifact]:
+        """Loader of model artifacts, see the constructor for the keyword arguments."""
+
+        async def scan(options: ListOptions) -> list[ModelArtifact]:
+            return await api.get_model_artifacts(options=options)
+
+        return cls(api.get_model_artifact_by_id, scan=scan, **kwargs)
+
+    @classmethod
+    def inference_services(
+        cls, api: ModelRegistryAPIClient, **kwargs: Any
+    ) -> BatchLoader[InferenceService]:
+        """Loader of inference services, see the constructor for the keyword arguments."""
+        return cls(
+            api.get_inference_service_by_id, scan=api.get_inference_services, **kwargs
+        )
+
+    async def load(self, id: str) -> ResourceT | None:
+        """Look up an object by ID.
+
+        Args:
+            id: ID of the object.
+
+        Returns:
+            The object, or None if there's no object with that ID.
+        """
+        if (future := self._batch.get(id)) is None:
+            loop = asyncio.get_running_loop()
+            if not self._batch:
+                loop.call_soon(self._dispatch)
+            future = self._batch[id] = loop.create_future()
+        # other lookups of the same ID wait for the same future
+        value = await asyncio.shield(future)
+        return value.model_copy(deep=True) if value is not None else None
+
+    async def load_many(self, ids: Iterable[str]) -> list[ResourceT | None]:
+        """Look up objects by ID, in a single batch.
+
+        Args:
+            ids: IDs of the objects.
+
+        Returns:
+            The objects, in the same order, with None for IDs that don't match any object.
+        """
+        return list(await asyncio.gather(*(self.load(id) for id in ids)))
+
+    def _dispatch(self) -> None:
+        batch, self._batch = self._batch, {}
+        task = asyncio.ensure_future(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: dict[str, asyncio.Future[ResourceT | None]]) -> None:
+        try:
+            if self._scan is not None and len(batch) >= self._scan_threshold:
+                await self._send_scan(self._scan, batch)
+                return
+            if self._limit is None:
+                self._limit = asyncio.Semaphore(self._concurrency)
+            await asyncio.gather(
+                *(self._send_one(self._limit, *item) for item in batch.items())
+            )
+        finally:
+            # the send may have been cancelled, or interrupted by a BaseException, leaving lookups waiting forever
+            for future in batch.values():
+                future.cancel()
+
+    async def _send_one(
+        self,
+        limit: asyncio.Semaphore,
+        id: str,
+        future: asyncio.Future[ResourceT | None],
+    ) -> None:
+        async with limit:
+            try:
+                value = await self._fetch(id)
+            except Exception as e:
+                _fail(future, e)
+            else:
+                future.set_result(value)
+
+    async def _send_scan(
+        self, scan: Scan[ResourceT], batch: dict[str, asyncio.Future[ResourceT | None]]
+    ) -> None:
+        wanted = dict(batch)
+        try:
+            async for page in Pager(scan).page_size(self._page_size).apages():
+                for obj in page:
+                    if (future := wanted.pop(str(obj.id), None)) is not None:
+                        future.set_result(obj)
+                if not wanted:
+                    return
+        except Exception as e:
+            for future in wanted.values():
+                _fail(future, e)
+            return
+        for future in wanted.values():
+            future.set_result(None)
+
+
+def _fail(future: asyncio.Future[Any], e: Exception) -> None:
+    future.set_exception(e)
+    # retrieved here, as every lookup waiting on it may have been cancelled
+    future.exception()
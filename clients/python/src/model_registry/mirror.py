@@ -0,0 +1,432 @@
+"""In-memory read replica of a model registry."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from .core import ModelRegistryAPIClient
+from .snapshot import Snapshot, SnapshotRecord, encode, write_snapshot
+from .types import ListOptions, ModelArtifact, ModelVersion, Pager, RegisteredModel
+from .types.base import BaseResourceModel
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+ResourceT = TypeVar("ResourceT", bound=BaseResourceModel)
+
+
+@dataclass
+class MirrorStats:
+    """Sync metrics of a {py:class}`RegistryMirror`.
+
+    Attributes:
+        syncs: Number of successful syncs, including the initial load.
+        errors: Number of failed syncs.
+        last_sync: Wall clock time at which the last successful sync started, in seconds since epoch.
+        last_sync_duration: Duration of the last successful sync, in seconds.
+        last_changes: Number of objects added or updated by the last successful sync.
+        watermark: Latest update time seen on the server, in milliseconds since epoch.
+        last_error: Error raised by the last failed sync, if any.
+    """
+
+    syncs: int = 0
+    errors: int = 0
+    last_sync: float | None = None
+    last_sync_duration: float = 0.0
+    last_changes: int = 0
+    watermark: int = 0
+    last_error: Exception | None = None
+
+
+def _update_time(obj: BaseResourceModel) -> int:
+    return int(obj.last_update_time_since_epoch or 0)
+
+
+class RegistryMirror:
+    """In-memory replica of the registered models, model versions and model artifacts of a registry.
+
+    `load()` reads everything once, after which `sync()` only fetches what changed, by paging through each kind of
+    object by descending update time until reaching the latest update seen so far.
+    Lookups are answered from dict indexes without going to the server, so they're only as fresh as the last sync;
+    use `staleness` and `stats` to keep an eye on that.
+
+    Objects returned by lookups are shared with the mirror and must not be modified.
+
+    The mirror can be saved to a snapshot file with `save()`, and restored with `load_snapshot()` much faster than
+    loading it from the server. Restored objects are only decoded when first looked up.
+    """
+
+    def __init__(
+        self,
+        api: ModelRegistryAPIClient,
+        *,
+        page_size: int = 100,
+        concurrency: int = 10,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            api: Client to read the registry with.
+
+        Keyword Args:
+            page_size: Number of objects fetched per request.
+            concurrency: Maximum number of requests in flight when fetching artifacts of many versions.
+            clock: Wall clock used for the sync metrics.
+        """
+        if concurrency < 1:
+            msg = f"Concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        self._api = api
+        self._page_size = page_size
+        self._concurrency = concurrency
+        self._clock = clock
+        self.stats = MirrorStats()
+        self._loaded = False
+        # latest update time seen, per kind of object, and the IDs of the objects updated at that time
+        self._watermarks = {"models": 0, "versions": 0, "artifacts": 0}
+        self._at_watermark: dict[str, set[str]] = {
+            kind: set() for kind in self._watermarks
+        }
+        # artifact watermark as of the last time the artifacts of each version were listed
+        self._scanned: dict[str, int] = {}
+
+        self._snapshot: Snapshot | None = None
+        self._reset()
+
+    def _reset(self) -> None:
+        # objects restored from a snapshot are kept as records until looked up
+        self._models: dict[str, RegisteredModel | SnapshotRecord] = {}
+        self._model_names: dict[str, str] = {}
+        self._versions: dict[tuple[str, str], ModelVersion | SnapshotRecord] = {}
+        self._version_keys: dict[str, tuple[str, str]] = {}
+        self._artifacts: dict[
+            tuple[str, str | None], ModelArtifact | SnapshotRecord
+        ] = {}
+        self._artifact_keys: dict[str, tuple[str, str | None]] = {}
+
+    @property
+    def staleness(self) -> float | None:
+        """Seconds since the start of the last successful sync, or None if the mirror was never loaded."""
+        if self.stats.last_sync is None:
+            return None
+        return self._clock() - self.stats.last_sync
+
+    def get_registered_model(self, name: str) -> RegisteredModel | None:
+        """Get a registered model by name."""
+        return self._resolve(self._models, name, RegisteredModel)
+
+    def get_model_version(self, name: str, version: str) -> ModelVersion | None:
+        """Get a model version by the name of its model and its own name."""
+        if (rm := self.get_registered_model(name)) is None or rm.id is None:
+            return None
+        return self._resolve(self._versions, (rm.id, version), ModelVersion)
+
+    def get_model_artifact(self, name: str, version: str) -> ModelArtifact | None:
+        """Get the model artifact registered with a model version.
+
+        As with {py:meth}`model_registry.ModelRegistry.get_model_artifact`, the artifact is the one named after the
+        model.
+        """
+        if (mv := self.get_model_version(name, version)) is None or mv.id is None:
+            return None
+        return self._resolve(self._artifacts, (mv.id, name), ModelArtifact)
+
+    def get_model_versions(self, name: str) -> list[ModelVersion]:
+        """Get all versions of a registered model."""
+        if (rm := self.get_registered_model(name)) is None:
+            return []
+        keys = [key for key in self._versions if key[0] == rm.id]
+        return [
+            mv
+            for key in keys
+            if (mv := self._resolve(self._versions, key, ModelVersion))
+        ]
+
+    @staticmethod
+    def _resolve(index: dict[K, Any], key: K, cls: type[ResourceT]) -> ResourceT | None:
+        value = index.get(key)
+        if isinstance(value, SnapshotRecord):
+            value = index[key] = value.materialize(cls)
+        return value
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """Save every object of the mirror to a snapshot file.
+
+        Args:
+            path: Path of the snapshot file, replaced atomically if it exists.
+        """
+        write_snapshot(
+            path,
+            {
+                "models": [encode(rm) for rm in self._models.values()],
+                "versions": [
+                    encode(mv, registered_model_id=rm_id)
+                    for (rm_id, _), mv in self._versions.items()
+                ],
+                "artifacts": [
+                    encode(ma, model_version_id=mv_id)
+                    for (mv_id, _), ma in self._artifacts.items()
+                ],
+            },
+            self._watermarks,
+        )
+
+    def load_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Replace the contents of the mirror with a snapshot file.
+
+        The file is memory-mapped and only the keys of each object are read, the objects themselves are decoded on
+        lookup. Call `sync()` afterwards to catch up with changes made since the snapshot was saved.
+
+        Args:
+            path: Path of the snapshot file.
+
+        Returns:
+            Number of objects restored.
+        """
+        snapshot = Snapshot(path)
+        self._reset()
+        if self._snapshot is not None:
+            self._snapshot.close()
+        self._snapshot = snapshot
+
+        ids = snapshot.column("models", "id")
+        names = snapshot.column("models", "name")
+        self._models = dict(zip(names, snapshot.records("models")))
+        self._model_names = dict(zip(ids, names))
+
+        ids = snapshot.column("versions", "id")
+        keys = list(
+            zip(
+                snapshot.column("versions", "registered_model_id"),
+                snapshot.column("versions", "name"),
+            )
+        )
+        self._versions = dict(zip(keys, snapshot.records("versions")))
+        self._version_keys = dict(zip(ids, keys))
+
+        ids = snapshot.column("artifacts", "id")
+        keys = list(
+            zip(
+                snapshot.column("artifacts", "model_version_id"),
+                snapshot.column("artifacts", "name"),
+            )
+        )
+        self._artifacts = dict(zip(keys, snapshot.records("artifacts")))
+        self._artifact_keys = dict(zip(ids, keys))
+        self._watermarks.update(snapshot.watermarks)
+        # update times aren't part of the snapshot, objects at the watermark are fetched once more on the next sync
+        self._at_watermark = {kind: set() for kind in self._watermarks}
+        self._scanned = dict.fromkeys(self._version_keys, self._watermarks["artifacts"])
+        self._loaded = True
+        return len(snapshot)
+
+    async def load(self) -> int:
+        """Read every registered model, model version and model artifact from the registry.
+
+        Returns:
+            Number of objects loaded.
+        """
+        started, start = self._clock(), time.perf_counter()
+        count = 0
+        try:
+            async for rm in self._items(self._registered_models):
+                self._put_model(rm)
+                count += 1
+            async for item in self._items(self._model_versions):
+                self._put_version(item)
+                count += 1
+            count += await self._load_artifacts(list(self._version_keys))
+        except Exception as e:
+            self._failed(e)
+            raise
+        self._loaded = True
+        self._synced(started, start, count)
+        return count
+
+    async def sync(self) -> int:
+        """Fetch objects added or updated since the last sync, loading everything on the first call.
+
+        Returns:
+            Number of objects added or updated.
+        """
+        if not self._loaded:
+            return await self.load()
+
+        started, start = self._clock(), time.perf_counter()
+        count = 0
+        try:
+            async for rm in self._changed(self._registered_models, "models"):
+                self._put_model(rm)
+                count += 1
+
+            new_versions = set()
+            async for item in self._changed(self._model_versions, "versions"):
+                if item["id"] not in self._version_keys:
+                    new_versions.add(item["id"])
+                self._put_version(item)
+                count += 1
+
+            count += await self._sync_artifacts(new_versions)
+        except Exception as e:
+            self._failed(e)
+            raise
+        self._synced(started, start, count)
+        return count
+
+    async def run(self, interval: float = 5.0) -> None:
+        """Keep the mirror in sync until cancelled.
+
+        Failed syncs are recorded in `stats` and retried on the next interval.
+
+        Args:
+            interval: Seconds between syncs.
+        """
+        while True:
+            # failures are recorded in stats
+            with contextlib.suppress(Exception):
+                await self.sync()
+            await asyncio.sleep(interval)
+
+    async def _sync_artifacts(self, new_versions: set[str]) -> int:
+        """Fetch model artifacts updated since the last sync, as well as those of new versions."""
+        count = 0
+        unknown: list[ModelArtifact] = []
+        async for ma in self._changed(self._model_artifacts, "artifacts"):
+            if ma.id in self._artifact_keys:
+                mv_id, _ = self._artifact_keys[ma.id]
+                self._put_artifact(mv_id, ma)
+                count += 1
+            else:
+                unknown.append(ma)
+                # artifacts of no version at all are only looked for once
+                self._watermark("artifacts", ma)
+        count += await self._load_artifacts(list(new_versions))
+
+        # artifacts don't know their version, look for the remaining ones on the versions without any that were
+        # listed before they were updated
+        if updated := max(
+            (_update_time(ma) for ma in unknown if ma.id not in self._artifact_keys),
+            default=0,
+        ):
+            with_artifacts = {mv_id for mv_id, _ in self._artifacts}
+            count += await self._load_artifacts(
+                [
+                    mv_id
+                    for mv_id in self._version_keys
+                    if mv_id not in with_artifacts
+                    and self._scanned.get(mv_id, 0) <= updated
+                ]
+            )
+        return count
+
+    def _synced(self, started: float, start: float, count: int) -> None:
+        self.stats.syncs += 1
+        self.stats.last_sync = started
+        self.stats.last_sync_duration = time.perf_counter() - start
+        self.stats.last_changes = count
+        self.stats.watermark = max(self._watermarks.values())
+
+    def _failed(self, error: Exception) -> None:
+        self.stats.errors += 1
+        self.stats.last_error = error
+
+    def _put_model(self, rm: RegisteredModel) -> None:
+        assert rm.id is not None
+        if (old := self._model_names.get(rm.id)) is not None and old != rm.name:
+            del self._models[old]
+        self._models[rm.name] = rm
+        self._model_names[rm.id] = rm.name
+        self._watermark("models", rm)
+
+    def _put_version(self, item: dict[str, Any]) -> None:
+        mv = ModelVersion.from_payload(item)
+        assert mv.id is not None
+        key = (item["registeredModelId"], mv.name)
+        if (old := self._version_keys.get(mv.id)) is not None and old != key:
+            del self._versions[old]
+        self._versions[key] = mv
+        self._version_keys[mv.id] = key
+        self._watermark("versions", mv)
+
+    def _put_artifact(self, mv_id: str, ma: ModelArtifact) -> None:
+        assert ma.id is not None
+        key = (mv_id, ma.name)
+        if (old := self._artifact_keys.get(ma.id)) is not None and old != key:
+            del self._artifacts[old]
+        self._artifacts[key] = ma
+        self._artifact_keys[ma.id] = key
+        self._watermark("artifacts", ma)
+
+    def _watermark(self, kind: str, obj: BaseResourceModel) -> None:
+        assert obj.id is not None
+        updated = _update_time(obj)
+        if updated > self._watermarks[kind]:
+            self._watermarks[kind] = updated
+            self._at_watermark[kind] = set()
+        if updated == self._watermarks[kind]:
+            self._at_watermark[kind].add(obj.id)
+
+    async def _load_artifacts(self, version_ids: list[str]) -> int:
+        """Fetch the model artifacts of each version, returning how many there were."""
+        limit = asyncio.Semaphore(self._concurrency)
+
+        async def load(mv_id: str) -> int:
+            async def page_fn(options: ListOptions) -> list[ModelArtifact]:
+                async with limit:
+                    return await self._api.get_model_artifacts(mv_id, options)
+
+            count = 0
+            async for ma in self._items(page_fn):
+                self._put_artifact(mv_id, ma)
+                count += 1
+            self._scanned[mv_id] = self._watermarks["artifacts"]
+            return count
+
+        return sum(await asyncio.gather(*(load(mv_id) for mv_id in version_ids)))
+
+    async def _registered_models(self, options: ListOptions) -> list[RegisteredModel]:
+        return await self._api.get_registered_models(options)
+
+    async def _model_versions(self, options: ListOptions) -> list[dict[str, Any]]:
+        # decoded by hand, as the registered model ID is only part of the payload
+        return await self._api.get_model_versions_raw(options=options)
+
+    async def _model_artifacts(self, options: ListOptions) -> list[ModelArtifact]:
+        return await self._api.get_model_artifacts(options=options)
+
+    async def _items(
+        self, page_fn: Callable[[ListOptions], Awaitable[list[T]]]
+    ) -> AsyncIterator[T]:
+        async for page in Pager[Any](page_fn).page_size(self._page_size).apages():
+            for item in page:
+                yield item
+
+    async def _changed(
+        self, page_fn: Callable[[ListOptions], Awaitable[list[T]]], kind: str
+    ) -> AsyncIterator[T]:
+        """Iterate over objects updated since the watermark of their kind, most recent first."""
+        watermark, seen = self._watermarks[kind], self._at_watermark[kind]
+        pager = (
+            Pager[Any](page_fn)
+            .order_by_update_time()
+            .descending()
+            .page_size(self._page_size)
+        )
+        async for page in pager.apages():
+            for item in page:
+                if isinstance(item, dict):
+                    obj_id = item["id"]
+                    updated = int(item.get("lastUpdateTimeSinceEpoch") or 0)
+                else:
+                    obj_id, updated = item.id, _update_time(item)
+                if updated < watermark:
+                    return
+                # objects updated in the same millisecond as the watermark may not have been seen yet
+                if updated > watermark or obj_id not in seen:
+                    yield item
@@ -0,0 +1,232 @@
+"""Buffered recording of serve model executions."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import aiohttp
+
+from mr_openapi.exceptions import ApiException
+from mr_openapi.retry import CircuitOpenError
+
+from .core import ModelRegistryAPIClient
+from .types import ServeModel
+
+# (inference service ID, model version ID)
+Key = tuple[str, str]
+
+
+@dataclass
+class RecorderStats:
+    """Metrics of a {py:class}`ServeRecorder`.
+
+    Attributes:
+        recorded: Number of serve models recorded on the server.
+        coalesced: Number of events replaced by a later one for the same service and version before being sent.
+        retries: Number of failed requests that were retried.
+        failed: Number of events dropped after running out of retries, or on a non-retryable error.
+        last_latency: Seconds between queueing and recording the last recorded event.
+        max_latency: Longest time between queueing and recording an event, in seconds.
+        last_error: Error that dropped the last failed event, if any.
+    """
+
+    recorded: int = 0
+    coalesced: int = 0
+    retries: int = 0
+    failed: int = 0
+    last_latency: float = 0.0
+    max_latency: float = 0.0
+    last_error: Exception | None = None
+
+
+@dataclass
+class _Pending:
+    serve_model: ServeModel
+    queued: float
+
+
+def _is_retryable(e: Exception) -> bool:
+    """Whether a failed request can't have created the serve model, so it's safe to send again."""
+    if isinstance(e, CircuitOpenError):
+        return True
+    if isinstance(e, ApiException):
+        return e.status in (429, 503)
+    return isinstance(e, aiohttp.ClientConnectorError)
+
+
+class ServeRecorder:
+    """Records serve models in the background.
+
+    Events are queued by `record()` and sent by up to `concurrency` workers, so recording a rollout doesn't wait for
+    the server.
+    Events for the same inference service and model version that are still queued are coalesced, only the latest state
+    is sent, and events for the same pair are always sent in order.
+    Once `max_queue` pairs are waiting, `record()` blocks until the workers catch up.
+
+    Creating a serve model isn't idempotent, so like other such requests, failed ones are only retried when the server
+    can't have processed them: when the connection couldn't be established, or on 429 and 503 responses. Retries wait
+    with exponential backoff. Events that still fail are dropped and counted in `stats`.
+
+    Use the recorder as an async context manager, or call `close()`, to send everything left before shutting down.
+    """
+
+    def __init__(
+        self,
+        api: ModelRegistryAPIClient,
+        *,
+        max_queue: int = 1000,
+        concurrency: int = 8,
+        retries: int = 3,
+        retry_delay: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            api: Client to record the serve models with.
+
+        Keyword Args:
+            max_queue: Maximum number of queued events, after coalescing.
+            concurrency: Maximum number of requests in flight.
+            retries: Number of times a failed request is retried.
+            retry_delay: Delay before the first retry, in seconds. Each retry waits twice as long as the previous one.
+            clock: Monotonic clock used for latencies.
+        """
+        if max_queue < 1:
+            msg = f"Queue size must be at least 1, got {max_queue}"
+            raise ValueError(msg)
+        if concurrency < 1:
+            msg = f"Concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        self._api = api
+        self._max_queue = max_queue
+        self._concurrency = concurrency
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._clock = clock
+        self.stats = RecorderStats()
+
+        self._pending: OrderedDict[Key, _Pending] = OrderedDict()
+        # keys being sent, which can't be picked up by another worker until done
+        self._sending: set[Key] = set()
+        self._closed = False
+        # created on first use, to bind to the running loop
+        self._changed: asyncio.Condition | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of queued events, not counting the ones being sent."""
+        return len(self._pending)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of events being sent."""
+        return len(self._sending)
+
+    async def __aenter__(self) -> ServeRecorder:
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    def _condition(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+            self._workers = [
+                asyncio.create_task(self._work()) for _ in range(self._concurrency)
+            ]
+        return self._changed
+
+    async def record(self, inference_service_id: str, serve_model: ServeModel) -> None:
+        """Queue a serve model to be recorded.
+
+        Waits for room in the queue if it's full, unless an event for the same inference service and model version is
+        already queued, in which case it's replaced.
+
+        Args:
+            inference_service_id: ID of the inference service deploying the model version.
+            serve_model: Serve model.
+
+        Raises:
+            RuntimeError: If the recorder is closed.
+        """
+        key = (inference_service_id, serve_model.model_version_id)
+        changed = self._condition()
+        async with changed:
+            while True:
+                if self._closed:
+                    msg = "Recorder is closed"
+                    raise RuntimeError(msg)
+                if (pending := self._pending.get(key)) is not None:
+                    pending.serve_model = serve_model
+                    self.stats.coalesced += 1
+                    return
+                if len(self._pending) < self._max_queue:
+                    break
+                await changed.wait()
+            self._pending[key] = _Pending(serve_model, self._clock())
+            changed.notify_all()
+
+    async def flush(self) -> None:
+        """Wait until every queued event is recorded, or dropped."""
+        changed = self._condition()
+        async with changed:
+            await changed.wait_for(lambda: not self._pending and not self._sending)
+
+    async def close(self) -> None:
+        """Flush queued events and stop the workers."""
+        if self._changed is None:
+            self._closed = True
+            return
+        await self.flush()
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        await asyncio.gather(*self._workers)
+
+    def _next(self) -> Key | None:
+        return next((key for key in self._pending if key not in self._sending), None)
+
+    async def _work(self) -> None:
+        changed = self._condition()
+        while True:
+            async with changed:
+                await changed.wait_for(lambda: self._closed or self._next() is not None)
+                if (key := self._next()) is None:
+                    return
+                pending = self._pending.pop(key)
+                self._sending.add(key)
+                # there's room in the queue
+                changed.notify_all()
+            try:
+                await self._send(key, pending)
+            finally:
+                async with changed:
+                    self._sending.discard(key)
+                    changed.notify_all()
+
+    async def _send(self, key: Key, pending: _Pending) -> None:
+        inference_service_id, _ = key
+        for attempt in range(self._retries + 1):
+            try:
+                await self._api.create_serve_model(
+                    pending.serve_model, inference_service_id
+                )
+            except Exception as e:
+                if attempt == self._retries or not _is_retryable(e):
+                    self.stats.failed += 1
+                    self.stats.last_error = e
+                    return
+                self.stats.retries += 1
+                await asyncio.sleep(self._retry_delay * 2**attempt)
+            else:
+                latency = self._clock() - pending.queued
+                self.stats.recorded += 1
+                self.stats.last_latency = latency
+                self.stats.max_latency = max(self.stats.max_latency, latency)
+                return
@@ -0,0 +1,181 @@
+"""Resolution of model paths to registry objects."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Union
+
+from .core import ModelRegistryAPIClient
+from .types import ModelArtifact, ModelVersion, RegisteredModel
+from .types.base import BaseResourceModel
+
+Resolved = Union[RegisteredModel, ModelVersion, ModelArtifact]
+
+# model name, and version name for versions
+_Segments = tuple[str, ...]
+
+
+class PathResolver:
+    """Resolves paths like `model/1.2.0` to registry objects.
+
+    A path is a model name, optionally followed by a version name and then an artifact name, separated by `/`:
+    `model` resolves to the registered model, `model/1.2.0` to its version, and `model/1.2.0/weights` to the model
+    artifact named `weights` of that version.
+
+    The IDs of the models and versions resolved along the way are kept for `ttl` seconds, so resolving a path whose
+    parents are known takes a single request.
+    Concurrent resolutions of paths sharing a parent share the request for it as well.
+
+    When external IDs are derived from names (e.g. `model:1.2.0` for versions), `version_external_id` and
+    `artifact_external_id` let versions and artifacts be looked up straight away, without resolving their parents.
+    """
+
+    def __init__(
+        self,
+        api: ModelRegistryAPIClient,
+        *,
+        ttl: float = 300.0,
+        max_size: int = 4096,
+        version_external_id: Callable[[str, str], str | None] | None = None,
+        artifact_external_id: Callable[[str, str, str], str | None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Constructor.
+
+        Args:
+            api: Client to look up the objects with.
+
+        Keyword Args:
+            ttl: Seconds the ID of a model or version is kept after resolving it.
+            max_size: Maximum number of IDs kept, the least recently used ones are forgotten first.
+            version_external_id: External ID of a version, from the model and version names, or None if it has none.
+            artifact_external_id: External ID of an artifact, from the model, version and artifact names, or None if
+                it has none.
+            clock: Monotonic clock used for expiry.
+        """
+        if ttl <= 0:
+            msg = f"TTL must be positive, got {ttl}"
+            raise ValueError(msg)
+        if max_size < 1:
+            msg = f"Size must be at least 1, got {max_size}"
+            raise ValueError(msg)
+        self._api = api
+        self._ttl = ttl
+        self._max_size = max_size
+        self._version_external_id = version_external_id
+        self._artifact_external_id = artifact_external_id
+        self._clock = clock
+        # ID and expiry time, by path segments
+        self._ids: OrderedDict[_Segments, tuple[str, float]] = OrderedDict()
+
+    def clear(self) -> None:
+        """Forget every ID resolved so far."""
+        self._ids.clear()
+
+    async def resolve(self, path: str) -> Resolved | None:
+        """Resolve a path.
+
+        Args:
+            path: `model`, `model/version` or `model/version/artifact`.
+
+        Returns:
+            The registered model, model version or model artifact, or None if any part of the path doesn't exist.
+
+        Raises:
+            ValueError: If the path is malformed.
+        """
+        segments = path.split("/")
+        if len(segments) > 3 or not all(segments):
+            msg = f"Expected a path like model/version/artifact, got {path!r}"
+            raise ValueError(msg)
+        if len(segments) == 1:
+            return await self.registered_model(path)
+        if len(segments) == 2:
+            return await self.model_version(*segments)
+        return await self.model_artifact(*segments)
+
+    async def resolve_many(self, paths: Iterable[str]) -> list[Resolved | None]:
+        """Resolve paths concurrently.
+
+        Args:
+            paths: Paths, see `resolve`.
+
+        Returns:
+            The objects, in the same order, with None for paths that don't exist.
+        """
+        return list(await asyncio.gather(*(self.resolve(path) for path in paths)))
+
+    async def registered_model(self, name: str) -> RegisteredModel | None:
+        """Resolve a registered model.
+
+        Args:
+            name: Name of the model.
+        """
+        rm = await self._api.get_registered_model_by_params(name)
+        self._put((name,), rm)
+        return rm
+
+    async def model_version(self, name: str, version: str) -> ModelVersion | None:
+        """Resolve a model version.
+
+        Args:
+            name: Name of the model.
+            version: Name of the version.
+        """
+        if self._version_external_id and (
+            external_id := self._version_external_id(name, version)
+        ):
+            mv = await self._api.get_model_version_by_params(external_id=external_id)
+        elif (rm_id := await self._id((name,), self.registered_model, name)) is None:
+            return None
+        else:
+            mv = await self._api.get_model_version_by_params(rm_id, version)
+        self._put((name, version), mv)
+        return mv
+
+    async def model_artifact(
+        self, name: str, version: str, artifact: str | None = None
+    ) -> ModelArtifact | None:
+        """Resolve a model artifact.
+
+        Args:
+            name: Name of the model.
+            version: Name of the version.
+            artifact: Name of the artifact. Defaults to the name of the model, as for artifacts registered with it.
+        """
+        artifact = artifact or name
+        if self._artifact_external_id and (
+            external_id := self._artifact_external_id(name, version, artifact)
+        ):
+            return await self._api.get_model_artifact_by_params(external_id=external_id)
+        mv_id = await self._id((name, version), self.model_version, name, version)
+        if mv_id is None:
+            return None
+        return await self._api.get_model_artifact_by_params(artifact, mv_id)
+
+    async def _id(
+        self,
+        segments: _Segments,
+        resolve: Callable[..., Awaitable[BaseResourceModel | None]],
+        *args: str,
+    ) -> str | None:
+        """Get the ID of a model or version, resolving it if it's not known."""
+        if (entry := self._ids.get(segments)) is not None:
+            id, expires = entry
+            if expires > self._clock():
+                self._ids.move_to_end(segments)
+                return id
+            del self._ids[segments]
+        obj = await resolve(*args)
+        return str(obj.id) if obj is not None else None
+
+    def _put(self, segments: _Segments, obj: BaseResourceModel | None) -> None:
+        if obj is None or obj.id is None:
+            return
+        self._ids[segments] = (str(obj.id), self._clock() + self._ttl)
+        self._ids.move_to_end(segments)
+        while len(self._ids) > self._max_size:
+            self._ids.popitem(last=False)
@@ -0,0 +1,309 @@
+"""Compact, memory-mapped snapshots of registry objects.
+
+A snapshot file is laid out as follows, with every integer stored little-endian:
+
+- a header: magic, number of strings, number of columns and rows for each table, and the watermark of each table;
+- the string table: `n + 1` 64-bit offsets followed by the UTF-8 data of every (interned) string;
+- one table per kind of object: the string ID of each column name, followed by fixed-width rows of 32-bit string IDs.
+
+Each value is stored as the ID of its JSON encoding, so identical values (states, owners, custom properties...) are
+only stored once, and any row can be located and decoded on its own.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Any, BinaryIO, TypeVar
+
+from .types.base import BaseResourceModel
+
+T = TypeVar("T", bound=BaseResourceModel)
+
+MAGIC = b"MRSNAP01"
+TABLES = ("models", "versions", "artifacts")
+# ID of missing values
+NONE = 0xFFFFFFFF
+
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+_HEADER = struct.Struct(f"<8sI{'II' * len(TABLES)}{'Q' * len(TABLES)}")
+
+
+def _ids(values: Iterable[int]) -> bytes:
+    ids = array("I", values)
+    if sys.byteorder != "little":
+        ids.byteswap()
+    return ids.tobytes()
+
+
+class SnapshotRecord:
+    """A row of a snapshot, decoded on demand."""
+
+    __slots__ = ("_snapshot", "_table", "_row")
+
+    def __init__(self, snapshot: Snapshot, table: int, row: int) -> None:
+        """Constructor.
+
+        Args:
+            snapshot: Snapshot the row belongs to.
+            table: Index of the table of the row.
+            row: Index of the row in its table.
+        """
+        self._snapshot = snapshot
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, column: str) -> Any:
+        """Decode a single column."""
+        return self._snapshot._value(self._table, self._row, column)
+
+    def values(self) -> dict[str, Any]:
+        """Decode every column."""
+        return self._snapshot._values(self._table, self._row)
+
+    def raw(self) -> dict[str, str | None]:
+        """JSON encoding of every column, as stored."""
+        return self._snapshot._raw(self._table, self._row)
+
+    def materialize(self, cls: type[T]) -> T:
+        """Build the registry object stored in this row."""
+        values = self.values()
+        return cls.model_validate(
+            {k: v for k, v in values.items() if k in cls.model_fields}
+        )
+
+
+class Snapshot:
+    """Read-only view of a snapshot file.
+
+    The file is memory-mapped, so opening it only reads the header: strings and rows are decoded as they're accessed.
+    Records returned by `records()` keep reading from the file, so it must stay open as long as they're in use.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Open a snapshot.
+
+        Args:
+            path: Path of the snapshot file.
+        """
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # views into the map, released on close
+        self._views: list[memoryview] = []
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self) -> None:
+        self._check(_HEADER.size)
+        magic, n_strings, *rest = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            msg = f"Not a registry snapshot: {magic!r}"
+            raise ValueError(msg)
+        shapes = [tuple(rest[i : i + 2]) for i in range(0, 2 * len(TABLES), 2)]
+        self.watermarks: dict[str, int] = dict(zip(TABLES, rest[2 * len(TABLES) :]))
+
+        pos = _HEADER.size
+        self._offsets = self._view(pos, n_strings + 1, "Q")
+        pos += 8 * (n_strings + 1)
+        self._data = pos
+        pos += self._offsets[-1]
+
+        self._columns: list[dict[str, int]] = []
+        self._rows: list[tuple[int, memoryview]] = []
+        for n_columns, n_rows in shapes:
+            self._check(pos + 4 * n_columns)
+            names = struct.unpack_from(f"<{n_columns}I", self._mmap, pos)
+            pos += 4 * n_columns
+            self._columns.append({self._string(i): c for c, i in enumerate(names)})
+            self._rows.append((n_columns, self._view(pos, n_columns * n_rows, "I")))
+            pos += 4 * n_columns * n_rows
+
+    def _check(self, end: int) -> None:
+        if end > len(self._mmap):
+            msg = "Snapshot is truncated"
+            raise ValueError(msg)
+
+    def _view(self, pos: int, n: int, fmt: str) -> Any:
+        size = struct.calcsize(fmt)
+        self._check(pos + n * size)
+        if sys.byteorder == "little":
+            with memoryview(self._mmap) as buffer:
+                view = buffer[pos : pos + n * size].cast(fmt)
+            self._views.append(view)
+            return view
+        values = array(fmt, self._mmap[pos : pos + n * size])
+        values.byteswap()
+        return values
+
+    def __enter__(self) -> Snapshot:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        for view in self._views:
+            view.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return sum(self.rows(table) for table in TABLES)
+
+    def rows(self, table: str) -> int:
+        """Number of rows of a table."""
+        n_columns, ids = self._rows[TABLES.index(table)]
+        return len(ids) // n_columns if n_columns else 0
+
+    def records(self, table: str) -> list[SnapshotRecord]:
+        """Every row of a table, lazily decoded."""
+        t = TABLES.index(table)
+        return [SnapshotRecord(self, t, row) for row in range(self.rows(table))]
+
+    def column(self, table: str, column: str) -> list[Any]:
+        """Decode a whole column of a table at once.
+
+        Each distinct value is only decoded once, which makes this much faster than going through the records.
+        """
+        t = TABLES.index(table)
+        n_columns, ids = self._rows[t]
+        if (c := self._columns[t].get(column)) is None:
+            return [None] * self.rows(table)
+        decoded: dict[int, Any] = {NONE: None}
+        values = []
+        for i in ids[c::n_columns]:
+            if i not in decoded:
+                decoded[i] = self._decode(i)
+            values.append(decoded[i])
+        return values
+
+    def _decode(self, i: int) -> Any:
+        s = self._string(i)
+        # most values are plain strings, which don't need a full JSON parse
+        if s[0] == '"' and "\\" not in s:
+            return s[1:-1]
+        return json.loads(s)
+
+    def _string(self, i: int) -> str:
+        start, end = self._offsets[i], self._offsets[i + 1]
+        return self._mmap[self._data + start : self._data + end].decode()
+
+    def _id(self, table: int, row: int, column: str) -> int:
+        c = self._columns[table].get(column)
+        if c is None:
+            return NONE
+        n_columns, ids = self._rows[table]
+        return ids[row * n_columns + c]
+
+    def _value(self, table: int, row: int, column: str) -> Any:
+        i = self._id(table, row, column)
+        return None if i == NONE else self._decode(i)
+
+    def _values(self, table: int, row: int) -> dict[str, Any]:
+        return {
+            column: self._value(table, row, column) for column in self._columns[table]
+        }
+
+    def _raw(self, table: int, row: int) -> dict[str, str | None]:
+        return {
+            column: None
+            if (i := self._id(table, row, column)) == NONE
+            else self._string(i)
+            for column in self._columns[table]
+        }
+
+
+def encode(
+    value: BaseResourceModel | SnapshotRecord, **extra: Any
+) -> dict[str, str | None]:
+    """Encode an object as a snapshot row, keyed by column.
+
+    Args:
+        value: Object to encode, or a row of another snapshot.
+        **extra: Additional columns, e.g. the ID of the parent of the object.
+    """
+    if isinstance(value, SnapshotRecord):
+        row = value.raw()
+    else:
+        row = {
+            k: None if v is None else _encode(v)
+            for k, v in value.model_dump(mode="json").items()
+        }
+    row.update({k: None if v is None else _encode(v) for k, v in extra.items()})
+    return row
+
+
+def write_snapshot(
+    path: str | os.PathLike[str],
+    tables: Mapping[str, Iterable[Mapping[str, str | None]]],
+    watermarks: Mapping[str, int],
+) -> None:
+    """Write a snapshot file.
+
+    The file is written next to its destination and moved in place, so readers never see a partial snapshot.
+
+    Args:
+        path: Path of the snapshot file.
+        tables: Encoded rows of each table, see `encode`.
+        watermarks: Watermark of each table.
+    """
+    # interned strings, by ID
+    strings: dict[str | None, int] = {None: NONE}
+    encoded = []
+    for table in TABLES:
+        rows = list(tables.get(table, ()))
+        columns = list(dict.fromkeys(c for row in rows for c in row))
+        names = [strings.setdefault(c, len(strings) - 1) for c in columns]
+        cells = array("I", bytes(4 * len(columns) * len(rows)))
+        for c, column in enumerate(columns):
+            cells[c :: len(columns)] = array(
+                "I",
+                [strings.setdefault(row.get(column), len(strings) - 1) for row in rows],
+            )
+        if sys.byteorder != "little":
+            cells.byteswap()
+        encoded.append((len(columns), len(rows), _ids(names), cells.tobytes()))
+
+    del strings[None]
+    data = [s.encode() for s in strings]  # type: ignore[union-attr]
+    offsets = array("Q", [0])
+    for s in data:
+        offsets.append(offsets[-1] + len(s))
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    tmp = f"{os.fspath(path)}.tmp"
+    with open(tmp, "wb") as f:
+        _write(f, encoded, offsets, data, watermarks)
+    os.replace(tmp, path)
+
+
+def _write(
+    f: BinaryIO,
+    encoded: list[tuple[int, int, bytes, bytes]],
+    offsets: array,
+    data: list[bytes],
+    watermarks: Mapping[str, int],
+) -> None:
+    shapes = [n for n_columns, n_rows, _, _ in encoded for n in (n_columns, n_rows)]
+    f.write(
+        _HEADER.pack(
+            MAGIC,
+            len(data),
+            *shapes,
+            *(watermarks.get(table, 0) for table in TABLES),
+        )
+    )
+    f.write(offsets.tobytes())
+    f.writelines(data)
+    for _, _, columns, cells in encoded:
+        f.write(columns)
+        f.write(cells)
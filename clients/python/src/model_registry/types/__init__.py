@@ -13,6 +13,14 @@ from .contexts import (
 )
 from .options import ListOptions
 from .pager import Pager
+from .registration import RegistrationResult, RegistrationSpec
+from .serving import (
+    ExecutionState,
+    InferenceService,
+    InferenceServiceState,
+    ServeModel,
+    ServingEnvironment,
+)
 
 __all__ = [
     # Artifacts
@@ -30,4 +38,13 @@ __all__ = [
     "ListOptions",
     # Pager
     "Pager",
+    # Registration
+    "RegistrationResult",
+    "RegistrationSpec",
+    # Serving
+    "ExecutionState",
+    "InferenceService",
+    "InferenceServiceState",
+    "ServeModel",
+    "ServingEnvironment",
 ]
@@ -13,6 +13,7 @@ Todo:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from typing import Any, TypeVar
 
 from typing_extensions import override
@@ -66,6 +67,20 @@ class Artifact(BaseResourceModel, ABC):
             return DocArtifact.from_basemodel(model)
         return ModelArtifact.from_basemodel(model)
 
+    @staticmethod
+    def from_artifact_payload(data: Mapping[str, Any]) -> DocArtifact | ModelArtifact:
+        """Create an artifact of the matching type from a decoded server response."""
+        if data.get("artifactType") == "doc-artifact":
+            return DocArtifact.from_payload(data)
+        return ModelArtifact.from_payload(data)
+
+    @staticmethod
+    def from_artifact_payloads(
+        items: Iterable[Mapping[str, Any]],
+    ) -> list[DocArtifact | ModelArtifact]:
+        """Create artifacts of the matching types from a page of decoded server responses."""
+        return [Artifact.from_artifact_payload(data) for data in items]
+
     @abstractmethod
     def as_basemodel(self) -> Any:
         """Wrap the object in a BaseModel object."""
@@ -97,7 +112,7 @@ class DocArtifact(Artifact):
     def as_basemodel(self) -> DocArtifactBaseModel:
         return DocArtifactBaseModel(
             customProperties=self._map_custom_properties(),
-            **self._props_as_dict(exclude=("custom_properties")),
+            **self._props_as_dict(exclude=("custom_properties",)),
             artifactType="doc-artifact",
         )
 
@@ -170,7 +185,7 @@ class ModelArtifact(Artifact):
     def as_basemodel(self) -> ModelArtifactBaseModel:
         return ModelArtifactBaseModel(
             customProperties=self._map_custom_properties(),
-            **self._props_as_dict(exclude=("custom_properties")),
+            **self._props_as_dict(exclude=("custom_properties",)),
             artifactType="model-artifact",
         )
 
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from functools import cache
 from typing import Any, Union, get_args
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing_extensions import Self
 
 from mr_openapi.models.metadata_value import MetadataValue
 
@@ -50,6 +52,58 @@ class BaseResourceModel(BaseModel, ABC):
     def from_basemodel(cls, source: Any) -> Any:
         """Create a new object from a BaseModel object."""
 
+    @classmethod
+    def from_payload(cls, data: Mapping[str, Any]) -> Self:
+        """Create a new object from a decoded server response.
+
+        The response is validated once, against this type, instead of going through the generated models first.
+
+        Args:
+            data: JSON object as returned by the server.
+        """
+        return cls.model_validate(cls._payload_values(data))
+
+    @classmethod
+    def from_payloads(cls, items: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """Create new objects from a page of decoded server responses, validating the whole page in one pass.
+
+        Args:
+            items: JSON objects as returned by the server.
+        """
+        return cls._list_adapter().validate_python(
+            [cls._payload_values(data) for data in items]
+        )
+
+    @classmethod
+    @cache
+    def _list_adapter(cls) -> TypeAdapter[list[Self]]:
+        return TypeAdapter(list[cls])  # type: ignore[valid-type]
+
+    @classmethod
+    def _payload_values(cls, data: Mapping[str, Any]) -> dict[str, Any]:
+        values = {
+            name: value
+            for key, name in cls._payload_keys()
+            if (value := data.get(key)) is not None
+        }
+        if custom_properties := data.get("customProperties"):
+            values["custom_properties"] = cls._unmap_custom_property_payloads(
+                custom_properties
+            )
+        return values
+
+    @classmethod
+    @cache
+    def _payload_keys(cls) -> tuple[tuple[str, str], ...]:
+        """Pairs of (JSON key, field name) for the model fields, computed once per class."""
+        keys = []
+        for name in cls.model_fields:
+            if name == "custom_properties":
+                continue
+            head, *tail = name.split("_")
+            keys.append((head + "".join(part.capitalize() for part in tail), name))
+        return tuple(keys)
+
     def _map_custom_properties(
         self,
     ) -> dict[str, MetadataValue] | None:
@@ -107,12 +161,44 @@ class BaseResourceModel(BaseModel, ABC):
             )
         }
 
+    @classmethod
+    def _unmap_custom_property_payloads(
+        cls, custom_properties: Mapping[str, Mapping[str, Any]]
+    ) -> dict[str, SupportedTypes]:
+        def get_meta_value(meta: Mapping[str, Any]) -> SupportedTypes:
+            type_name = meta["metadataType"][8:-5].lower()
+            v = meta.get(f"{type_name}_value")
+            if type_name == "int":
+                return int(v)  # type: ignore[arg-type]
+            return v  # type: ignore[return-value]
+
+        return {
+            name: value
+            for name, meta_value in custom_properties.items()
+            if isinstance(
+                value := get_meta_value(meta_value),
+                get_args(SupportedTypes),
+            )
+        }
+
+    @classmethod
+    @cache
+    def _field_keys(
+        cls, exclude: frozenset[str], alias: bool
+    ) -> tuple[tuple[str, str], ...]:
+        """Pairs of (output key, attribute name) for the model fields, computed once per class and arguments."""
+        return tuple(
+            ((info.alias or name) if alias else name, name)
+            for name, info in cls.model_fields.items()
+            if name not in exclude
+        )
+
     def _props_as_dict(
         self, exclude: Sequence[str] | None = None, alias: bool = False
     ) -> dict[str, Any]:
-        exclude = exclude or []
+        if isinstance(exclude, str):
+            exclude = (exclude,)
         return {
-            k: getattr(self, k)
-            for k in self.model_json_schema(alias).get("properties", {})
-            if k not in exclude
+            k: getattr(self, attr)
+            for k, attr in self._field_keys(frozenset(exclude or ()), alias)
         }
@@ -3,29 +3,154 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import queue
+import threading
+import weakref
 from collections.abc import AsyncIterator, Awaitable, Iterator
-from dataclasses import dataclass, field
-from typing import Callable, Generic, TypeVar, cast
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Generic, TypeVar
 
 from .base import BaseModel
 from .options import ListOptions, OrderByField
 
 T = TypeVar("T", bound=BaseModel)
 
+# marks the end of the pages fetched ahead
+_DONE: Any = object()
+
+
+class _PrefetchThread:
+    """Fetches pages ahead on a daemon thread, for sync page functions.
+
+    At most `depth` pages are fetched before being consumed.
+    Pages are fetched until they loop back to the start, or until the first one has no next page token (just like the
+    pager detects it), then `_DONE` is queued.
+    """
+
+    def __init__(
+        self, page_fn: Callable[[ListOptions], Any], options: ListOptions, depth: int
+    ) -> None:
+        self._queue: queue.SimpleQueue[tuple[Any, str | None, BaseException | None]] = (
+            queue.SimpleQueue()
+        )
+        self._slots = threading.Semaphore(depth)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(page_fn, options),
+            name="pager-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self, page_fn: Callable[[ListOptions], Any], options: ListOptions) -> None:
+        first = True
+        start = None
+        while True:
+            self._slots.acquire()
+            if self._stop.is_set():
+                return
+            try:
+                page = page_fn(options)
+            except Exception as e:
+                self._queue.put((None, None, e))
+                return
+            self._queue.put((page, options.next_page_token, None))
+            if first:
+                first, start = False, options.next_page_token
+                if not start:
+                    self._queue.put((_DONE, None, None))
+                    return
+            elif options.next_page_token == start:
+                self._queue.put((_DONE, None, None))
+                return
+
+    def get(self) -> tuple[Any, str | None]:
+        page, token, error = self._queue.get()
+        self._slots.release()
+        if error is not None:
+            raise error
+        return page, token
+
+    def close(self) -> None:
+        self._stop.set()
+        self._slots.release()
+
+
+class _PrefetchTask:
+    """Fetches pages ahead on a task, for async page functions.
+
+    See `_PrefetchThread`.
+    """
+
+    def __init__(
+        self, page_fn: Callable[[ListOptions], Any], options: ListOptions, depth: int
+    ) -> None:
+        self._queue: asyncio.Queue[tuple[Any, str | None, BaseException | None]] = (
+            asyncio.Queue()
+        )
+        self._slots = asyncio.Semaphore(depth)
+        self._task = asyncio.create_task(self._run(page_fn, options))
+
+    async def _run(
+        self, page_fn: Callable[[ListOptions], Any], options: ListOptions
+    ) -> None:
+        first = True
+        start = None
+        while True:
+            await self._slots.acquire()
+            try:
+                page = await page_fn(options)
+            except Exception as e:
+                self._queue.put_nowait((None, None, e))
+                return
+            self._queue.put_nowait((page, options.next_page_token, None))
+            if first:
+                first, start = False, options.next_page_token
+                if not start:
+                    self._queue.put_nowait((_DONE, None, None))
+                    return
+            elif options.next_page_token == start:
+                self._queue.put_nowait((_DONE, None, None))
+                return
+
+    async def get(self) -> tuple[Any, str | None]:
+        page, token, error = await self._queue.get()
+        self._slots.release()
+        if error is not None:
+            raise error
+        return page, token
+
+    def close(self) -> None:
+        # the loop may be gone already if we're being garbage collected
+        with contextlib.suppress(RuntimeError):
+            self._task.cancel()
+
 
 @dataclass
 class Pager(Generic[T], Iterator[T], AsyncIterator[T]):
     """Pager for iterating over items.
 
     Assumes that page_fn is a paged function that takes ListOptions and returns a list of items.
+    If given, raw_page_fn fetches the same pages as returned by the server: it takes ListOptions and whether to return
+    the undecoded response body, and otherwise returns the list of decoded JSON objects.
     """
 
     page_fn: (
         Callable[[ListOptions], list[T]] | Callable[[ListOptions], Awaitable[list[T]]]
     )
     options: ListOptions = field(default_factory=ListOptions)
+    raw_page_fn: (
+        Callable[[ListOptions, bool], list[dict[str, Any]] | bytes]
+        | Callable[[ListOptions, bool], Awaitable[list[dict[str, Any]] | bytes]]
+        | None
+    ) = None
 
     def __post_init__(self):
+        self._depth = 0
+        self._prefetcher: _PrefetchThread | _PrefetchTask | None = None
+        self._finalizer: weakref.finalize | None = None
         self.restart()
         if asyncio.iscoroutinefunction(self.page_fn):
             self.__next__ = NotImplemented
@@ -47,8 +172,36 @@ class Pager(Generic[T], Iterator[T], AsyncIterator[T]):
         # tracks the next item on the current page
         self._i = 0
         self.options.next_page_token = None
+        if self._finalizer is not None:
+            self._finalizer()
+        self._prefetcher = self._finalizer = None
+        self._prefetch_pending = self._depth > 0
         return self
 
+    def prefetch(self, depth: int = 1) -> Pager[T]:
+        """Fetch up to `depth` pages ahead in the background.
+
+        Each next page is requested as soon as the previous one arrives, so network latency overlaps with consuming
+        items. Pass 0 to fetch pages on demand again.
+
+        This resets the pager.
+        """
+        if depth < 0:
+            msg = f"Prefetch depth can't be negative, got {depth}"
+            raise ValueError(msg)
+        self._depth = depth
+        return self.restart()
+
+    def _start_prefetch(
+        self,
+        prefetcher: type[_PrefetchThread | _PrefetchTask],
+        page_fn: Callable[[ListOptions], Any],
+    ) -> None:
+        self._prefetch_pending = False
+        # the prefetcher pages through its own copy of the options
+        self._prefetcher = prefetcher(page_fn, replace(self.options), self._depth)
+        self._finalizer = weakref.finalize(self, self._prefetcher.close)
+
     def order_by_creation_time(self) -> Pager[T]:
         """Order items by creation time.
 
@@ -100,19 +253,133 @@ class Pager(Generic[T], Iterator[T], AsyncIterator[T]):
         self.options.is_asc = False
         return self.restart()
 
+    def pages(self) -> Iterator[list[T]]:
+        """Iterate over whole pages of items.
+
+        This resets the pager.
+
+        Raises:
+            TypeError: If the page function is async, use `apages` instead.
+        """
+        self._check_sync(self.page_fn, "apages")
+        return self._iter_pages(self.page_fn)
+
+    async def apages(self) -> AsyncIterator[list[T]]:
+        """Iterate over whole pages of items.
+
+        This resets the pager.
+
+        Raises:
+            TypeError: If the page function isn't async, use `pages` instead.
+        """
+        self._check_async(self.page_fn, "pages")
+        async for page in self._aiter_pages(self.page_fn):
+            yield page
+
+    def raw_pages(self, as_bytes: bool = False) -> Iterator[Any]:
+        """Iterate over pages as returned by the server, without converting them to objects.
+
+        This resets the pager.
+
+        Args:
+            as_bytes: Yield each undecoded response body, instead of the list of decoded JSON objects.
+
+        Raises:
+            ValueError: If the pager wasn't given a `raw_page_fn`.
+            TypeError: If `raw_page_fn` is async, use `araw_pages` instead.
+        """
+        raw_page_fn = self._raw_page_fn(as_bytes)
+        self._check_sync(self.raw_page_fn, "araw_pages")
+        return self._iter_pages(raw_page_fn)
+
+    async def araw_pages(self, as_bytes: bool = False) -> AsyncIterator[Any]:
+        """Iterate over pages as returned by the server, without converting them to objects.
+
+        See `raw_pages`.
+        """
+        raw_page_fn = self._raw_page_fn(as_bytes)
+        self._check_async(self.raw_page_fn, "raw_pages")
+        async for page in self._aiter_pages(raw_page_fn):
+            yield page
+
+    @staticmethod
+    def _check_sync(fn: Callable[..., Any] | None, alternative: str) -> None:
+        if asyncio.iscoroutinefunction(fn):
+            msg = f"Can't iterate synchronously over an async page function, use {alternative}() instead"
+            raise TypeError(msg)
+
+    @staticmethod
+    def _check_async(fn: Callable[..., Any] | None, alternative: str) -> None:
+        if not asyncio.iscoroutinefunction(fn):
+            msg = f"Can't iterate asynchronously over a sync page function, use {alternative}() instead"
+            raise TypeError(msg)
+
+    def _raw_page_fn(self, as_bytes: bool) -> Callable[[ListOptions], Any]:
+        if (raw_page_fn := self.raw_page_fn) is None:
+            msg = "This pager can't fetch raw pages, no raw_page_fn was given"
+            raise ValueError(msg)
+        return lambda options: raw_page_fn(options, as_bytes)
+
+    def _iter_pages(self, page_fn: Callable[[ListOptions], Any]) -> Iterator[Any]:
+        self.restart()
+        yield self._fetch_page(page_fn)
+        # the same looping rules as for items apply
+        if not (start := self.options.next_page_token):
+            return
+        while True:
+            page = self._fetch_page(page_fn)
+            if self.options.next_page_token == start:
+                return
+            yield page
+
+    async def _aiter_pages(
+        self, page_fn: Callable[[ListOptions], Any]
+    ) -> AsyncIterator[Any]:
+        self.restart()
+        yield await self._afetch_page(page_fn)
+        if not (start := self.options.next_page_token):
+            return
+        while True:
+            page = await self._afetch_page(page_fn)
+            if self.options.next_page_token == start:
+                return
+            yield page
+
     def _next_page(self) -> list[T]:
         """Get the next page of items.
 
         This will automatically loop over pages.
         """
-        return cast(list[T], self.page_fn(self.options))
+        return self._fetch_page(self.page_fn)
 
     async def _anext_page(self) -> list[T]:
         """Get the next page of items.
 
         This will automatically loop over pages.
         """
-        return await cast(Awaitable[list[T]], self.page_fn(self.options))
+        return await self._afetch_page(self.page_fn)
+
+    def _fetch_page(self, page_fn: Callable[[ListOptions], Any]) -> Any:
+        if self._prefetch_pending:
+            self._start_prefetch(_PrefetchThread, page_fn)
+        if isinstance(self._prefetcher, _PrefetchThread):
+            page, token = self._prefetcher.get()
+            if page is not _DONE:
+                self.options.next_page_token = token
+                return page
+            self._prefetcher = None
+        return page_fn(self.options)
+
+    async def _afetch_page(self, page_fn: Callable[[ListOptions], Any]) -> Any:
+        if self._prefetch_pending:
+            self._start_prefetch(_PrefetchTask, page_fn)
+        if isinstance(self._prefetcher, _PrefetchTask):
+            page, token = await self._prefetcher.get()
+            if page is not _DONE:
+                self.options.next_page_token = token
+                return page
+            self._prefetcher = None
+        return await page_fn(self.options)
 
     def _needs_fetch(self) -> bool:
         return not self._current_page or (
@@ -151,7 +418,7 @@ class Pager(Generic[T], Iterator[T], AsyncIterator[T]):
             self._i = 0
         assert self._current_page
         if self._i >= len(self._current_page):
-            raise StopIteration
+            raise StopAsyncIteration
 
         item = self._current_page[self._i]
         self._i += 1
@@ -163,7 +430,8 @@ class Pager(Generic[T], Iterator[T], AsyncIterator[T]):
         item = self._next_item()
 
         if self._start is None:
-            self._start = self.options.next_page_token
+            # a first page without a next page token is the only one
+            self._start = self.options.next_page_token or None
         elif check_looping and self.options.next_page_token == self._start:
             raise StopIteration
 
@@ -175,7 +443,8 @@ class Pager(Generic[T], Iterator[T], AsyncIterator[T]):
         item = await self._anext_item()
 
         if self._start is None:
-            self._start = self.options.next_page_token
+            # a first page without a next page token is the only one
+            self._start = self.options.next_page_token or None
         elif check_looping and self.options.next_page_token == self._start:
             raise StopAsyncIteration
 
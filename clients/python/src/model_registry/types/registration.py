@@ -0,0 +1,69 @@
+"""Bulk registration requests and results."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from .artifacts import ModelArtifact
+from .base import SupportedTypes
+from .contexts import ModelVersion, RegisteredModel
+
+
+@dataclass
+class RegistrationSpec:
+    """A model to register in bulk.
+
+    Mirrors the arguments of `register_model`.
+
+    Attributes:
+        name: Name of the model.
+        uri: URI of the model.
+        model_format_name: Name of the model format.
+        model_format_version: Version of the model format.
+        version: Version of the model. Has to be unique.
+        storage_key: Storage key.
+        storage_path: Storage path.
+        service_account_name: Service account name.
+        author: Author of the model. Defaults to the client author.
+        owner: Owner of the model. Defaults to the client author.
+        description: Description of the model.
+        metadata: Additional version metadata.
+    """
+
+    name: str
+    uri: str
+    model_format_name: str
+    model_format_version: str
+    version: str
+    storage_key: str | None = None
+    storage_path: str | None = None
+    service_account_name: str | None = None
+    author: str | None = None
+    owner: str | None = None
+    description: str | None = None
+    metadata: Mapping[str, SupportedTypes] | None = None
+
+
+@dataclass
+class RegistrationResult:
+    """Outcome of registering a single spec.
+
+    Attributes:
+        spec: The registered spec.
+        model: Registered model, if it could be found or created.
+        version: Model version, if it was created.
+        artifact: Model artifact, if it was created.
+        error: Error that stopped the registration, if any.
+    """
+
+    spec: RegistrationSpec
+    model: RegisteredModel | None = None
+    version: ModelVersion | None = None
+    artifact: ModelArtifact | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the spec was fully registered."""
+        return self.error is None
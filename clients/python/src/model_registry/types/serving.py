@@ -0,0 +1,195 @@
+"""Serving types for model registry.
+
+Serving environments group the inference services deploying registered models, and serve models record each
+deployment of a model version by an inference service.
+
+Those types are used to map between the serving entities of the API and Python objects.
+"""
+
+from __future__ import annotations
+
+from typing_extensions import override
+
+from mr_openapi import (
+    ExecutionState,
+    InferenceServiceCreate,
+    InferenceServiceState,
+    InferenceServiceUpdate,
+    ServeModelCreate,
+    ServeModelUpdate,
+    ServingEnvironmentCreate,
+    ServingEnvironmentUpdate,
+)
+from mr_openapi import (
+    InferenceService as InferenceServiceBaseModel,
+)
+from mr_openapi import (
+    ServeModel as ServeModelBaseModel,
+)
+from mr_openapi import (
+    ServingEnvironment as ServingEnvironmentBaseModel,
+)
+
+from .base import BaseResourceModel
+
+
+class ServingEnvironment(BaseResourceModel):
+    """Represents a serving environment, e.g. a namespace.
+
+    Attributes:
+        name: Name of the serving environment.
+        description: Description of the object.
+        external_id: Customizable ID. Has to be unique among instances of the same type.
+    """
+
+    name: str
+
+    @override
+    def create(self, **kwargs) -> ServingEnvironmentCreate:
+        return ServingEnvironmentCreate(
+            customProperties=self._map_custom_properties(),
+            **self._props_as_dict(exclude=("id", "custom_properties")),
+            **kwargs,
+        )
+
+    @override
+    def update(self, **kwargs) -> ServingEnvironmentUpdate:
+        return ServingEnvironmentUpdate(
+            customProperties=self._map_custom_properties(),
+            **self._props_as_dict(exclude=("id", "name", "custom_properties")),
+            **kwargs,
+        )
+
+    @classmethod
+    @override
+    def from_basemodel(cls, source: ServingEnvironmentBaseModel) -> ServingEnvironment:
+        assert source.name
+        return cls(
+            id=source.id,
+            name=source.name,
+            description=source.description,
+            external_id=source.external_id,
+            create_time_since_epoch=source.create_time_since_epoch,
+            last_update_time_since_epoch=source.last_update_time_since_epoch,
+            custom_properties=cls._unmap_custom_properties(source.custom_properties)
+            if source.custom_properties
+            else None,
+        )
+
+
+class InferenceService(BaseResourceModel):
+    """Represents an inference service, deploying a registered model in a serving environment.
+
+    Attributes:
+        name: Name of the inference service.
+        serving_environment_id: ID of the serving environment the service is deployed in.
+        registered_model_id: ID of the deployed registered model.
+        model_version_id: ID of the deployed model version. Defaults to the latest version of the model.
+        runtime: Model runtime.
+        desired_state: Whether the service should be deployed.
+        description: Description of the object.
+        external_id: Customizable ID. Has to be unique among instances of the same type.
+    """
+
+    name: str
+    serving_environment_id: str
+    registered_model_id: str
+    model_version_id: str | None = None
+    runtime: str | None = None
+    desired_state: InferenceServiceState = InferenceServiceState.DEPLOYED
+
+    @override
+    def create(self, **kwargs) -> InferenceServiceCreate:
+        return InferenceServiceCreate(
+            customProperties=self._map_custom_properties(),
+            **self._props_as_dict(exclude=("id", "custom_properties")),
+            **kwargs,
+        )
+
+    @override
+    def update(self, **kwargs) -> InferenceServiceUpdate:
+        return InferenceServiceUpdate(
+            customProperties=self._map_custom_properties(),
+            **self._props_as_dict(
+                exclude=(
+                    "id",
+                    "name",
+                    "serving_environment_id",
+                    "registered_model_id",
+                    "custom_properties",
+                )
+            ),
+            **kwargs,
+        )
+
+    @classmethod
+    @override
+    def from_basemodel(cls, source: InferenceServiceBaseModel) -> InferenceService:
+        assert source.name
+        return cls(
+            id=source.id,
+            name=source.name,
+            serving_environment_id=source.serving_environment_id,
+            registered_model_id=source.registered_model_id,
+            model_version_id=source.model_version_id,
+            runtime=source.runtime,
+            desired_state=source.desired_state or InferenceServiceState.DEPLOYED,
+            description=source.description,
+            external_id=source.external_id,
+            create_time_since_epoch=source.create_time_since_epoch,
+            last_update_time_since_epoch=source.last_update_time_since_epoch,
+            custom_properties=cls._unmap_custom_properties(source.custom_properties)
+            if source.custom_properties
+            else None,
+        )
+
+
+class ServeModel(BaseResourceModel):
+    """Represents the deployment of a model version by an inference service.
+
+    Attributes:
+        model_version_id: ID of the served model version.
+        name: Name of the object.
+        last_known_state: Last known state of the deployment.
+        description: Description of the object.
+        external_id: Customizable ID. Has to be unique among instances of the same type.
+    """
+
+    model_version_id: str
+    name: str | None = None
+    last_known_state: ExecutionState | None = None
+
+    @override
+    def create(self, **kwargs) -> ServeModelCreate:
+        return ServeModelCreate(
+            customProperties=self._map_custom_properties(),
+            **self._props_as_dict(exclude=("id", "custom_properties")),
+            **kwargs,
+        )
+
+    @override
+    def update(self, **kwargs) -> ServeModelUpdate:
+        return ServeModelUpdate(
+            customProperties=self._map_custom_properties(),
+            **self._props_as_dict(
+                exclude=("id", "name", "model_version_id", "custom_properties")
+            ),
+            **kwargs,
+        )
+
+    @classmethod
+    @override
+    def from_basemodel(cls, source: ServeModelBaseModel) -> ServeModel:
+        return cls(
+            id=source.id,
+            name=source.name,
+            model_version_id=source.model_version_id,
+            last_known_state=source.last_known_state,
+            description=source.description,
+            external_id=source.external_id,
+            create_time_since_epoch=source.create_time_since_epoch,
+            last_update_time_since_epoch=source.last_update_time_since_epoch,
+            custom_properties=cls._unmap_custom_properties(source.custom_properties)
+            if source.custom_properties
+            else None,
+        )
@@ -0,0 +1,150 @@
+"""Change feeds of registry objects."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Generic, Literal, TypeVar
+
+from .types import ListOptions, Pager
+from .types.base import BaseResourceModel
+
+T = TypeVar("T")
+
+# ID, creation time and update time of an object, in milliseconds since epoch
+Times = Callable[[Any], tuple[str, int, int]]
+
+
+@dataclass
+class WatchEvent(Generic[T]):
+    """A change to a registry object.
+
+    Attributes:
+        type: `created` if the object was created since the previous poll, `updated` otherwise.
+        object: The object, as of the poll that saw the change.
+    """
+
+    type: Literal["created", "updated"]
+    object: T
+
+
+def resource_times(obj: BaseResourceModel) -> tuple[str, int, int]:
+    """ID, creation and update time of a registry object."""
+    return (
+        str(obj.id),
+        int(obj.create_time_since_epoch or 0),
+        int(obj.last_update_time_since_epoch or 0),
+    )
+
+
+def payload_times(obj: dict[str, Any]) -> tuple[str, int, int]:
+    """ID, creation and update time of an object as returned by the server."""
+    return (
+        str(obj["id"]),
+        int(obj.get("createTimeSinceEpoch") or 0),
+        int(obj.get("lastUpdateTimeSinceEpoch") or 0),
+    )
+
+
+def _pager(
+    page_fn: Callable[[ListOptions], Awaitable[list[T]]], page_size: int
+) -> Pager[Any]:
+    return Pager(page_fn).order_by_update_time().descending().page_size(page_size)
+
+
+async def _changes(
+    page_fn: Callable[[ListOptions], Awaitable[list[T]]],
+    times: Times,
+    watermark: int,
+    seen: set[str],
+    page_size: int,
+) -> list[T]:
+    """Objects updated at or after the watermark and not seen yet, latest first."""
+    changes = []
+    async for page in _pager(page_fn, page_size).apages():
+        for item in page:
+            id, _, updated = times(item)
+            if updated < watermark:
+                return changes
+            if updated > watermark or id not in seen:
+                changes.append(item)
+    return changes
+
+
+async def _latest(
+    page_fn: Callable[[ListOptions], Awaitable[list[T]]], times: Times, page_size: int
+) -> tuple[int, set[str]]:
+    """Latest update time, and IDs of the objects updated then."""
+    async for page in _pager(page_fn, page_size).apages():
+        if page:
+            latest = times(page[0])[2]
+            return latest, {
+                id for id, _, updated in map(times, page) if updated == latest
+            }
+        break
+    return 0, set()
+
+
+async def watch(
+    page_fn: Callable[[ListOptions], Awaitable[list[T]]],
+    *,
+    times: Times = resource_times,
+    since: int | None = None,
+    min_interval: float = 1.0,
+    max_interval: float = 30.0,
+    backoff: float = 2.0,
+    page_size: int = 100,
+) -> AsyncIterator[WatchEvent[T]]:
+    """Poll a list operation for changes.
+
+    Each poll pages through objects by descending update time, and stops at the latest update seen by the previous one,
+    so an idle registry costs a single small request per poll.
+    Objects sharing the latest update time are remembered, so each change is only reported once.
+
+    The interval between polls starts at `min_interval`, grows by `backoff` after each poll without changes, up to
+    `max_interval`, and drops back to `min_interval` as soon as something changes.
+
+    Args:
+        page_fn: Async function fetching a page of objects, see {py:class}`model_registry.types.Pager`.
+
+    Keyword Args:
+        times: Function returning the ID, creation and update time of an object.
+        since: Report changes made from this time on, in milliseconds since epoch. Defaults to changes made after the
+            first poll.
+        min_interval: Shortest interval between polls, in seconds.
+        max_interval: Longest interval between polls, in seconds.
+        backoff: Factor by which the interval grows when nothing changes.
+        page_size: Number of objects fetched per request.
+
+    Yields:
+        Changes, oldest first.
+    """
+    if not 0 < min_interval <= max_interval:
+        msg = f"Invalid poll intervals: {min_interval}, {max_interval}"
+        raise ValueError(msg)
+    if backoff < 1:
+        msg = f"Backoff must be at least 1, got {backoff}"
+        raise ValueError(msg)
+
+    seen: set[str] = set()
+    if since is None:
+        since, seen = await _latest(page_fn, times, page_size)
+
+    interval = min_interval
+    while True:
+        await asyncio.sleep(interval)
+        changes = await _changes(page_fn, times, since, seen, page_size)
+        if not changes:
+            interval = min(interval * backoff, max_interval)
+            continue
+        interval = min_interval
+
+        previous, known = since, set(seen)
+        for item in reversed(changes):
+            id, created, updated = times(item)
+            if updated > since:
+                since, seen = updated, set()
+            seen.add(id)
+            is_new = created > previous or (created == previous and id not in known)
+            yield WatchEvent("created" if is_new else "updated", item)
@@ -87,6 +87,10 @@ class ApiClient:
     async def close(self):
         await self.rest_client.close()
 
+    def pool_stats(self):
+        """Returns a snapshot of the connection pool, see `mr_openapi.transport.PoolStats`."""
+        return self.rest_client.pool_stats()
+
     @property
     def user_agent(self):
         """User agent for this API client."""
@@ -195,7 +199,11 @@ class ApiClient:
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            if hasattr(body, "to_dict") and callable(body.to_dict):
+                # encode models straight to bytes, without walking them again
+                body = config.codec.dumps(body.to_dict())
+            else:
+                body = self.sanitize_for_serialization(body)
 
         # request url
         if _host is None:
@@ -267,18 +275,20 @@ class ApiClient:
             elif response_type == "file":
                 return_data = self.__deserialize_file(response_data)
             elif response_type is not None:
-                match = None
-                content_type = response_data.getheader("content-type")
-                if content_type is not None:
-                    match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
-                encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
+                encoding = self.__response_encoding(response_data)
                 if response_type in ["bytearray", "str"]:
+                    response_text = response_data.data.decode(encoding)
                     return_data = self.__deserialize_primitive(response_text, response_type)
+                elif encoding.lower().replace("-", "") == "utf8":
+                    # JSON is decoded straight from the body, without an intermediate str
+                    return_data = self.deserialize(response_data.data, response_type)
                 else:
+                    response_text = response_data.data.decode(encoding)
                     return_data = self.deserialize(response_text, response_type)
         finally:
             if not 200 <= response_data.status <= 299:
+                if response_text is None and response_type not in (None, "bytearray", "file"):
+                    response_text = response_data.data.decode(self.__response_encoding(response_data))
                 raise ApiException.from_response(
                     http_resp=response_data,
                     body=response_text,
@@ -292,6 +302,14 @@ class ApiClient:
             raw_data=response_data.data,
         )
 
+    @staticmethod
+    def __response_encoding(response_data: rest.RESTResponse) -> str:
+        match = None
+        content_type = response_data.getheader("content-type")
+        if content_type is not None:
+            match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
+        return match.group(1) if match else "utf-8"
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -340,7 +358,7 @@ class ApiClient:
     def deserialize(self, response_text, response_type):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response: JSON response body, as bytes or str.
         :param response_type: class literal for
             deserialized object, or string of class name.
 
@@ -348,9 +366,9 @@ class ApiClient:
         """
         # fetch data from response object
         try:
-            data = json.loads(response_text)
+            data = self.configuration.codec.loads(response_text)
         except ValueError:
-            data = response_text
+            data = response_text.decode() if isinstance(response_text, bytes) else response_text
 
         return self.__deserialize(data, response_type)
 
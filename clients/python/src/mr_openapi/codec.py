@@ -0,0 +1,92 @@
+"""JSON codecs for request and response bodies.
+
+The standard library codec is always available. Faster codecs are used when their package is installed:
+`orjson` first, then `msgspec`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """Encodes and decodes JSON bodies with the standard library."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object to UTF-8 JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON, straight from the response bytes."""
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """Encodes and decodes JSON bodies with `orjson`."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Constructor.
+
+        :raises ImportError: If `orjson` isn't installed.
+        """
+        import orjson
+
+        # bound straight to the instance, to skip a call per body
+        self.dumps = orjson.dumps  # type: ignore[method-assign,assignment]
+        self.loads = orjson.loads  # type: ignore[method-assign,assignment]
+
+
+class MsgspecCodec(JSONCodec):
+    """Encodes and decodes JSON bodies with `msgspec`."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Constructor.
+
+        :raises ImportError: If `msgspec` isn't installed.
+        """
+        import msgspec
+
+        self.dumps = msgspec.json.Encoder().encode  # type: ignore[method-assign]
+        self._decode = msgspec.json.Decoder().decode
+        self._errors = msgspec.DecodeError
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decode JSON, straight from the response bytes."""
+        try:
+            return self._decode(data)
+        except self._errors as e:
+            # invalid JSON raises ValueError with the other codecs
+            raise ValueError(str(e)) from e
+
+
+CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+
+def get_codec(name: str = "auto") -> JSONCodec:
+    """Get a codec by name.
+
+    :param name: One of `json`, `orjson` or `msgspec`, or `auto` for the fastest one installed.
+    :raises ImportError: If the package of the codec isn't installed.
+    :raises ValueError: If there's no such codec.
+    """
+    if name == "auto":
+        for codec in CODECS.values():
+            try:
+                return codec()
+            except ImportError:
+                continue
+    if name not in CODECS:
+        msg = f"Unknown JSON codec {name!r}, expected one of {', '.join(CODECS)} or 'auto'"
+        raise ValueError(msg)
+    return CODECS[name]()
@@ -15,6 +15,11 @@ import sys
 from logging import FileHandler
 from typing import Optional
 
+from mr_openapi.codec import JSONCodec, get_codec
+from mr_openapi.limiter import LimiterPolicy
+from mr_openapi.retry import BreakerPolicy, RetryPolicy
+from mr_openapi.transport import TransportProfile, get_profile
+
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     "multipleOf",
     "maximum",
@@ -160,6 +165,17 @@ class Configuration:
            Default values is 100, None means no-limit.
         """
 
+        self.transport: TransportProfile = get_profile()
+        """Connection pool and timeout settings, applied when the HTTP session is built.
+           Set to one of the `mr_openapi.transport.PROFILES` presets (e.g. `get_profile("low_latency")`),
+           or to a tuned copy of one.
+        """
+
+        self.share_connector = False
+        """Share connections with the other clients of the same host, on the same event loop.
+           Clients share a connector when their connection pool, SSL and transport settings are the same.
+        """
+
         self.proxy: Optional[str] = None
         """Proxy URL
         """
@@ -170,11 +186,39 @@ class Configuration:
         """Safe chars for path_param
         """
         self.retries = None
-        """Adding retries to override urllib3 default value 3
+        """Maximum number of attempts per request, the first one included, None to send requests once.
+           Requests that aren't idempotent are only retried when the server can't have processed them.
+        """
+        self.retry_policy: RetryPolicy = RetryPolicy()
+        """Backoff between retries, and which responses are retried, see `mr_openapi.retry.RetryPolicy`.
+        """
+        self.read_limit: Optional[LimiterPolicy] = None
+        """Adaptive limit of concurrent reads (GET, HEAD, OPTIONS), see `mr_openapi.limiter.AIMDLimiter`.
+           None leaves them limited by the connection pool only.
+        """
+        self.write_limit: Optional[LimiterPolicy] = None
+        """Adaptive limit of concurrent writes, see `mr_openapi.limiter.AIMDLimiter`.
+           None leaves them limited by the connection pool only.
+        """
+        self.circuit_breaker: Optional[BreakerPolicy] = None
+        """Fail fast while the server is unhealthy, using a circuit breaker shared by every client of the host.
+           None disables it.
         """
         # Enable client side validation
         self.client_side_validation = True
 
+        self.trusted_server = False
+        """Trust the shape of server responses.
+           When set, the model registry client decodes responses straight into its own types,
+           validating them once instead of through the generated models first.
+           Only enable this for servers you trust.
+        """
+
+        self.codec: JSONCodec = get_codec()
+        """JSON codec for request and response bodies.
+           Defaults to the fastest one installed, see `mr_openapi.codec.get_codec`.
+        """
+
         self.socket_options = None
         """Options to pass down to the underlying urllib3 socket
         """
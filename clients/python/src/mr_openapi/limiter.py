@@ -0,0 +1,160 @@
+"""Adaptive concurrency limits for the API client.
+
+Each limit follows AIMD (additive increase, multiplicative decrease), like TCP congestion control: it grows by about
+one request per round-trip while latency stays stable, and is cut whenever the server shows signs of overload
+(gateway errors, 429, timeouts, connection errors or a latency spike).
+
+Reads and writes get separate lanes, so a burst of writes doesn't starve reads, or the other way around.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Protocol, TypeVar
+
+import aiohttp
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# statuses telling the server is overloaded
+_OVERLOAD_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class _Response(Protocol):
+    status: int
+
+
+ResponseT = TypeVar("ResponseT", bound=_Response)
+
+
+@dataclass(frozen=True)
+class LimiterPolicy:
+    """How a concurrency limit adapts.
+
+    :param initial: Limit to start from.
+    :param min_limit: Lowest the limit can go.
+    :param max_limit: Highest the limit can go.
+    :param backoff: Factor the limit is multiplied by on overload.
+    :param latency_tolerance: Latency spike, as a multiple of the lowest recent latency, treated as overload.
+    """
+
+    initial: int = 10
+    min_limit: int = 1
+    max_limit: int = 100
+    backoff: float = 0.5
+    latency_tolerance: float = 3.0
+
+
+class AIMDLimiter:
+    """Concurrency limit adapting to how the server responds.
+
+    Requests wait for a slot when `limit` of them are in flight.
+    Each request that completes without overload raises the limit by `1 / limit`, so about one per round-trip, and an
+    overload multiplies it by `backoff`. Requests sent before the limit was last cut don't cut it again, as they were
+    all in flight under the same conditions.
+
+    Latency is measured until the response headers are received, and compared to the lowest recent latency, which
+    slowly drifts up to follow the server.
+    """
+
+    # how much the latency baseline rises with each request, to forget old lows
+    _BASELINE_DRIFT = 0.01
+
+    def __init__(self, policy: LimiterPolicy, clock: Callable[[], float] = time.monotonic) -> None:
+        """Constructor.
+
+        :param policy: How the limit adapts.
+        :param clock: Monotonic clock used for latencies.
+        """
+        if not 1 <= policy.min_limit <= policy.initial <= policy.max_limit:
+            msg = f"Expected 1 <= min_limit <= initial <= max_limit, got {policy}"
+            raise ValueError(msg)
+        self.policy = policy
+        self._clock = clock
+        self._limit = float(policy.initial)
+        self._in_flight = 0
+        self._baseline: float | None = None
+        self._last_cut = float("-inf")
+        # created on first use, to bind to the running loop
+        self._changed: asyncio.Condition | None = None
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self._in_flight
+
+    async def run(self, send: Callable[[], Awaitable[ResponseT]]) -> ResponseT:
+        """Send a request once there's a free slot, adapting the limit to the outcome.
+
+        :param send: Sends the request once. Retries should each be run separately, to leave the backoff between them
+            out of the latency.
+        """
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+        started = self._clock()
+        try:
+            response = await send()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._overload(started)
+            raise
+        finally:
+            async with self._changed:
+                self._in_flight -= 1
+                self._changed.notify_all()
+
+        if response.status in _OVERLOAD_STATUSES:
+            self._overload(started)
+        else:
+            self._complete(started, self._clock() - started)
+        return response
+
+    def _complete(self, started: float, latency: float) -> None:
+        baseline = latency if self._baseline is None else self._baseline
+        # drifts up during spikes too, so a server that got slower for good stops being treated as overloaded
+        self._baseline = min(latency, baseline * (1 + self._BASELINE_DRIFT))
+        if latency > baseline * self.policy.latency_tolerance:
+            self._overload(started)
+        else:
+            self._limit = min(float(self.policy.max_limit), self._limit + 1 / self._limit)
+
+    def _overload(self, started: float) -> None:
+        if started < self._last_cut:
+            return
+        self._last_cut = self._clock()
+        self._limit = max(float(self.policy.min_limit), self._limit * self.policy.backoff)
+
+
+class AdaptiveLimiter:
+    """Separate adaptive concurrency limits for reads and writes.
+
+    Either lane can be left unlimited.
+    """
+
+    def __init__(
+        self,
+        reads: LimiterPolicy | None = None,
+        writes: LimiterPolicy | None = None,
+    ) -> None:
+        """Constructor.
+
+        :param reads: How the limit of reads (GET, HEAD, OPTIONS) adapts, None for no limit.
+        :param writes: How the limit of every other request adapts, None for no limit.
+        """
+        self.reads = AIMDLimiter(reads) if reads is not None else None
+        self.writes = AIMDLimiter(writes) if writes is not None else None
+
+    def lane(self, method: str) -> AIMDLimiter | None:
+        """Limiter of requests with a given HTTP method, if they're limited."""
+        return self.reads if method.upper() in READ_METHODS else self.writes
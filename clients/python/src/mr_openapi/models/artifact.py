@@ -27,6 +27,13 @@ from mr_openapi.models.model_artifact import ModelArtifact
 
 ARTIFACT_ONE_OF_SCHEMAS = ["DocArtifact", "ModelArtifact"]
 
+ARTIFACT_DISCRIMINATOR_MAPPING: dict[str, type[BaseModel]] = {
+    "doc-artifact": DocArtifact,
+    "model-artifact": ModelArtifact,
+    "DocArtifact": DocArtifact,
+    "ModelArtifact": ModelArtifact,
+}
+
 
 class Artifact(BaseModel):
     """A metadata Artifact Entity."""
@@ -88,7 +95,15 @@ class Artifact(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: str | dict[str, Any]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, dispatching on the `artifactType` discriminator."""
+        if isinstance(obj, str):
+            return cls.from_json(obj)
+        klass = ARTIFACT_DISCRIMINATOR_MAPPING.get(obj.get("artifactType"))
+        if klass is None:
+            # unknown discriminator, fall back to matching against every schema
+            return cls.from_json(json.dumps(obj))
+        # copying an empty instance skips re-creating the (constant) defaults on every value
+        return _EMPTY.model_copy(update={"actual_instance": klass.from_dict(obj)})
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
@@ -98,30 +113,14 @@ class Artifact(BaseModel):
         match = 0
 
         # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("artifactType")
+        data = json.loads(json_str)
+        _data_type = data.get("artifactType")
         if not _data_type:
             msg = "Failed to lookup data type from the field `artifactType` in the input."
             raise ValueError(msg)
 
-        # check if data type is `DocArtifact`
-        if _data_type == "doc-artifact":
-            instance.actual_instance = DocArtifact.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelArtifact`
-        if _data_type == "model-artifact":
-            instance.actual_instance = ModelArtifact.from_json(json_str)
-            return instance
-
-        # check if data type is `DocArtifact`
-        if _data_type == "DocArtifact":
-            instance.actual_instance = DocArtifact.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelArtifact`
-        if _data_type == "ModelArtifact":
-            instance.actual_instance = ModelArtifact.from_json(json_str)
-            return instance
+        if _data_type in ARTIFACT_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(data)
 
         # deserialize data into ModelArtifact
         try:
@@ -172,3 +171,6 @@ class Artifact(BaseModel):
     def to_str(self) -> str:
         """Returns the string representation of the actual instance."""
         return pprint.pformat(self.model_dump())
+
+
+_EMPTY = Artifact.model_construct()
@@ -27,6 +27,13 @@ from mr_openapi.models.model_artifact_create import ModelArtifactCreate
 
 ARTIFACTCREATE_ONE_OF_SCHEMAS = ["DocArtifactCreate", "ModelArtifactCreate"]
 
+ARTIFACTCREATE_DISCRIMINATOR_MAPPING: dict[str, type[BaseModel]] = {
+    "doc-artifact": DocArtifactCreate,
+    "model-artifact": ModelArtifactCreate,
+    "DocArtifactCreate": DocArtifactCreate,
+    "ModelArtifactCreate": ModelArtifactCreate,
+}
+
 
 class ArtifactCreate(BaseModel):
     """An Artifact to be created."""
@@ -88,7 +95,15 @@ class ArtifactCreate(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: str | dict[str, Any]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, dispatching on the `artifactType` discriminator."""
+        if isinstance(obj, str):
+            return cls.from_json(obj)
+        klass = ARTIFACTCREATE_DISCRIMINATOR_MAPPING.get(obj.get("artifactType"))
+        if klass is None:
+            # unknown discriminator, fall back to matching against every schema
+            return cls.from_json(json.dumps(obj))
+        # copying an empty instance skips re-creating the (constant) defaults on every value
+        return _EMPTY.model_copy(update={"actual_instance": klass.from_dict(obj)})
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
@@ -98,30 +113,14 @@ class ArtifactCreate(BaseModel):
         match = 0
 
         # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("artifactType")
+        data = json.loads(json_str)
+        _data_type = data.get("artifactType")
         if not _data_type:
             msg = "Failed to lookup data type from the field `artifactType` in the input."
             raise ValueError(msg)
 
-        # check if data type is `DocArtifactCreate`
-        if _data_type == "doc-artifact":
-            instance.actual_instance = DocArtifactCreate.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelArtifactCreate`
-        if _data_type == "model-artifact":
-            instance.actual_instance = ModelArtifactCreate.from_json(json_str)
-            return instance
-
-        # check if data type is `DocArtifactCreate`
-        if _data_type == "DocArtifactCreate":
-            instance.actual_instance = DocArtifactCreate.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelArtifactCreate`
-        if _data_type == "ModelArtifactCreate":
-            instance.actual_instance = ModelArtifactCreate.from_json(json_str)
-            return instance
+        if _data_type in ARTIFACTCREATE_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(data)
 
         # deserialize data into ModelArtifactCreate
         try:
@@ -172,3 +171,6 @@ class ArtifactCreate(BaseModel):
     def to_str(self) -> str:
         """Returns the string representation of the actual instance."""
         return pprint.pformat(self.model_dump())
+
+
+_EMPTY = ArtifactCreate.model_construct()
@@ -27,6 +27,13 @@ from mr_openapi.models.model_artifact_update import ModelArtifactUpdate
 
 ARTIFACTUPDATE_ONE_OF_SCHEMAS = ["DocArtifactUpdate", "ModelArtifactUpdate"]
 
+ARTIFACTUPDATE_DISCRIMINATOR_MAPPING: dict[str, type[BaseModel]] = {
+    "doc-artifact": DocArtifactUpdate,
+    "model-artifact": ModelArtifactUpdate,
+    "DocArtifactUpdate": DocArtifactUpdate,
+    "ModelArtifactUpdate": ModelArtifactUpdate,
+}
+
 
 class ArtifactUpdate(BaseModel):
     """An Artifact to be updated."""
@@ -88,7 +95,15 @@ class ArtifactUpdate(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: str | dict[str, Any]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, dispatching on the `artifactType` discriminator."""
+        if isinstance(obj, str):
+            return cls.from_json(obj)
+        klass = ARTIFACTUPDATE_DISCRIMINATOR_MAPPING.get(obj.get("artifactType"))
+        if klass is None:
+            # unknown discriminator, fall back to matching against every schema
+            return cls.from_json(json.dumps(obj))
+        # copying an empty instance skips re-creating the (constant) defaults on every value
+        return _EMPTY.model_copy(update={"actual_instance": klass.from_dict(obj)})
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
@@ -98,30 +113,14 @@ class ArtifactUpdate(BaseModel):
         match = 0
 
         # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("artifactType")
+        data = json.loads(json_str)
+        _data_type = data.get("artifactType")
         if not _data_type:
             msg = "Failed to lookup data type from the field `artifactType` in the input."
             raise ValueError(msg)
 
-        # check if data type is `DocArtifactUpdate`
-        if _data_type == "doc-artifact":
-            instance.actual_instance = DocArtifactUpdate.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelArtifactUpdate`
-        if _data_type == "model-artifact":
-            instance.actual_instance = ModelArtifactUpdate.from_json(json_str)
-            return instance
-
-        # check if data type is `DocArtifactUpdate`
-        if _data_type == "DocArtifactUpdate":
-            instance.actual_instance = DocArtifactUpdate.from_json(json_str)
-            return instance
-
-        # check if data type is `ModelArtifactUpdate`
-        if _data_type == "ModelArtifactUpdate":
-            instance.actual_instance = ModelArtifactUpdate.from_json(json_str)
-            return instance
+        if _data_type in ARTIFACTUPDATE_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(data)
 
         # deserialize data into ModelArtifactUpdate
         try:
@@ -172,3 +171,6 @@ class ArtifactUpdate(BaseModel):
     def to_str(self) -> str:
         """Returns the string representation of the actual instance."""
         return pprint.pformat(self.model_dump())
+
+
+_EMPTY = ArtifactUpdate.model_construct()
@@ -38,6 +38,15 @@ METADATAVALUE_ONE_OF_SCHEMAS = [
     "MetadataStructValue",
 ]
 
+METADATAVALUE_DISCRIMINATOR_MAPPING: dict[str, type[BaseModel]] = {
+    "MetadataBoolValue": MetadataBoolValue,
+    "MetadataDoubleValue": MetadataDoubleValue,
+    "MetadataIntValue": MetadataIntValue,
+    "MetadataProtoValue": MetadataProtoValue,
+    "MetadataStringValue": MetadataStringValue,
+    "MetadataStructValue": MetadataStructValue,
+}
+
 
 class MetadataValue(BaseModel):
     """A value in properties."""
@@ -142,7 +151,15 @@ class MetadataValue(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: str | dict[str, Any]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, dispatching on the `metadataType` discriminator."""
+        if isinstance(obj, str):
+            return cls.from_json(obj)
+        klass = METADATAVALUE_DISCRIMINATOR_MAPPING.get(obj.get("metadataType"))
+        if klass is None:
+            # unknown discriminator, fall back to matching against every schema
+            return cls.from_json(json.dumps(obj))
+        # copying an empty instance skips re-creating the (constant) defaults on every value
+        return _EMPTY.model_copy(update={"actual_instance": klass.from_dict(obj)})
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
@@ -152,40 +169,14 @@ class MetadataValue(BaseModel):
         match = 0
 
         # use oneOf discriminator to lookup the data type
-        _data_type = json.loads(json_str).get("metadataType")
+        data = json.loads(json_str)
+        _data_type = data.get("metadataType")
         if not _data_type:
             msg = "Failed to lookup data type from the field `metadataType` in the input."
             raise ValueError(msg)
 
-        # check if data type is `MetadataBoolValue`
-        if _data_type == "MetadataBoolValue":
-            instance.actual_instance = MetadataBoolValue.from_json(json_str)
-            return instance
-
-        # check if data type is `MetadataDoubleValue`
-        if _data_type == "MetadataDoubleValue":
-            instance.actual_instance = MetadataDoubleValue.from_json(json_str)
-            return instance
-
-        # check if data type is `MetadataIntValue`
-        if _data_type == "MetadataIntValue":
-            instance.actual_instance = MetadataIntValue.from_json(json_str)
-            return instance
-
-        # check if data type is `MetadataProtoValue`
-        if _data_type == "MetadataProtoValue":
-            instance.actual_instance = MetadataProtoValue.from_json(json_str)
-            return instance
-
-        # check if data type is `MetadataStringValue`
-        if _data_type == "MetadataStringValue":
-            instance.actual_instance = MetadataStringValue.from_json(json_str)
-            return instance
-
-        # check if data type is `MetadataStructValue`
-        if _data_type == "MetadataStructValue":
-            instance.actual_instance = MetadataStructValue.from_json(json_str)
-            return instance
+        if _data_type in METADATAVALUE_DISCRIMINATOR_MAPPING:
+            return cls.from_dict(data)
 
         # deserialize data into MetadataIntValue
         try:
@@ -271,3 +262,6 @@ class MetadataValue(BaseModel):
     def to_str(self) -> str:
         """Returns the string representation of the actual instance."""
         return pprint.pformat(self.model_dump())
+
+
+_EMPTY = MetadataValue.model_construct()
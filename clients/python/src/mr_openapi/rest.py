@@ -9,20 +9,19 @@ Do not edit the class manually.
 """  # noqa: E501
 
 import io
-import json
 import re
-import ssl
-from typing import Optional, Union
+from typing import Optional
 
 import aiohttp
-import aiohttp_retry
+from yarl import URL
 
+from mr_openapi import retry, transport
 from mr_openapi.exceptions import ApiException, ApiValueError
+from mr_openapi.limiter import AdaptiveLimiter
+from mr_openapi.transport import PoolStats
 
 RESTResponseType = aiohttp.ClientResponse
 
-ALLOW_RETRY_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"})
-
 
 class RESTResponse(io.IOBase):
 
@@ -53,38 +52,57 @@ class RESTClientObject:
         # maxsize is number of requests to host that are allowed in parallel
         maxsize = configuration.connection_pool_maxsize
 
-        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert)
-        if configuration.cert_file:
-            ssl_context.load_cert_chain(configuration.cert_file, keyfile=configuration.key_file)
+        ssl_context = transport.ssl_context(
+            configuration.ssl_ca_cert,
+            configuration.cert_file,
+            configuration.key_file,
+            verify=configuration.verify_ssl,
+        )
 
-        if not configuration.verify_ssl:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        profile = configuration.transport
 
-        connector = aiohttp.TCPConnector(limit=maxsize, ssl=ssl_context)
+        def connector_factory():
+            return aiohttp.TCPConnector(limit=maxsize, ssl=ssl_context, **profile.connector_options())
+
+        self.shared_connector = configuration.share_connector
+        if self.shared_connector:
+            connector = transport.acquire_connector(
+                (configuration.host, maxsize, ssl_context, profile), connector_factory
+            )
+        else:
+            connector = connector_factory()
 
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
+        self.codec = configuration.codec
 
         # https pool manager
-        self.pool_manager = aiohttp.ClientSession(connector=connector, trust_env=True)
-
-        retries = configuration.retries
-        self.retry_client: Optional[aiohttp_retry.RetryClient]
-        if retries is not None:
-            self.retry_client = aiohttp_retry.RetryClient(
-                client_session=self.pool_manager,
-                retry_options=aiohttp_retry.ExponentialRetry(
-                    attempts=retries, factor=0.0, start_timeout=0.0, max_timeout=120.0
-                ),
-            )
-        else:
-            self.retry_client = None
+        self.pool_manager = aiohttp.ClientSession(
+            connector=connector,
+            connector_owner=not self.shared_connector,
+            timeout=profile.timeout(),
+            trust_env=True,
+        )
+
+        self.attempts = max(1, configuration.retries or 0)
+        self.retry_policy = configuration.retry_policy
+        self.breaker: Optional[retry.CircuitBreaker] = None
+        if configuration.circuit_breaker is not None:
+            host = str(URL(configuration.host).origin())
+            self.breaker = retry.get_breaker(host, configuration.circuit_breaker)
+        self.limiter = AdaptiveLimiter(configuration.read_limit, configuration.write_limit)
 
     async def close(self):
+        if self.pool_manager.closed:
+            return
+        connector = self.pool_manager.connector
         await self.pool_manager.close()
-        if self.retry_client is not None:
-            await self.retry_client.close()
+        if self.shared_connector and connector is not None:
+            await transport.release_connector(connector)
+
+    def pool_stats(self) -> PoolStats:
+        """Returns a snapshot of the connection pool."""
+        return PoolStats.from_connector(self.pool_manager.connector)
 
     async def request(self, method, url, headers=None, body=None, post_params=None, _request_timeout=None):
         """Execute request.
@@ -99,7 +117,8 @@ class RESTClientObject:
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
+                                 (connection, read) timeouts. Defaults to
+                                 the timeouts of the transport profile.
         """
         method = method.upper()
         assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
@@ -111,12 +130,18 @@ class RESTClientObject:
         post_params = post_params or {}
         headers = headers or {}
         # url already contains the URL query string
-        timeout = _request_timeout or 5 * 60
 
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
 
-        args = {"method": method, "url": url, "timeout": timeout, "headers": headers}
+        args = {"method": method, "url": url, "headers": headers}
+        if isinstance(_request_timeout, (int, float)):
+            args["timeout"] = aiohttp.ClientTimeout(total=_request_timeout)
+        elif isinstance(_request_timeout, tuple):
+            connect, read = _request_timeout
+            args["timeout"] = aiohttp.ClientTimeout(connect=connect, sock_read=read)
+        elif _request_timeout is not None:
+            args["timeout"] = _request_timeout
 
         if self.proxy:
             args["proxy"] = self.proxy
@@ -126,8 +151,9 @@ class RESTClientObject:
         # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
         if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
             if re.search("json", headers["Content-Type"], re.IGNORECASE):
-                if body is not None:
-                    body = json.dumps(body)
+                # models are already encoded by the API client
+                if body is not None and not isinstance(body, bytes):
+                    body = self.codec.dumps(body)
                 args["data"] = body
             elif headers["Content-Type"] == "application/x-www-form-urlencoded":
                 args["data"] = aiohttp.FormData(post_params)
@@ -156,12 +182,20 @@ class RESTClientObject:
                          declared content type."""
                 raise ApiException(status=0, reason=msg)
 
-        pool_manager: Union[aiohttp.ClientSession, aiohttp_retry.RetryClient]
-        if self.retry_client is not None and method in ALLOW_RETRY_METHODS:
-            pool_manager = self.retry_client
-        else:
-            pool_manager = self.pool_manager
-
-        r = await pool_manager.request(**args)
+        # form data can't be sent twice
+        attempts = 1 if isinstance(args.get("data"), aiohttp.FormData) else self.attempts
+
+        def send():
+            return self.pool_manager.request(**args)
+
+        # each attempt takes a slot of its own, so backoff sleeps neither hold one nor count as latency
+        lane = self.limiter.lane(method)
+        r = await retry.send(
+            send if lane is None else lambda: lane.run(send),
+            method=method,
+            attempts=attempts,
+            policy=self.retry_policy,
+            breaker=self.breaker,
+        )
 
         return RESTResponse(r)
@@ -0,0 +1,249 @@
+"""Retries and circuit breaking for the REST client.
+
+Failed requests are retried with exponential backoff and decorrelated jitter, waiting as long as the server asks to
+with `Retry-After`.
+Requests that aren't idempotent are only retried when the server can't have processed them.
+
+A circuit breaker per host counts consecutive failures (connection errors, timeouts and gateway errors). Once too many
+of them happen, requests fail fast until the registry gets probed again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Literal
+
+import aiohttp
+
+from mr_openapi.exceptions import ApiException
+
+# methods that can be sent again without changing the outcome
+IDEMPOTENT_METHODS = frozenset({"DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE"})
+
+# statuses telling the request was rejected before being processed
+_UNPROCESSED_STATUSES = frozenset({429, 503})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed requests are retried.
+
+    The number of attempts is set by `Configuration.retries`.
+    Each delay is drawn between `base_delay` and three times the previous delay, up to `max_delay`.
+
+    :param base_delay: Minimum delay before a retry, in seconds.
+    :param max_delay: Maximum delay before a retry, in seconds.
+    :param statuses: Response statuses retried. 500 isn't retried by default, as the registry reports some client
+        errors with it.
+    :param max_retry_after: Longest `Retry-After` honoured, in seconds. Responses asking to wait longer are returned.
+    """
+
+    base_delay: float = 0.1
+    max_delay: float = 10.0
+    statuses: frozenset[int] = frozenset({429, 502, 503, 504})
+    max_retry_after: float = 60.0
+
+    def next_delay(self, previous: float) -> float:
+        """Delay before the next retry, from the previous one (0 before the first retry)."""
+        upper = max(self.base_delay, previous * 3)
+        # jitter only spreads retries out, it doesn't need to be unpredictable
+        return min(self.max_delay, random.uniform(self.base_delay, upper))  # noqa: S311
+
+    def retry_after(self, response: aiohttp.ClientResponse) -> float | None:
+        """Delay asked for by the `Retry-After` header of a response, in seconds, if any."""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """When a circuit breaker opens.
+
+    :param failure_threshold: Consecutive failures that open the circuit.
+    :param reset_timeout: Seconds the circuit stays open before letting a request through to probe the host.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+
+class CircuitOpenError(ApiException):
+    """Raised instead of sending a request while the circuit of its host is open."""
+
+
+class CircuitBreaker:
+    """Failure state of a host, shared by every client using it.
+
+    Starts closed. After `failure_threshold` consecutive failures, it opens and rejects requests for `reset_timeout`
+    seconds, then half-opens to let a single request through: the circuit closes again if it succeeds, and reopens
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        policy: BreakerPolicy,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Constructor.
+
+        :param host: Host the breaker guards, for error messages.
+        :param policy: When the circuit opens.
+        :param clock: Monotonic clock used for the reset timeout.
+        """
+        self.host = host
+        self.policy = policy
+        self._clock = clock
+        # breakers are shared by clients on different threads, each with their own event loop
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> Literal["closed", "open", "half-open"]:
+        """State of the circuit."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or self._clock() - self._opened_at >= self.policy.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_request(self) -> None:
+        """Check a request can be sent.
+
+        :raises CircuitOpenError: If the circuit is open, or half-open with a probe already in flight.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._clock() - self._opened_at >= self.policy.reset_timeout:
+                # another probe is let through a timeout later, should this one never complete
+                self._opened_at = self._clock()
+                self._probing = True
+                return
+        raise CircuitOpenError(reason=f"Circuit open for {self.host}, failing fast")
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the circuit after too many or a failed probe."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.policy.failure_threshold:
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+_breakers: dict[tuple[str, BreakerPolicy], CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str, policy: BreakerPolicy) -> CircuitBreaker:
+    """Get the circuit breaker of a host, shared by every client of the process with the same policy."""
+    with _breakers_lock:
+        if (breaker := _breakers.get((host, policy))) is None:
+            breaker = _breakers[host, policy] = CircuitBreaker(host, policy)
+        return breaker
+
+
+def _gives_up(attempt: int, attempts: int, breaker: CircuitBreaker | None) -> bool:
+    """Whether a failed attempt is the last one, as attempts ran out or the failure opened the circuit."""
+    return attempt == attempts or (breaker is not None and breaker.state == "open")
+
+
+def _is_failure(status: int) -> bool:
+    """Whether a response status tells the host is unhealthy, rather than the request being wrong."""
+    return status in (502, 503, 504)
+
+
+def _is_retryable(response: aiohttp.ClientResponse, policy: RetryPolicy, idempotent: bool) -> bool:
+    """Whether a response can be retried, waiting no longer than the policy allows."""
+    if response.status not in policy.statuses or not (idempotent or response.status in _UNPROCESSED_STATUSES):
+        return False
+    wait = policy.retry_after(response)
+    return wait is None or wait <= policy.max_retry_after
+
+
+async def _attempt(
+    request: Callable[[], Awaitable[aiohttp.ClientResponse]], breaker: CircuitBreaker | None
+) -> aiohttp.ClientResponse:
+    """Send a request once, recording the outcome in the circuit breaker."""
+    if breaker is None:
+        return await request()
+    breaker.before_request()
+    try:
+        response = await request()
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        breaker.record_failure()
+        raise
+    if _is_failure(response.status):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+async def send(
+    request: Callable[[], Awaitable[aiohttp.ClientResponse]],
+    *,
+    method: str,
+    attempts: int,
+    policy: RetryPolicy,
+    breaker: CircuitBreaker | None = None,
+) -> aiohttp.ClientResponse:
+    """Send a request, retrying it on transient failures.
+
+    Idempotent requests are retried on connection errors, timeouts and the statuses of the policy.
+    Other requests are only retried when they couldn't have been processed: when the connection couldn't be
+    established, or on 429 and 503 responses.
+
+    :param request: Sends the request.
+    :param method: HTTP method of the request.
+    :param attempts: Maximum number of attempts, the first one included, at least 1.
+    :param policy: Retry policy.
+    :param breaker: Circuit breaker of the host, if any.
+    :raises CircuitOpenError: If the circuit of the host is open.
+    :raises ValueError: If `attempts` is less than 1.
+    """
+    idempotent = method in IDEMPOTENT_METHODS
+    delay = 0.0
+    for attempt in range(1, attempts + 1):
+        try:
+            response = await _attempt(request, breaker)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if _gives_up(attempt, attempts, breaker) or not (
+                idempotent or isinstance(e, aiohttp.ClientConnectorError)
+            ):
+                raise
+            wait = None
+        else:
+            if _gives_up(attempt, attempts, breaker) or not _is_retryable(response, policy, idempotent):
+                return response
+            wait = policy.retry_after(response)
+            response.release()
+        delay = policy.next_delay(delay)
+        await asyncio.sleep(delay if wait is None else wait)
+    msg = f"Expected at least 1 attempt, got {attempts}"
+    raise ValueError(msg)
@@ -0,0 +1,230 @@
+"""Connection tuning for the REST client.
+
+A transport profile holds the connection pool and timeout settings applied when the HTTP session is built.
+Presets are available for the common cases: `default`, `low_latency` and `bulk`.
+
+SSL contexts are cached process-wide, and connectors can be shared by the clients of the same host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import ssl
+import threading
+import weakref
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
+from typing import Any
+
+import aiohttp
+
+
+@dataclass(frozen=True)
+class TransportProfile:
+    """Connection pool and timeout settings.
+
+    The total number of connections is limited by `Configuration.connection_pool_maxsize`.
+    TCP_NODELAY is always set on connections by aiohttp.
+
+    :param limit_per_host: Maximum number of connections to the same host, 0 for no limit besides the total one.
+    :param keepalive_timeout: Seconds idle connections are kept open for reuse.
+    :param dns_cache_ttl: Seconds resolved addresses are cached for, None to cache them forever.
+    :param happy_eyeballs_delay: Seconds to wait for a connection attempt before racing the next address of the host
+        (RFC 8305), None to try addresses one at a time.
+    :param total_timeout: Seconds a request can take, including reading the response, None for no limit.
+    :param connect_timeout: Seconds to get a connection, including waiting for one from the pool, None for no limit.
+    :param sock_read_timeout: Seconds to wait for each chunk of the response, None for no limit.
+    :param force_close: Close connections after each request instead of reusing them.
+    """
+
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    dns_cache_ttl: int | None = 10
+    happy_eyeballs_delay: float | None = 0.25
+    total_timeout: float | None = 5 * 60
+    connect_timeout: float | None = None
+    sock_read_timeout: float | None = None
+    force_close: bool = False
+
+    def with_options(self, **changes: Any) -> TransportProfile:
+        """Copy of the profile with some settings changed."""
+        return replace(self, **changes)
+
+    def connector_options(self) -> dict[str, Any]:
+        """Keyword arguments of `aiohttp.TCPConnector` for this profile."""
+        options: dict[str, Any] = {
+            "limit_per_host": self.limit_per_host,
+            "ttl_dns_cache": self.dns_cache_ttl,
+            "force_close": self.force_close,
+            "happy_eyeballs_delay": self.happy_eyeballs_delay,
+        }
+        # aiohttp rejects a keepalive timeout for connections that are never kept
+        if not self.force_close:
+            options["keepalive_timeout"] = self.keepalive_timeout
+        return options
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        """Default timeout of requests for this profile."""
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_read=self.sock_read_timeout,
+        )
+
+
+PROFILES: dict[str, TransportProfile] = {
+    "default": TransportProfile(),
+    # interactive calls: keep connections warm, fail fast
+    "low_latency": TransportProfile(
+        keepalive_timeout=60.0,
+        dns_cache_ttl=300,
+        happy_eyeballs_delay=0.1,
+        total_timeout=30.0,
+        connect_timeout=2.0,
+        sock_read_timeout=10.0,
+    ),
+    # batch jobs: large pages and slow writes are fine, dropping connections isn't
+    "bulk": TransportProfile(
+        keepalive_timeout=30.0,
+        dns_cache_ttl=300,
+        total_timeout=15 * 60,
+        connect_timeout=30.0,
+        sock_read_timeout=120.0,
+    ),
+}
+
+
+def get_profile(name: str = "default") -> TransportProfile:
+    """Get a transport profile preset by name.
+
+    :param name: One of `default`, `low_latency` or `bulk`.
+    :raises ValueError: If there's no such preset.
+    """
+    if name not in PROFILES:
+        msg = f"Unknown transport profile {name!r}, expected one of {', '.join(PROFILES)}"
+        raise ValueError(msg)
+    return PROFILES[name]
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of the connection pool of a client.
+
+    :param limit: Maximum number of connections, 0 for no limit.
+    :param open: Number of open connections, idle or acquired.
+    :param idle: Number of open connections waiting to be reused.
+    :param acquired: Number of connections serving a request.
+    :param waiting: Number of requests waiting for a connection, as the pool is full.
+    """
+
+    limit: int
+    open: int
+    idle: int
+    acquired: int
+    waiting: int
+
+    @classmethod
+    def from_connector(cls, connector: aiohttp.BaseConnector | None) -> PoolStats:
+        """Read the statistics of a connector, None once its session is closed.
+
+        aiohttp doesn't expose those, so they are read from its internals, reporting zeros for what can't be found.
+        """
+        conns = getattr(connector, "_conns", {})
+        waiters = getattr(connector, "_waiters", {})
+        idle = sum(len(c) for c in conns.values())
+        acquired = len(getattr(connector, "_acquired", ()))
+        return cls(
+            limit=connector.limit if connector is not None else 0,
+            open=idle + acquired,
+            idle=idle,
+            acquired=acquired,
+            waiting=sum(len(w) for w in waiters.values()),
+        )
+
+
+# SSL contexts, by the paths of their files, the files modification times and whether to verify the server
+_ssl_contexts: dict[tuple[Any, ...], ssl.SSLContext] = {}
+_ssl_lock = threading.Lock()
+
+
+def _mtime(path: str | None) -> int | None:
+    return os.stat(path).st_mtime_ns if path else None
+
+
+def ssl_context(
+    ca_cert: str | None = None,
+    cert_file: str | None = None,
+    key_file: str | None = None,
+    verify: bool = True,
+) -> ssl.SSLContext:
+    """Get a client SSL context, shared by every client with the same settings.
+
+    Certificates are only read and parsed again once their files change on disk.
+    The context is shared, so it must not be modified.
+
+    :param ca_cert: Path of the CA bundle to verify the server with, defaults to the system one.
+    :param cert_file: Path of the client certificate.
+    :param key_file: Path of the client certificate key, if it's not in the certificate file.
+    :param verify: Whether to verify the server certificate and host name.
+    """
+    paths = (ca_cert, cert_file, key_file, verify)
+    key = (*paths, _mtime(ca_cert), _mtime(cert_file), _mtime(key_file))
+    with _ssl_lock:
+        if (context := _ssl_contexts.get(key)) is not None:
+            return context
+        context = ssl.create_default_context(cafile=ca_cert)
+        if cert_file:
+            context.load_cert_chain(cert_file, keyfile=key_file)
+        if not verify:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        # forget the contexts of previous versions of the files
+        for stale in [k for k in _ssl_contexts if k[:4] == paths]:
+            del _ssl_contexts[stale]
+        _ssl_contexts[key] = context
+        return context
+
+
+@dataclass
+class _SharedConnector:
+    connector: aiohttp.BaseConnector
+    users: int = 0
+
+
+# connectors can't be shared across event loops, the ones of a loop go away with it
+_connectors: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, _SharedConnector]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def acquire_connector(key: Hashable, factory: Callable[[], aiohttp.BaseConnector]) -> aiohttp.BaseConnector:
+    """Get the connector shared by the clients with the same key on the running event loop, creating it if needed.
+
+    Each call must be paired with a call to `release_connector` once the client is closed.
+
+    :param key: Key of the connector, e.g. the host and connection settings.
+    :param factory: Creates the connector.
+    """
+    shared = _connectors.setdefault(asyncio.get_running_loop(), {})
+    entry = shared.get(key)
+    if entry is None or entry.connector.closed:
+        entry = shared[key] = _SharedConnector(factory())
+    entry.users += 1
+    return entry.connector
+
+
+async def release_connector(connector: aiohttp.BaseConnector) -> None:
+    """Release a connector from `acquire_connector`, closing it once no client uses it.
+
+    Connectors it didn't hand out on the running event loop are left alone, as they aren't its to close.
+    """
+    shared = _connectors.get(asyncio.get_running_loop(), {})
+    key = next((key for key, entry in shared.items() if entry.connector is connector), None)
+    if key is None:
+        return
+    entry = shared[key]
+    entry.users -= 1
+    if entry.users == 0:
+        del shared[key]
+        await connector.close()
@@ -4,6 +4,7 @@ import os
 import subprocess
 import tempfile
 import time
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 from time import sleep
@@ -11,7 +12,7 @@ from time import sleep
 import pytest
 import requests
 
-from model_registry import ModelRegistry
+from model_registry import AsyncModelRegistry, ModelRegistry
 
 
 def pytest_addoption(parser):
@@ -135,6 +136,16 @@ def event_loop():
 def client() -> ModelRegistry:
     return ModelRegistry(REGISTRY_HOST, REGISTRY_PORT, author="author", is_secure=False)
 
+
+@pytest.fixture
+@cleanup
+async def async_client() -> AsyncIterator[AsyncModelRegistry]:
+    async with AsyncModelRegistry(
+        REGISTRY_HOST, REGISTRY_PORT, author="author", is_secure=False
+    ) as client:
+        yield client
+
+
 @pytest.fixture(scope="module")
 def setup_env_user_token():
     with tempfile.NamedTemporaryFile(delete=False) as token_file:
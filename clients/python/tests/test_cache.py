@@ -0,0 +1,154 @@
+import pytest
+
+from model_registry.cache import EntityCache
+from model_registry.types import (
+    DocArtifact,
+    ModelArtifact,
+    ModelVersion,
+    RegisteredModel,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lookup_keys():
+    cache = EntityCache()
+    rm = RegisteredModel(name="model", id="1", external_id="ext")
+    cache.put("rm", rm)
+
+    for key in (
+        EntityCache.id_key("rm", "1"),
+        EntityCache.name_key("rm", "model"),
+        EntityCache.external_id_key("rm", "ext"),
+    ):
+        assert cache.get(key, RegisteredModel) == rm
+    assert cache.get(EntityCache.id_key("mv", "1"), ModelVersion) is None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_copies():
+    cache = EntityCache()
+    rm = RegisteredModel(name="model", id="1")
+    cache.put("rm", rm)
+    rm.description = "changed"
+
+    cached = cache.get(EntityCache.id_key("rm", "1"), RegisteredModel)
+    assert cached
+    assert cached.description is None
+    cached.description = "changed"
+    assert cache.get(EntityCache.id_key("rm", "1"), RegisteredModel) != cached
+
+
+def test_ttl():
+    clock = Clock()
+    cache = EntityCache(ttl=10, clock=clock)
+    cache.put("rm", RegisteredModel(name="model", id="1"))
+    clock.now = 9.9
+    assert cache.get(EntityCache.name_key("rm", "model"), RegisteredModel)
+    clock.now = 10
+    assert cache.get(EntityCache.name_key("rm", "model"), RegisteredModel) is None
+    assert cache.get(EntityCache.id_key("rm", "1"), RegisteredModel) is None
+
+    with pytest.raises(ValueError, match="TTL"):
+        EntityCache(ttl=0)
+
+
+def test_lru_eviction():
+    cache = EntityCache(max_size=4)
+    for i in range(2):
+        cache.put("rm", RegisteredModel(name=f"model{i}", id=str(i)))
+    # touching the first model makes the second one the least recently used
+    assert cache.get(EntityCache.id_key("rm", "0"), RegisteredModel)
+    assert cache.get(EntityCache.name_key("rm", "model0"), RegisteredModel)
+    cache.put("rm", RegisteredModel(name="model2", id="2"))
+
+    assert len(cache) == 4
+    assert cache.evictions == 2
+    assert cache.get(EntityCache.id_key("rm", "0"), RegisteredModel)
+    assert cache.get(EntityCache.id_key("rm", "1"), RegisteredModel) is None
+    assert cache.get(EntityCache.name_key("rm", "model1"), RegisteredModel) is None
+
+
+def test_put_drops_stale_keys():
+    cache = EntityCache()
+    cache.put("rm", RegisteredModel(name="old", id="1", external_id="ext"))
+    cache.put("rm", RegisteredModel(name="new", id="1"))
+    assert cache.get(EntityCache.name_key("rm", "old"), RegisteredModel) is None
+    assert cache.get(EntityCache.external_id_key("rm", "ext"), RegisteredModel) is None
+    assert cache.get(EntityCache.name_key("rm", "new"), RegisteredModel)
+
+    # a name taken over by another object points at that one
+    cache.put("rm", RegisteredModel(name="new", id="2"))
+    rm = cache.get(EntityCache.name_key("rm", "new"), RegisteredModel)
+    assert rm
+    assert rm.id == "2"
+    cache.invalidate("rm", "1")
+    assert cache.get(EntityCache.name_key("rm", "new"), RegisteredModel)
+    assert len(cache) == 2
+
+
+def test_scoped_names():
+    cache = EntityCache()
+    mv = ModelVersion(name="v1", id="1", author="author")
+    cache.put("mv", mv, scoped=True)
+    assert cache.get(EntityCache.name_key("mv", "v1"), ModelVersion) is None
+
+    cache.put("mv", mv, parent_id="rm", scoped=True)
+    # updates don't know about the parent, but keep the key as long as the name matches
+    mv.description = "updated"
+    cache.put("mv", mv, scoped=True)
+    cached = cache.get(EntityCache.name_key("mv", "v1", "rm"), ModelVersion)
+    assert cached
+    assert cached.description == "updated"
+
+
+def test_type_mismatch_is_a_miss():
+    cache = EntityCache()
+    cache.put("art", DocArtifact(name="readme", uri="uri", id="1"))
+    assert cache.get(EntityCache.id_key("art", "1"), ModelArtifact) is None
+    assert cache.get(EntityCache.id_key("art", "1"), DocArtifact)
+
+
+def test_negative_cache():
+    clock = Clock()
+    cache = EntityCache(negative_ttl=2, negative_max_size=2, clock=clock)
+    key = EntityCache.name_key("rm", "model")
+    assert not cache.is_missing(key)
+    cache.put_missing(key)
+    assert cache.is_missing(key)
+    assert (cache.hits, cache.negative_hits) == (1, 1)
+
+    # creating the object forgets it was missing
+    cache.put("rm", RegisteredModel(name="model", id="1"))
+    assert not cache.is_missing(key)
+    assert cache.get(key, RegisteredModel)
+
+    cache.put_missing(key)
+    assert cache.get(key, RegisteredModel) is None
+    clock.now = 2
+    assert not cache.is_missing(key)
+
+    for i in range(3):
+        cache.put_missing(EntityCache.name_key("rm", f"model{i}"))
+    assert not cache.is_missing(EntityCache.name_key("rm", "model0"))
+    assert cache.is_missing(EntityCache.name_key("rm", "model2"))
+
+    cache = EntityCache(negative_ttl=0)
+    cache.put_missing(key)
+    assert not cache.is_missing(key)
+
+
+def test_negative_cache_unknown_parent():
+    cache = EntityCache()
+    key = EntityCache.name_key("art", "model", "mv")
+    cache.put_missing(key)
+    cache.put_missing(EntityCache.name_key("art", "other", "mv"))
+    cache.put("art", ModelArtifact(name="model", uri="uri", id="1"), scoped=True)
+    assert not cache.is_missing(key)
+    assert cache.is_missing(EntityCache.name_key("art", "other", "mv"))
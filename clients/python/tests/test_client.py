@@ -1,11 +1,18 @@
+import asyncio
 import os
 from itertools import islice
 
 import pytest
 
-from model_registry import ModelRegistry, utils
+from model_registry import AsyncModelRegistry, ModelRegistry, utils
+from model_registry.cache import EntityCache
 from model_registry.exceptions import StoreError
-from model_registry.types import ModelArtifact
+from model_registry.types import (
+    InferenceService,
+    ModelArtifact,
+    RegistrationSpec,
+    ServingEnvironment,
+)
 
 
 def test_secure_client():
@@ -78,6 +85,26 @@ def test_register_existing_version(client: ModelRegistry):
         client.register_model(**params, metadata=None)
 
 
+@pytest.mark.e2e
+def test_optimistic_registration(client: ModelRegistry):
+    client._registry._optimistic = True
+    params = {
+        "name": "test_model",
+        "uri": "s3",
+        "model_format_name": "test_format",
+        "model_format_version": "test_version",
+    }
+    rm = client.register_model(**params, version="1.0.0")
+    assert rm.id
+    # the model already exists, so it's looked up after failing to create it
+    assert client.register_model(**params, version="2.0.0").id == rm.id
+    assert client.get_model_artifact("test_model", "2.0.0")
+
+    with pytest.raises(StoreError, match="already exists"):
+        client.register_model(**params, version="1.0.0")
+    assert len(list(client.get_model_versions("test_model"))) == 2
+
+
 @pytest.mark.e2e
 async def test_update_models(client: ModelRegistry):
     name = "test_model"
@@ -227,6 +254,56 @@ async def test_get(client: ModelRegistry):
     assert ma.id == _ma.id
 
 
+@pytest.mark.e2e
+def test_cached_get(client: ModelRegistry):
+    cache = client._api.cache = EntityCache()
+    name = "test_model"
+    version = "1.0.0"
+    client.register_model(
+        name,
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version=version,
+    )
+    misses = cache.misses
+
+    for _ in range(3):
+        assert (ma := client.get_model_artifact(name, version))
+    # the model and version are only looked up the first time, their IDs are kept by the client
+    assert cache.hits == 5
+    assert cache.misses == misses
+
+    ma.description = "updated"
+    client.update(ma)
+    assert (_ma := client.get_model_artifact(name, version))
+    assert _ma.description == "updated"
+    assert cache.misses == misses
+
+    cache.clear()
+    assert client.get_model_artifact(name, version) == _ma
+    assert cache.misses == misses + 1
+
+
+@pytest.mark.e2e
+def test_cached_not_found(client: ModelRegistry):
+    cache = client._api.cache = EntityCache()
+    name = "test_model"
+    for _ in range(3):
+        assert client.get_registered_model(name) is None
+    assert cache.misses == 1
+    assert cache.negative_hits == 2
+
+    client.register_model(
+        name,
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="1.0.0",
+    )
+    assert client.get_registered_model(name)
+
+
 @pytest.mark.e2e
 def test_get_registered_models(client: ModelRegistry):
     models = 21
@@ -553,3 +630,268 @@ def test_hf_import_default_env(client: ModelRegistry):
 
     for k in env_values:
         os.environ.pop(k)
+
+
+@pytest.mark.e2e
+async def test_async_register_and_get(async_client: AsyncModelRegistry):
+    name = "test_model"
+    version = "1.0.0"
+    rm = await async_client.register_model(
+        name,
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version=version,
+        metadata={"a": 1},
+    )
+    assert rm.id
+    assert (_rm := await async_client.get_registered_model(name))
+    assert _rm.id == rm.id
+    assert (mv := await async_client.get_model_version(name, version))
+    assert mv.custom_properties == {"a": 1}
+    assert (ma := await async_client.get_model_artifact(name, version))
+    assert ma.uri == "s3"
+
+    mv.description = "updated"
+    assert (await async_client.update(mv)).description == "updated"
+
+    with pytest.raises(StoreError):
+        await async_client.get_model_version("missing", version)
+
+
+@pytest.mark.e2e
+async def test_async_pagers(async_client: AsyncModelRegistry):
+    for i in range(3):
+        await async_client.register_model(
+            f"test_model{i}",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version="1.0.0",
+        )
+    for i in range(1, 3):
+        await async_client.register_model(
+            "test_model0",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version=f"2.0.{i}",
+        )
+
+    rm_pager = await async_client.get_registered_models()
+    rms = [rm async for rm in rm_pager.page_size(2)]
+    assert len(rms) == 3
+    mv_pager = await async_client.get_model_versions("test_model0")
+    mvs = [mv async for mv in mv_pager.page_size(2)]
+    assert len(mvs) == 3
+    assert [mv async for mv in mv_pager.prefetch(2)] == mvs
+    assert [len(page) async for page in mv_pager.apages()] == [2, 1]
+    raw = [mv async for page in mv_pager.araw_pages() for mv in page]
+    assert [mv["name"] for mv in raw] == [mv.name for mv in mvs]
+    bodies = [body async for body in mv_pager.araw_pages(as_bytes=True)]
+    assert all(isinstance(body, bytes) for body in bodies)
+    assert len(bodies) == 2
+
+
+@pytest.mark.e2e
+def test_prefetch_registered_models(client: ModelRegistry):
+    models = 7
+    for i in range(models):
+        client.register_model(
+            f"test_model{i}",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version="1.0.0",
+        )
+
+    on_demand = list(client.get_registered_models().page_size(2))
+    prefetched = list(client.get_registered_models().page_size(2).prefetch(3))
+    assert len(prefetched) == models
+    assert prefetched == on_demand
+
+
+@pytest.mark.e2e
+def test_registered_model_pages(client: ModelRegistry):
+    for i in range(5):
+        client.register_model(
+            f"test_model{i}",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version="1.0.0",
+        )
+
+    pager = client.get_registered_models().page_size(2)
+    assert [len(page) for page in pager.pages()] == [2, 2, 1]
+    raw = [rm for page in pager.raw_pages() for rm in page]
+    assert [rm["name"] for rm in raw] == [f"test_model{i}" for i in range(5)]
+    assert len(list(pager.raw_pages(as_bytes=True))) == 3
+
+
+@pytest.mark.e2e
+def test_register_models(client: ModelRegistry):
+    specs = [
+        RegistrationSpec(
+            f"model{i % 2}",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version=f"v{i}",
+            metadata={"i": i},
+        )
+        for i in range(6)
+    ]
+    # clashes with the version registered by the first spec
+    specs.append(
+        RegistrationSpec(
+            "model0",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version="v0",
+        )
+    )
+    results = client.register_models(specs, concurrency=3)
+
+    assert [r.spec for r in results] == specs
+    assert sum(not r.ok for r in results) == 1
+    failed = next(r for r in results if not r.ok)
+    assert failed.spec.version == "v0"
+    assert failed.error
+
+    ok = [r for r in results if r.ok]
+    assert len(ok) == 6
+    assert len({r.model.id for r in ok if r.model}) == 2
+    for r in ok:
+        assert r.version
+        assert r.artifact
+        assert r.version.custom_properties == r.spec.metadata
+        mv = client.get_model_version(r.spec.name, r.spec.version)
+        assert mv
+        assert mv.id == r.version.id
+    assert len(list(client.get_registered_models())) == 2
+
+
+@pytest.mark.e2e
+async def test_async_register_models(async_client: AsyncModelRegistry):
+    specs = [
+        RegistrationSpec(
+            "model",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version=f"v{i}",
+        )
+        for i in range(4)
+    ]
+    results = await async_client.register_models(specs, concurrency=2)
+    assert all(r.ok for r in results)
+    assert len({r.model.id for r in results if r.model}) == 1
+
+    with pytest.raises(ValueError, match="Concurrency"):
+        await async_client.register_models(specs, concurrency=0)
+
+
+@pytest.mark.e2e
+async def test_async_watch(async_client: AsyncModelRegistry):
+    await async_client.register_model(
+        "existing",
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="v0",
+    )
+    models = async_client.watch_registered_models(min_interval=0.01)
+    versions = async_client.watch_model_versions("existing", min_interval=0.01)
+    # start both watches before changing anything
+    next_model = asyncio.ensure_future(models.__anext__())
+    next_version = asyncio.ensure_future(versions.__anext__())
+    await asyncio.sleep(0.1)
+
+    await async_client.register_model(
+        "new",
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="v0",
+    )
+    event = await asyncio.wait_for(next_model, 5)
+    assert (event.type, event.object.name) == ("created", "new")
+
+    mv = await async_client.get_model_version("existing", "v0")
+    assert mv
+    mv.description = "updated"
+    await async_client.update(mv)
+    event = await asyncio.wait_for(next_version, 5)
+    assert (event.type, event.object.description) == ("updated", "updated")
+    await models.aclose()
+    await versions.aclose()
+
+    with pytest.raises(StoreError):
+        await async_client.watch_model_versions("missing").__anext__()
+
+
+@pytest.mark.e2e
+async def test_async_watch_inference_services(async_client: AsyncModelRegistry):
+    rm = await async_client.register_model(
+        "model",
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="v0",
+    )
+    assert rm.id
+    events = async_client.watch_inference_services(since=0, min_interval=0.01)
+    env = await async_client._api.upsert_serving_environment(
+        ServingEnvironment(name="env")
+    )
+    assert env.id
+    isvc = await async_client._api.upsert_inference_service(
+        InferenceService(
+            name="isvc", registered_model_id=rm.id, serving_environment_id=env.id
+        )
+    )
+    event = await asyncio.wait_for(events.__anext__(), 5)
+    assert (event.type, event.object) == ("created", isvc)
+    await events.aclose()
+
+    pager = await async_client.get_inference_services("env")
+    assert [isvc] == [isvc async for isvc in pager]
+    assert [env] == [env async for env in await async_client.get_serving_environments()]
+    with pytest.raises(StoreError):
+        await async_client.get_inference_services("missing")
+
+
+@pytest.mark.e2e
+def test_get_inference_services(client: ModelRegistry):
+    rm = client.register_model(
+        "model",
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="v0",
+    )
+    assert rm.id
+    api = client._registry._api
+    for env in ("env0", "env1"):
+        se = client.async_runner(
+            api.upsert_serving_environment(ServingEnvironment(name=env))
+        )
+        assert se.id
+        client.async_runner(
+            api.upsert_inference_service(
+                InferenceService(
+                    name="isvc", registered_model_id=rm.id, serving_environment_id=se.id
+                )
+            )
+        )
+
+    assert [se.name for se in client.get_serving_environments()] == ["env0", "env1"]
+    assert len(list(client.get_inference_services())) == 2
+    services = list(client.get_inference_services("env1"))
+    assert [isvc.serving_environment_id for isvc in services] == [se.id]
+    raw = [
+        isvc for page in client.get_inference_services().raw_pages() for isvc in page
+    ]
+    assert [isvc["name"] for isvc in raw] == ["isvc", "isvc"]
@@ -1,15 +1,25 @@
 """Tests for user facing model registry APIs."""
 
+import asyncio
+
 import pytest
 
 from model_registry.core import ModelRegistryAPIClient
 from model_registry.types import (
     DocArtifact,
+    InferenceService,
+    InferenceServiceState,
     ModelArtifact,
     ModelVersion,
     Pager,
     RegisteredModel,
+    ServeModel,
+    ServingEnvironment,
 )
+from mr_openapi import ModelRegistryServiceApi
+from mr_openapi import RegisteredModel as RegisteredModelBaseModel
+from mr_openapi.exceptions import NotFoundException
+from mr_openapi.transport import PoolStats, get_profile
 
 from .conftest import REGISTRY_HOST, REGISTRY_PORT, cleanup
 
@@ -20,6 +30,119 @@ def client() -> ModelRegistryAPIClient:
     return ModelRegistryAPIClient.insecure_connection(REGISTRY_HOST, REGISTRY_PORT)
 
 
+async def test_client_reuses_session():
+    client = ModelRegistryAPIClient.insecure_connection(REGISTRY_HOST, REGISTRY_PORT)
+    async with client.get_client() as first, client.get_client() as second:
+        assert first.api_client is second.api_client
+
+    await client.close()
+    async with client.get_client() as third:
+        assert third.api_client is not first.api_client
+    await client.close()
+
+
+async def test_client_context_manager_closes_session():
+    client = ModelRegistryAPIClient.insecure_connection(REGISTRY_HOST, REGISTRY_PORT)
+    async with client, client.get_client() as api:
+        session = api.api_client.rest_client.pool_manager
+    assert session.closed
+
+
+async def test_client_transport_profile():
+    client = ModelRegistryAPIClient.insecure_connection(REGISTRY_HOST, REGISTRY_PORT)
+    assert client.pool_stats() is None
+    client.config.transport = get_profile("low_latency").with_options(limit_per_host=4)
+    async with client, client.get_client() as api:
+        session = api.api_client.rest_client.pool_manager
+        assert session.timeout.connect == 2.0
+        assert session.connector.limit_per_host == 4
+        assert client.pool_stats() == PoolStats(
+            limit=100, open=0, idle=0, acquired=0, waiting=0
+        )
+
+    with pytest.raises(ValueError, match="Unknown transport profile"):
+        get_profile("fast")
+
+
+@pytest.fixture
+def slow_reads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Stub registered model reads, recording the ID of each request."""
+    requests = []
+
+    async def get_registered_model(_, id: str) -> RegisteredModelBaseModel:
+        requests.append(id)
+        await asyncio.sleep(0.01)
+        if id == "missing":
+            raise NotFoundException(status=404)
+        return RegisteredModelBaseModel(id=id, name=f"model{id}", state="LIVE")
+
+    monkeypatch.setattr(
+        ModelRegistryServiceApi, "get_registered_model", get_registered_model
+    )
+    return requests
+
+
+async def test_coalesces_concurrent_reads(slow_reads: list[str]):
+    async with ModelRegistryAPIClient.insecure_connection(
+        REGISTRY_HOST, REGISTRY_PORT
+    ) as client:
+        models = await asyncio.gather(
+            *(client.get_registered_model_by_id(id) for id in ["1", "2", "1", "1"])
+        )
+        assert slow_reads == ["1", "2"]
+        assert [rm.name for rm in models if rm] == [
+            "model1",
+            "model2",
+            "model1",
+            "model1",
+        ]
+        # every caller gets its own object
+        assert models[0] == models[2]
+        assert models[0] is not models[2]
+
+        assert await asyncio.gather(
+            client.get_registered_model_by_id("missing"),
+            client.get_registered_model_by_id("missing"),
+        ) == [None, None]
+        assert slow_reads[2:] == ["missing"]
+
+        # later reads aren't coalesced with finished ones
+        await client.get_registered_model_by_id("1")
+        assert slow_reads[3:] == ["1"]
+
+        client.coalesce_reads = False
+        await asyncio.gather(
+            *(client.get_registered_model_by_id("1") for _ in range(2))
+        )
+        assert slow_reads[4:] == ["1", "1"]
+
+
+async def test_coalesced_read_survives_cancellation(slow_reads: list[str]):
+    async with ModelRegistryAPIClient.insecure_connection(
+        REGISTRY_HOST, REGISTRY_PORT
+    ) as client:
+        first = asyncio.ensure_future(client.get_registered_model_by_id("1"))
+        second = asyncio.ensure_future(client.get_registered_model_by_id("1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        rm = await second
+        assert rm
+        assert rm.id == "1"
+        assert first.cancelled()
+        # the second caller made the request again
+        assert slow_reads == ["1", "1"]
+
+
+@pytest.mark.e2e
+async def test_pool_stats(client: ModelRegistryAPIClient):
+    await asyncio.gather(*(client.get_registered_models() for _ in range(4)))
+    stats = client.pool_stats()
+    assert stats
+    # every connection is back in the pool
+    assert stats.acquired == stats.waiting == 0
+    assert 1 <= stats.open == stats.idle <= 4
+
+
 @pytest.mark.e2e
 async def test_insert_registered_model(client: ModelRegistryAPIClient):
     registered_model = RegisteredModel(name="test rm")
@@ -371,3 +494,125 @@ async def test_page_through_model_version_artifacts(
     async for _ in pager:
         total += 1
     assert total == models
+
+
+@pytest.mark.e2e
+async def test_trusted_server_decoding(
+    client: ModelRegistryAPIClient,
+    registered_model: RegisteredModel,
+    model_version: ModelVersion,
+):
+    await client.upsert_model_version_artifact(
+        ModelArtifact(name="ma", uri="uri", custom_properties={"int": 1, "str": "a"}),
+        str(model_version.id),
+    )
+    await client.upsert_model_version_artifact(
+        DocArtifact(name="doc", uri="uri"), str(model_version.id)
+    )
+    trusted = ModelRegistryAPIClient.insecure_connection(REGISTRY_HOST, REGISTRY_PORT)
+    trusted.config.trusted_server = True
+    async with trusted:
+        assert registered_model == await trusted.get_registered_model_by_id(
+            str(registered_model.id)
+        )
+        assert [registered_model] == await trusted.get_registered_models()
+        assert model_version == await trusted.get_model_version_by_params(
+            str(registered_model.id), model_version.name
+        )
+        assert await client.get_model_version_artifacts(
+            str(model_version.id)
+        ) == await trusted.get_model_version_artifacts(str(model_version.id))
+        assert await trusted.get_model_version_by_id("404") is None
+
+
+@pytest.fixture
+async def serving_environment(client: ModelRegistryAPIClient) -> ServingEnvironment:
+    return await client.upsert_serving_environment(
+        ServingEnvironment(name="env", external_id="env id")
+    )
+
+
+@pytest.mark.e2e
+async def test_serving_environment(
+    client: ModelRegistryAPIClient, serving_environment: ServingEnvironment
+):
+    assert serving_environment.id
+    assert serving_environment == await client.get_serving_environment_by_id(
+        serving_environment.id
+    )
+    assert serving_environment == await client.get_serving_environment_by_params("env")
+    assert serving_environment == await client.get_serving_environment_by_params(
+        external_id="env id"
+    )
+    assert [serving_environment] == await client.get_serving_environments()
+
+    serving_environment.description = "lorem ipsum"
+    se = await client.upsert_serving_environment(serving_environment)
+    assert se.description == "lorem ipsum"
+    assert await client.get_serving_environment_by_params("missing") is None
+
+
+@pytest.mark.e2e
+async def test_inference_services(
+    client: ModelRegistryAPIClient,
+    registered_model: RegisteredModel,
+    model_version: ModelVersion,
+    serving_environment: ServingEnvironment,
+):
+    assert serving_environment.id
+    assert registered_model.id
+    results = await client.upsert_inference_services(
+        [
+            InferenceService(
+                name=f"isvc{i}",
+                serving_environment_id=serving_environment.id,
+                registered_model_id=registered_model.id,
+                runtime="vllm",
+            )
+            for i in range(5)
+        ],
+        concurrency=2,
+    )
+    services = [isvc for isvc in results if isinstance(isvc, InferenceService)]
+    assert [isvc.name for isvc in services] == [f"isvc{i}" for i in range(5)]
+    assert all(isvc.id for isvc in services)
+
+    isvc = services[0]
+    assert isvc == await client.get_inference_service_by_id(str(isvc.id))
+    assert isvc == await client.get_inference_service_by_params(
+        serving_environment.id, "isvc0"
+    )
+    pager = Pager(client.get_inference_services).page_size(2)
+    # services are created concurrently, so their IDs may not follow the input order
+    assert sorted([isvc.name async for isvc in pager]) == [f"isvc{i}" for i in range(5)]
+    assert sorted(services, key=lambda isvc: int(str(isvc.id))) == (
+        await client.get_environment_inference_services(serving_environment.id)
+    )
+
+    for isvc in services:
+        isvc.desired_state = InferenceServiceState.UNDEPLOYED
+    services.append(isvc.model_copy(update={"id": "404"}))
+    results = await client.upsert_inference_services(services)
+    assert all(
+        isvc.desired_state == InferenceServiceState.UNDEPLOYED
+        for isvc in results[:-1]
+        if isinstance(isvc, InferenceService)
+    )
+    assert isinstance(results[-1], Exception)
+
+    sm = await client.create_serve_model(
+        ServeModel(model_version_id=str(model_version.id)), str(isvc.id)
+    )
+    assert sm.id
+    assert [sm] == await client.get_serve_models(str(isvc.id))
+
+    with pytest.raises(ValueError, match="Concurrency"):
+        await client.upsert_inference_services(services, concurrency=0)
+
+    trusted = ModelRegistryAPIClient.insecure_connection(REGISTRY_HOST, REGISTRY_PORT)
+    trusted.config.trusted_server = True
+    async with trusted:
+        assert await client.get_inference_services() == (
+            await trusted.get_inference_services()
+        )
+        assert [sm] == await trusted.get_serve_models(str(isvc.id))
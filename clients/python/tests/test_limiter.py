@@ -0,0 +1,148 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from model_registry import AsyncModelRegistry
+from mr_openapi import retry
+from mr_openapi.limiter import AdaptiveLimiter, AIMDLimiter, LimiterPolicy
+from mr_openapi.retry import RetryPolicy
+
+
+class FakeResponse:
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.headers: dict[str, str] = {}
+
+    def release(self) -> None:
+        pass
+
+
+class Server:
+    """Answers each request once released, recording how many are in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def request(self, status: int = 200) -> FakeResponse:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await self.release.wait()
+            await asyncio.sleep(0)
+            return FakeResponse(status)
+        finally:
+            self.in_flight -= 1
+
+
+async def test_limits_concurrency():
+    server = Server()
+    server.release.clear()
+    limiter = AIMDLimiter(LimiterPolicy(initial=3))
+    requests = [asyncio.ensure_future(limiter.run(server.request)) for _ in range(10)]
+    await asyncio.sleep(0.01)
+    assert server.in_flight == limiter.in_flight == 3
+
+    server.release.set()
+    await asyncio.gather(*requests)
+    assert limiter.in_flight == 0
+    # about one more per round-trip
+    assert limiter.limit == 5
+    assert server.max_in_flight <= limiter.limit
+
+
+async def test_cuts_on_overload():
+    now = 0.0
+    limiter = AIMDLimiter(
+        LimiterPolicy(initial=8, min_limit=2, max_limit=8), clock=lambda: now
+    )
+    for _ in range(20):
+        await limiter.run(Server().request)
+    assert limiter.limit == 8
+
+    await limiter.run(lambda: Server().request(503))
+    assert limiter.limit == 4
+
+    # requests in flight when the limit was cut don't cut it again
+    now = -1
+    await limiter.run(lambda: Server().request(503))
+    assert limiter.limit == 4
+
+    async def fail() -> FakeResponse:
+        raise aiohttp.ServerDisconnectedError
+
+    now = 1
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await limiter.run(fail)
+    now = 2
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await limiter.run(fail)
+    assert limiter.limit == 2
+
+
+async def test_cuts_on_latency_spikes():
+    now = 0.0
+    limiter = AIMDLimiter(LimiterPolicy(initial=10), clock=lambda: now)
+
+    async def request(latency: float) -> FakeResponse:
+        nonlocal now
+        now += latency
+        return FakeResponse()
+
+    for _ in range(5):
+        await limiter.run(lambda: request(0.1))
+    assert limiter.limit == 10
+    await limiter.run(lambda: request(1.0))
+    assert limiter.limit == 5
+
+    with pytest.raises(ValueError, match="min_limit"):
+        AIMDLimiter(LimiterPolicy(initial=0))
+
+
+async def test_retries_are_timed_apart(monkeypatch: pytest.MonkeyPatch):
+    now = 0.0
+    limiter = AIMDLimiter(LimiterPolicy(initial=10), clock=lambda: now)
+    statuses = iter([200, 500, 200])
+
+    async def request() -> FakeResponse:
+        nonlocal now
+        now += 0.1
+        return FakeResponse(next(statuses))
+
+    async def sleep(delay: float) -> None:
+        nonlocal now
+        now += 10
+
+    monkeypatch.setattr(retry.asyncio, "sleep", sleep)
+    policy = RetryPolicy(statuses=frozenset({500}))
+    for _ in range(2):
+        response = await retry.send(
+            lambda: limiter.run(request), method="GET", attempts=2, policy=policy
+        )
+        assert response.status == 200
+    # the backoff isn't taken for a latency spike
+    assert limiter.limit == 10
+    assert limiter.in_flight == 0
+
+
+def test_lanes():
+    limiter = AdaptiveLimiter(reads=LimiterPolicy())
+    assert limiter.lane("get") is limiter.reads
+    assert limiter.lane("POST") is limiter.writes is None
+
+
+@pytest.mark.e2e
+async def test_limited_client(async_client: AsyncModelRegistry):
+    api = async_client._api
+    api.config.read_limit = LimiterPolicy(initial=2)
+    # applied to new sessions
+    await api.close()
+    await asyncio.gather(*(api.get_registered_models() for _ in range(10)))
+    async with api.get_client() as client:
+        lane = client.api_client.rest_client.limiter.reads
+    assert lane
+    assert lane.in_flight == 0
+    assert lane.limit > 2
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from model_registry import AsyncModelRegistry
+from model_registry.loader import BatchLoader
+from model_registry.types import ListOptions, RegisteredModel
+
+
+class Store:
+    """Registered models, fetched by ID or listed a page at a time."""
+
+    def __init__(self, count: int, page_size: int = 2):
+        self.items = {
+            str(i): RegisteredModel(name=f"model{i}", id=str(i)) for i in range(count)
+        }
+        self.page_size = page_size
+        self.fetched: list[str] = []
+        self.pages = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def fetch(self, id: str) -> RegisteredModel | None:
+        self.fetched.append(id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            if id == "error":
+                msg = "fetch failed"
+                raise RuntimeError(msg)
+            return self.items.get(id)
+        finally:
+            self.in_flight -= 1
+
+    async def scan(self, options: ListOptions) -> list[RegisteredModel]:
+        self.pages += 1
+        items = list(self.items.values())
+        start = int(options.next_page_token or 0)
+        end = start + self.page_size
+        options.next_page_token = str(end) if end < len(items) else ""
+        return items[start:end]
+
+
+async def test_batches_lookups():
+    store = Store(5)
+    loader = BatchLoader(store.fetch, concurrency=2)
+    models = await asyncio.gather(
+        *(loader.load(id) for id in ["0", "1", "0", "missing", "4"])
+    )
+    assert [rm.name if rm else None for rm in models] == [
+        "model0",
+        "model1",
+        "model0",
+        None,
+        "model4",
+    ]
+    # deduplicated, and every lookup gets its own copy
+    assert sorted(store.fetched) == ["0", "1", "4", "missing"]
+    assert models[0] is not models[2]
+    assert store.max_in_flight == 2
+
+    # the next batch is sent separately
+    assert await loader.load_many(["0", "2"]) == [store.items["0"], store.items["2"]]
+    assert store.fetched[4:] == ["0", "2"]
+
+
+async def test_errors_only_fail_their_lookups():
+    loader = BatchLoader(Store(2).fetch)
+    ok, failed = await asyncio.gather(
+        loader.load("1"), loader.load("error"), return_exceptions=True
+    )
+    assert isinstance(ok, RegisteredModel)
+    assert isinstance(failed, RuntimeError)
+
+    with pytest.raises(ValueError, match="Concurrency"):
+        BatchLoader(Store(0).fetch, concurrency=0)
+
+
+async def test_scans_large_batches():
+    store = Store(10)
+    loader = BatchLoader(store.fetch, scan=store.scan, scan_threshold=3)
+    assert await loader.load_many(["1", "3"]) == [store.items["1"], store.items["3"]]
+    assert store.pages == 0
+
+    assert await loader.load_many(["1", "3", "5"]) == [
+        store.items["1"],
+        store.items["3"],
+        store.items["5"],
+    ]
+    # stops once every object is found
+    assert store.pages == 3
+    assert store.fetched == ["1", "3"]
+
+    store.pages = 0
+    assert await loader.load_many(["9", "missing", "2"]) == [
+        store.items["9"],
+        None,
+        store.items["2"],
+    ]
+    # every page, then the first one again, as the list loops back
+    assert store.pages == 6
+
+
+async def test_interrupted_batches_cancel_their_lookups():
+    blocked = asyncio.Event()
+
+    async def fetch(id: str) -> RegisteredModel | None:
+        await blocked.wait()
+        return None
+
+    loader = BatchLoader(fetch)
+    lookups = asyncio.gather(loader.load("1"), loader.load("2"))
+    await asyncio.sleep(0.01)
+    for task in loader._tasks:
+        task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(lookups, 1)
+
+    class Interrupted(BaseException):
+        pass
+
+    async def scan(options: ListOptions) -> list[RegisteredModel]:
+        raise Interrupted
+
+    loader = BatchLoader(fetch, scan=scan, scan_threshold=1)
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(loader.load("1"), 1)
+
+
+@pytest.mark.e2e
+async def test_load_model_versions(async_client: AsyncModelRegistry):
+    for i in range(3):
+        await async_client.register_model(
+            "model",
+            "s3",
+            model_format_name="test_format",
+            model_format_version="test_version",
+            version=f"v{i}",
+        )
+    versions = [mv async for mv in await async_client.get_model_versions("model")]
+    ids = [str(mv.id) for mv in versions]
+
+    loader = BatchLoader.model_versions(async_client._api)
+    assert await loader.load_many([*ids, "0"]) == [*versions, None]
+    loader = BatchLoader.model_versions(async_client._api, scan_threshold=2)
+    assert await loader.load_many(reversed(ids)) == versions[::-1]
@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import itertools
+from typing import Any
+
+import pytest
+
+from model_registry import AsyncModelRegistry
+from model_registry.mirror import RegistryMirror
+from model_registry.types import (
+    ListOptions,
+    ModelArtifact,
+    ModelVersion,
+    RegisteredModel,
+)
+from model_registry.types.options import OrderByField
+
+
+class FakeRegistry:
+    """Registry listing objects by update time, with update times set by the tests."""
+
+    def __init__(self):
+        self.ids = itertools.count(1)
+        self.models: dict[str, RegisteredModel] = {}
+        self.versions: dict[str, tuple[str, ModelVersion]] = {}
+        self.artifacts: dict[str, tuple[str | None, ModelArtifact]] = {}
+        # IDs of the versions whose artifacts were listed
+        self.scans: list[str] = []
+
+    def add_model(self, name: str, updated: int) -> str:
+        obj_id = str(next(self.ids))
+        self.models[obj_id] = RegisteredModel(
+            id=obj_id, name=name, last_update_time_since_epoch=str(updated)
+        )
+        return obj_id
+
+    def add_version(self, rm_id: str, name: str, updated: int) -> str:
+        obj_id = str(next(self.ids))
+        mv = ModelVersion(
+            id=obj_id, name=name, last_update_time_since_epoch=str(updated)
+        )
+        self.versions[obj_id] = (rm_id, mv)
+        return obj_id
+
+    def add_artifact(self, mv_id: str | None, name: str, updated: int) -> str:
+        obj_id = str(next(self.ids))
+        ma = ModelArtifact(
+            id=obj_id,
+            name=name,
+            uri=f"s3://{name}",
+            last_update_time_since_epoch=str(updated),
+        )
+        self.artifacts[obj_id] = (mv_id, ma)
+        return obj_id
+
+    def update_version(self, mv_id: str, updated: int, **changes: Any) -> None:
+        rm_id, mv = self.versions[mv_id]
+        changes["last_update_time_since_epoch"] = str(updated)
+        self.versions[mv_id] = (rm_id, mv.model_copy(update=changes))
+
+    @staticmethod
+    def page(items: list[Any], options: ListOptions | None) -> list[Any]:
+        options = options or ListOptions()
+        if options.order_by == OrderByField.LAST_UPDATE_TIME:
+            items = sorted(
+                items,
+                key=lambda obj: int(obj.last_update_time_since_epoch),
+                reverse=not options.is_asc,
+            )
+        size = options.limit or len(items)
+        start = int(options.next_page_token or 0)
+        end = start + size
+        # loops back to the first page like the server
+        options.next_page_token = str(end) if end < len(items) else ""
+        return items[start:end]
+
+    async def get_registered_models(
+        self, options: ListOptions | None = None
+    ) -> list[RegisteredModel]:
+        return self.page(list(self.models.values()), options)
+
+    async def get_model_versions_raw(
+        self, options: ListOptions | None = None
+    ) -> list[dict[str, Any]]:
+        payloads = {
+            mv.id: {
+                "id": mv.id,
+                "name": mv.name,
+                "description": mv.description,
+                "registeredModelId": rm_id,
+                "lastUpdateTimeSinceEpoch": mv.last_update_time_since_epoch,
+            }
+            for rm_id, mv in self.versions.values()
+        }
+        page = self.page([mv for _, mv in self.versions.values()], options)
+        return [payloads[mv.id] for mv in page]
+
+    async def get_model_artifacts(
+        self, model_version_id: str | None = None, options: ListOptions | None = None
+    ) -> list[ModelArtifact]:
+        if model_version_id is None:
+            return self.page([ma for _, ma in self.artifacts.values()], options)
+        if not options or not options.next_page_token:
+            self.scans.append(model_version_id)
+        artifacts = [
+            ma for mv_id, ma in self.artifacts.values() if mv_id == model_version_id
+        ]
+        return self.page(artifacts, options)
+
+
+@pytest.fixture
+def registry() -> FakeRegistry:
+    registry = FakeRegistry()
+    for i in range(3):
+        rm_id = registry.add_model(f"model{i}", updated=100)
+        for v in range(2):
+            mv_id = registry.add_version(rm_id, f"v{v}", updated=100)
+            registry.add_artifact(mv_id, f"model{i}", updated=100)
+    return registry
+
+
+async def test_sync_only_fetches_changes(registry: FakeRegistry):
+    mirror = RegistryMirror(registry, page_size=2)  # type: ignore[arg-type]
+    assert await mirror.sync() == 3 + 6 + 6
+    assert mirror.stats.watermark == 100
+    # every object is at the watermark, none of them changed since
+    for _ in range(3):
+        assert await mirror.sync() == 0
+        assert mirror.stats.last_changes == 0
+
+    mv_id = next(iter(registry.versions))
+    registry.update_version(mv_id, updated=101, description="updated")
+    assert await mirror.sync() == 1
+    mv = mirror.get_model_version("model0", "v0")
+    assert mv
+    assert mv.description == "updated"
+    assert await mirror.sync() == 0
+
+    # objects updated in the same millisecond as the watermark, after the last sync
+    rm_id = next(iter(registry.models))
+    new_mv = registry.add_version(rm_id, "v2", updated=101)
+    registry.add_artifact(new_mv, "model0", updated=101)
+    scans = len(registry.scans)
+    assert await mirror.sync() == 2
+    assert registry.scans[scans:] == [new_mv]
+    ma = mirror.get_model_artifact("model0", "v2")
+    assert ma
+    assert ma.uri == "s3://model0"
+    assert await mirror.sync() == 0
+    assert mirror.stats.watermark == 101
+
+
+async def test_sync_looks_for_orphan_artifacts_once(registry: FakeRegistry):
+    rm_id = next(iter(registry.models))
+    bare = registry.add_version(rm_id, "bare", updated=100)
+    mirror = RegistryMirror(registry)  # type: ignore[arg-type]
+    await mirror.load()
+
+    # artifacts without a version may belong to one that had none
+    registry.add_artifact(None, "orphan", updated=200)
+    scans = len(registry.scans)
+    assert await mirror.sync() == 0
+    assert registry.scans[scans:] == [bare]
+    for _ in range(3):
+        assert await mirror.sync() == 0
+    assert registry.scans[scans:] == [bare]
+
+    # and is found once it gets a version
+    registry.add_artifact(bare, "model0", updated=200)
+    assert await mirror.sync() == 1
+    assert registry.scans[scans:] == [bare, bare]
+    assert mirror.get_model_artifact("model0", "bare")
+    assert await mirror.sync() == 0
+    assert registry.scans[scans:] == [bare, bare]
+
+
+async def register(client: AsyncModelRegistry, name: str, version: str):
+    return await client.register_model(
+        name,
+        f"s3://{name}/{version}",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version=version,
+    )
+
+
+@pytest.mark.e2e
+async def test_mirror_load(async_client: AsyncModelRegistry):
+    for i in range(3):
+        for v in range(2):
+            await register(async_client, f"model{i}", f"v{v}")
+
+    mirror = RegistryMirror(async_client._api, page_size=2)
+    assert mirror.staleness is None
+    assert await mirror.load() == 3 + 6 + 6
+    assert mirror.stats.syncs == 1
+    assert mirror.staleness is not None
+
+    for i in range(3):
+        rm = mirror.get_registered_model(f"model{i}")
+        assert rm
+        assert rm == await async_client.get_registered_model(f"model{i}")
+        assert [mv.name for mv in mirror.get_model_versions(f"model{i}")] == [
+            "v0",
+            "v1",
+        ]
+        ma = mirror.get_model_artifact(f"model{i}", "v1")
+        assert ma
+        assert ma.uri == f"s3://model{i}/v1"
+    assert mirror.get_model_version("model0", "v2") is None
+    assert mirror.get_model_artifact("missing", "v0") is None
+
+
+@pytest.mark.e2e
+async def test_mirror_sync(async_client: AsyncModelRegistry):
+    await register(async_client, "model", "v0")
+    mirror = RegistryMirror(async_client._api)
+    assert await mirror.sync() == 3
+    watermark = mirror.stats.watermark
+    assert watermark
+
+    mv = await async_client.get_model_version("model", "v0")
+    assert mv
+    mv.description = "updated"
+    await async_client.update(mv)
+    await register(async_client, "model", "v1")
+    await register(async_client, "other", "v0")
+
+    assert await mirror.sync() >= 6
+    assert mirror.stats.syncs == 2
+    assert mirror.stats.watermark > watermark
+    _mv = mirror.get_model_version("model", "v0")
+    assert _mv
+    assert _mv.description == "updated"
+    assert mirror.get_model_artifact("model", "v1")
+    assert mirror.get_model_artifact("other", "v0")
+
+    # artifacts added to known versions are found as well
+    rm = await async_client.get_registered_model("model")
+    assert rm
+    ma = await async_client.get_model_artifact("model", "v1")
+    assert ma
+    ma.description = "updated"
+    await async_client.update(ma)
+    await mirror.sync()
+    _ma = mirror.get_model_artifact("model", "v1")
+    assert _ma
+    assert _ma.description == "updated"
+
+
+@pytest.mark.e2e
+async def test_mirror_snapshot(async_client: AsyncModelRegistry, tmp_path):
+    await register(async_client, "model", "v0")
+    mirror = RegistryMirror(async_client._api)
+    await mirror.load()
+    mirror.save(tmp_path / "registry.snap")
+
+    await register(async_client, "model", "v1")
+    restored = RegistryMirror(async_client._api)
+    assert restored.load_snapshot(tmp_path / "registry.snap") == 3
+    assert restored.get_model_artifact("model", "v0") == mirror.get_model_artifact(
+        "model", "v0"
+    )
+    assert restored.get_model_version("model", "v1") is None
+
+    # catching up only fetches what changed since the snapshot
+    assert await restored.sync() >= 2
+    assert restored.get_model_artifact("model", "v1")
+    assert [mv.name for mv in restored.get_model_versions("model")] == ["v0", "v1"]
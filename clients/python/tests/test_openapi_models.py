@@ -0,0 +1,167 @@
+import json
+import os
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+from mr_openapi import (
+    ApiClient,
+    Artifact,
+    ArtifactList,
+    Configuration,
+    DocArtifact,
+    MetadataIntValue,
+    MetadataStringValue,
+    MetadataValue,
+    ModelArtifact,
+    RegisteredModelCreate,
+    RegisteredModelState,
+)
+from mr_openapi.codec import get_codec
+from mr_openapi.transport import release_connector, ssl_context
+
+
+def test_metadata_value_from_dict():
+    value = MetadataValue.from_dict(
+        {"int_value": "1", "metadataType": "MetadataIntValue"}
+    )
+    assert isinstance(value.actual_instance, MetadataIntValue)
+    assert value.actual_instance.int_value == "1"
+    assert value == MetadataValue.from_json(
+        '{"int_value": "1", "metadataType": "MetadataIntValue"}'
+    )
+
+    other = MetadataValue.from_dict(
+        {"string_value": "a", "metadataType": "MetadataStringValue"}
+    )
+    assert isinstance(other.actual_instance, MetadataStringValue)
+    assert isinstance(value.actual_instance, MetadataIntValue)
+
+
+def test_metadata_value_without_discriminator():
+    with pytest.raises(ValueError, match="metadataType"):
+        MetadataValue.from_dict({"int_value": "1"})
+    # unknown discriminators fall back to matching every schema
+    value = MetadataValue.from_dict(
+        {"int_value": "1", "metadataType": "MetadataUnknownValue"}
+    )
+    assert isinstance(value.actual_instance, MetadataIntValue)
+
+
+def test_artifact_list_from_dict():
+    custom_properties = {
+        f"key{i}": {"string_value": f"value{i}", "metadataType": "MetadataStringValue"}
+        for i in range(3)
+    }
+    payload = {
+        "items": [
+            {
+                "id": "1",
+                "name": "model",
+                "artifactType": "model-artifact",
+                "customProperties": custom_properties,
+            },
+            {"id": "2", "name": "doc", "artifactType": "doc-artifact"},
+        ],
+        "nextPageToken": "",
+        "pageSize": 2,
+        "size": 2,
+    }
+    artifacts = ArtifactList.from_dict(payload)
+    assert artifacts
+    assert artifacts.items
+    model, doc = (a.actual_instance for a in artifacts.items)
+    assert isinstance(model, ModelArtifact)
+    assert isinstance(doc, DocArtifact)
+    assert model.custom_properties
+    assert model.custom_properties["key2"].actual_instance == MetadataStringValue(
+        string_value="value2", metadataType="MetadataStringValue"
+    )
+    assert Artifact.from_json(json.dumps(payload["items"][0])) == artifacts.items[0]
+    assert artifacts.to_dict()["items"][0]["customProperties"] == custom_properties
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs(name: str):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    data = {"name": "modèle", "state": RegisteredModelState.LIVE, "items": [1, 2.5]}
+    encoded = codec.dumps(data)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == {**data, "state": "LIVE"}
+    assert codec.loads(encoded) == codec.loads(encoded.decode()) == json.loads(encoded)
+    with pytest.raises(ValueError):  # noqa: PT011
+        codec.loads(b"not json")
+
+
+def test_unknown_codec():
+    assert get_codec().name in ("json", "orjson", "msgspec")
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("yaml")
+
+
+async def test_api_client_uses_codec():
+    config = Configuration()
+    config.codec = get_codec("json")
+    api_client = ApiClient(config)
+    await api_client.close()
+
+    body = RegisteredModelCreate(
+        name="model",
+        state=RegisteredModelState.LIVE,
+        customProperties={
+            "key": MetadataValue.from_dict(
+                {"string_value": "a", "metadataType": "MetadataStringValue"}
+            )
+        },
+    )
+    _, _, _, encoded, _ = api_client.param_serialize("POST", "/models", body=body)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == body.to_dict() | {"state": "LIVE"}
+
+    rm = api_client.deserialize(encoded, "RegisteredModel")
+    assert rm == api_client.deserialize(encoded.decode(), "RegisteredModel")
+    assert rm.custom_properties["key"].actual_instance.string_value == "a"
+    assert api_client.deserialize(b"not json", "str") == "not json"
+
+
+def test_ssl_contexts_are_cached(tmp_path):
+    certifi = pytest.importorskip("certifi")
+    ca = tmp_path / "ca.pem"
+    ca.write_bytes(Path(certifi.where()).read_bytes())
+    context = ssl_context(str(ca))
+    assert ssl_context(str(ca)) is context
+    assert ssl_context(str(ca), verify=False) is not context
+
+    # reloaded once the file changes
+    os.utime(ca, ns=(0, 0))
+    assert ssl_context(str(ca)) is not context
+
+
+async def test_shared_connector():
+    def client(host: str) -> ApiClient:
+        config = Configuration(host)
+        config.share_connector = True
+        return ApiClient(config)
+
+    first, second, other = client("http://a"), client("http://a"), client("http://b")
+    connector = first.rest_client.pool_manager.connector
+    assert connector is second.rest_client.pool_manager.connector
+    assert connector is not other.rest_client.pool_manager.connector
+
+    await first.close()
+    await first.close()
+    assert not connector.closed
+    await second.close()
+    assert connector.closed
+    await other.close()
+
+
+async def test_release_unknown_connector():
+    connector = aiohttp.TCPConnector()
+    await release_connector(connector)
+    assert not connector.closed
+    await connector.close()
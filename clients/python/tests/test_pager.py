@@ -0,0 +1,189 @@
+import asyncio
+import json
+import threading
+
+import pytest
+
+from model_registry.types import ListOptions, Pager, RegisteredModel
+from model_registry.types.pager import _PrefetchThread
+
+
+class Pages:
+    """Pages over `n` models, looping back to the first page like the server does."""
+
+    def __init__(self, n: int, size: int = 2):
+        self.items = [RegisteredModel(name=f"rm{i}") for i in range(n)]
+        self.size = size
+        self.calls = 0
+
+    def fetch(self, options: ListOptions) -> list[RegisteredModel]:
+        self.calls += 1
+        start = int(options.next_page_token or 0)
+        end = start + self.size
+        options.next_page_token = str(end) if end < len(self.items) else ""
+        return self.items[start:end]
+
+
+class AsyncPages(Pages):
+    async def fetch(self, options: ListOptions) -> list[RegisteredModel]:  # type: ignore[override]
+        await asyncio.sleep(0)
+        return super().fetch(options)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 6])
+def test_prefetch_matches_on_demand(n: int):
+    pages = Pages(n)
+    expected = list(Pager(pages.fetch))
+    calls = pages.calls
+
+    pages.calls = 0
+    assert list(Pager(pages.fetch).prefetch(2)) == expected
+    assert pages.calls == calls
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 6])
+async def test_async_prefetch_matches_on_demand(n: int):
+    pages = AsyncPages(n)
+    expected = [rm async for rm in Pager(pages.fetch)]
+    calls = pages.calls
+
+    pages.calls = 0
+    assert [rm async for rm in Pager(pages.fetch).prefetch(2)] == expected
+    assert pages.calls == calls
+
+
+@pytest.mark.parametrize("token", [None, ""])
+def test_single_page_fetched_once(token: str | None):
+    calls = 0
+
+    def page_fn(options: ListOptions) -> list[RegisteredModel]:
+        nonlocal calls
+        calls += 1
+        options.next_page_token = token
+        return [RegisteredModel(name="rm")]
+
+    for pager in (Pager(page_fn), Pager(page_fn).prefetch(2)):
+        calls = 0
+        assert [rm.name for rm in pager] == ["rm"]
+        assert [len(page) for page in pager.pages()] == [1]
+        if isinstance(pager._prefetcher, _PrefetchThread):
+            pager._prefetcher._thread.join(timeout=5)
+        assert calls == 2
+
+
+@pytest.mark.parametrize("token", [None, ""])
+async def test_async_single_page_fetched_once(token: str | None):
+    calls = 0
+
+    async def page_fn(options: ListOptions) -> list[RegisteredModel]:
+        nonlocal calls
+        calls += 1
+        options.next_page_token = token
+        return [RegisteredModel(name="rm")]
+
+    for pager in (Pager(page_fn), Pager(page_fn).prefetch(2)):
+        calls = 0
+        assert [rm.name async for rm in pager] == ["rm"]
+        assert [len(page) async for page in pager.apages()] == [1]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert calls == 2
+
+
+def test_prefetch_fetches_ahead():
+    fetched = threading.Semaphore(0)
+    pages = Pages(10)
+
+    def page_fn(options: ListOptions) -> list[RegisteredModel]:
+        page = pages.fetch(options)
+        fetched.release()
+        return page
+
+    pager = Pager(page_fn).prefetch(2)
+    assert next(pager).name == "rm0"
+    # the first page, plus two more in the background while it's consumed
+    for _ in range(3):
+        assert fetched.acquire(timeout=5)
+    assert pager._i == 1
+    assert [rm.name for rm in pager] == [f"rm{i}" for i in range(1, 10)]
+
+
+async def test_async_prefetch_fetches_ahead():
+    pages = AsyncPages(10)
+    pager = Pager(pages.fetch).prefetch(2)
+    assert (await pager.__anext__()).name == "rm0"
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert pages.calls == 3
+    assert [rm.name async for rm in pager] == [f"rm{i}" for i in range(1, 10)]
+
+
+def test_prefetch_raises_page_errors():
+    def page_fn(options: ListOptions) -> list[RegisteredModel]:
+        raise RuntimeError(options.next_page_token)
+
+    with pytest.raises(RuntimeError):
+        next(Pager(page_fn).prefetch())
+
+
+async def test_prefetch_restart():
+    pages = AsyncPages(10)
+    pager = Pager(pages.fetch).prefetch(3)
+    assert (await pager.__anext__()).name == "rm0"
+    pager.page_size(5)
+    assert [rm.name async for rm in pager] == [f"rm{i}" for i in range(10)]
+
+    with pytest.raises(ValueError, match="negative"):
+        pager.prefetch(-1)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 6])
+def test_pages(n: int):
+    pages = Pages(n)
+    expected = list(Pager(pages.fetch))
+    pager = Pager(pages.fetch)
+    assert [rm for page in pager.pages() for rm in page] == expected
+    assert all(len(page) <= 2 for page in pager.pages())
+    assert [rm for page in pager.prefetch(1).pages() for rm in page] == expected
+
+
+@pytest.mark.parametrize("n", [1, 5])
+async def test_apages(n: int):
+    pages = AsyncPages(n)
+    expected = [rm async for rm in Pager(pages.fetch)]
+    pager = Pager(pages.fetch)
+    assert [rm async for page in pager.apages() for rm in page] == expected
+    pager.prefetch(2)
+    assert [rm async for page in pager.apages() for rm in page] == expected
+
+
+def test_raw_pages():
+    pages = Pages(5)
+
+    def raw_page_fn(options: ListOptions, as_bytes: bool):
+        page = [rm.model_dump() for rm in pages.fetch(options)]
+        return json.dumps(page).encode() if as_bytes else page
+
+    pager = Pager(pages.fetch, raw_page_fn=raw_page_fn)
+    raw = list(pager.raw_pages())
+    assert [item["name"] for page in raw for item in page] == [
+        f"rm{i}" for i in range(5)
+    ]
+    assert [json.loads(body) for body in pager.raw_pages(as_bytes=True)] == raw
+
+    with pytest.raises(ValueError, match="raw_page_fn"):
+        Pager(pages.fetch).raw_pages()
+
+
+async def test_pages_match_page_fn():
+    async_pager = Pager(AsyncPages(5).fetch, raw_page_fn=AsyncPages(5).fetch)
+    with pytest.raises(TypeError, match=r"apages\(\)"):
+        async_pager.pages()
+    with pytest.raises(TypeError, match=r"araw_pages\(\)"):
+        async_pager.raw_pages()
+
+    pager = Pager(Pages(5).fetch, raw_page_fn=Pages(5).fetch)
+    with pytest.raises(TypeError, match=r"use pages\(\)"):
+        await pager.apages().__anext__()
+    with pytest.raises(TypeError, match=r"use raw_pages\(\)"):
+        await pager.araw_pages().__anext__()
@@ -0,0 +1,188 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from model_registry import AsyncModelRegistry
+from model_registry.recorder import ServeRecorder
+from model_registry.types import (
+    ExecutionState,
+    InferenceService,
+    ServeModel,
+    ServingEnvironment,
+)
+from mr_openapi.exceptions import ApiException
+
+
+class FakeApi:
+    def __init__(self, failures: int = 0, error: Exception | None = None):
+        self.recorded: list[tuple[str, ServeModel]] = []
+        self.failures = failures
+        self.error = error or ApiException(status=503)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def create_serve_model(
+        self, serve_model: ServeModel, inference_service_id: str
+    ) -> ServeModel:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            await self.release.wait()
+            if self.failures:
+                self.failures -= 1
+                raise self.error
+            self.recorded.append((inference_service_id, serve_model))
+            return serve_model
+        finally:
+            self.in_flight -= 1
+
+
+def serve(version: str, state: ExecutionState = ExecutionState.RUNNING) -> ServeModel:
+    return ServeModel(model_version_id=version, last_known_state=state)
+
+
+async def test_records_concurrently():
+    api = FakeApi()
+    async with ServeRecorder(api, concurrency=3) as recorder:  # type: ignore[arg-type]
+        for i in range(10):
+            await recorder.record(f"isvc{i}", serve("mv"))
+    assert len(api.recorded) == 10
+    assert api.max_in_flight == 3
+    assert recorder.stats.recorded == 10
+    assert recorder.queue_depth == recorder.in_flight == 0
+
+
+async def test_coalesces_queued_events():
+    api = FakeApi()
+    api.release.clear()
+    recorder = ServeRecorder(api, concurrency=1)  # type: ignore[arg-type]
+    await recorder.record("isvc", serve("mv1", ExecutionState.NEW))
+    await asyncio.sleep(0)
+    # the first event is being sent, the next ones wait behind it
+    for state in (ExecutionState.RUNNING, ExecutionState.COMPLETE):
+        await recorder.record("isvc", serve("mv1", state))
+    await recorder.record("isvc", serve("mv2"))
+    assert (recorder.in_flight, recorder.queue_depth) == (1, 2)
+
+    api.release.set()
+    await recorder.close()
+    assert [(sm.model_version_id, sm.last_known_state) for _, sm in api.recorded] == [
+        ("mv1", ExecutionState.NEW),
+        ("mv1", ExecutionState.COMPLETE),
+        ("mv2", ExecutionState.RUNNING),
+    ]
+    assert recorder.stats.coalesced == 1
+
+
+async def test_backpressure():
+    api = FakeApi()
+    api.release.clear()
+    recorder = ServeRecorder(api, max_queue=2, concurrency=1)  # type: ignore[arg-type]
+    for i in range(3):
+        await recorder.record(f"isvc{i}", serve("mv"))
+    await asyncio.sleep(0)
+
+    blocked = asyncio.ensure_future(recorder.record("isvc3", serve("mv")))
+    await asyncio.sleep(0)
+    assert not blocked.done()
+    # coalesced events don't need room
+    await recorder.record("isvc2", serve("mv", ExecutionState.COMPLETE))
+
+    api.release.set()
+    await blocked
+    await recorder.close()
+    assert len(api.recorded) == 4
+
+
+async def test_retries():
+    api = FakeApi(failures=2)
+    async with ServeRecorder(api, retry_delay=0) as recorder:  # type: ignore[arg-type]
+        await recorder.record("isvc", serve("mv"))
+    assert len(api.recorded) == 1
+    assert (recorder.stats.retries, recorder.stats.failed) == (2, 0)
+
+    connection_error = aiohttp.ClientConnectorError(
+        connection_key=None,  # type: ignore[arg-type]
+        os_error=OSError("refused"),
+    )
+    api = FakeApi(failures=1, error=connection_error)
+    async with ServeRecorder(api, retry_delay=0) as recorder:  # type: ignore[arg-type]
+        await recorder.record("isvc", serve("mv"))
+    assert len(api.recorded) == 1
+    assert (recorder.stats.retries, recorder.stats.failed) == (1, 0)
+
+    # the server may have created the serve model already
+    for error in (
+        ApiException(status=400),
+        ApiException(status=500),
+        ApiException(status=502),
+        asyncio.TimeoutError(),
+        aiohttp.ServerDisconnectedError(),
+    ):
+        api = FakeApi(failures=1, error=error)
+        async with ServeRecorder(api, retry_delay=0) as recorder:  # type: ignore[arg-type]
+            await recorder.record("isvc", serve("mv"))
+        assert not api.recorded
+        assert (recorder.stats.retries, recorder.stats.failed) == (0, 1)
+        assert recorder.stats.last_error is error
+
+    api = FakeApi(failures=5)
+    async with ServeRecorder(api, retries=2, retry_delay=0) as recorder:  # type: ignore[arg-type]
+        await recorder.record("isvc", serve("mv"))
+    assert (recorder.stats.retries, recorder.stats.failed) == (2, 1)
+
+
+async def test_latency():
+    now = 0.0
+    api = FakeApi()
+    api.release.clear()
+    recorder = ServeRecorder(api, clock=lambda: now)  # type: ignore[arg-type]
+    await recorder.record("isvc", serve("mv"))
+    now = 1.5
+    api.release.set()
+    await recorder.flush()
+    assert recorder.stats.last_latency == recorder.stats.max_latency == 1.5
+    await recorder.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        await recorder.record("isvc", serve("mv"))
+    with pytest.raises(ValueError, match="Queue size"):
+        ServeRecorder(api, max_queue=0)  # type: ignore[arg-type]
+
+
+@pytest.mark.e2e
+async def test_record_serve_models(async_client: AsyncModelRegistry):
+    await async_client.register_model(
+        "model",
+        "s3",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="v0",
+    )
+    assert (mv := await async_client.get_model_version("model", "v0"))
+    rm = await async_client.get_registered_model("model")
+    assert rm
+    api = async_client._api
+    env = await api.upsert_serving_environment(ServingEnvironment(name="env"))
+    services = await api.upsert_inference_services(
+        InferenceService(
+            name=f"isvc{i}",
+            serving_environment_id=str(env.id),
+            registered_model_id=str(rm.id),
+        )
+        for i in range(3)
+    )
+
+    async with ServeRecorder(api) as recorder:
+        for isvc in services:
+            assert isinstance(isvc, InferenceService)
+            await recorder.record(str(isvc.id), serve(str(mv.id)))
+    assert recorder.stats.recorded == 3
+    for isvc in services:
+        assert isinstance(isvc, InferenceService)
+        [sm] = await api.get_serve_models(str(isvc.id))
+        assert sm.last_known_state == ExecutionState.RUNNING
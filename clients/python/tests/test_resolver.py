@@ -0,0 +1,115 @@
+import pytest
+
+from model_registry import AsyncModelRegistry
+from model_registry.resolver import PathResolver
+from model_registry.types import ModelArtifact, ModelVersion, RegisteredModel
+
+
+class FakeApi:
+    """A model with one version and one artifact, recording each lookup."""
+
+    def __init__(self):
+        self.rm = RegisteredModel(name="model", id="1")
+        self.mv = ModelVersion(name="1.2.0", id="2", external_id="model:1.2.0")
+        self.ma = ModelArtifact(name="model", uri="s3://model", id="3")
+        self.calls: list[str] = []
+
+    async def get_registered_model_by_params(self, name: str):
+        self.calls.append("rm")
+        return self.rm if name == self.rm.name else None
+
+    async def get_model_version_by_params(
+        self, registered_model_id=None, name=None, external_id=None
+    ):
+        self.calls.append("mv")
+        if external_id:
+            return self.mv if external_id == self.mv.external_id else None
+        return self.mv if (registered_model_id, name) == ("1", self.mv.name) else None
+
+    async def get_model_artifact_by_params(
+        self, name=None, model_version_id=None, external_id=None
+    ):
+        self.calls.append("ma")
+        return self.ma if (name, model_version_id) == (self.ma.name, "2") else None
+
+
+async def test_resolve():
+    api = FakeApi()
+    resolver = PathResolver(api)  # type: ignore[arg-type]
+    assert await resolver.resolve("model/1.2.0/model") == api.ma
+    assert api.calls == ["rm", "mv", "ma"]
+
+    # parents are known now
+    api.calls.clear()
+    assert await resolver.resolve("model/1.2.0") == api.mv
+    assert await resolver.resolve("model/1.2.0/model") == api.ma
+    assert await resolver.resolve("model") == api.rm
+    assert api.calls == ["mv", "ma", "rm"]
+
+    api.calls.clear()
+    assert await resolver.resolve_many(
+        ["model/1.2.0/other", "model/2.0.0", "other/1.2.0"]
+    ) == [None, None, None]
+    assert sorted(api.calls) == ["ma", "mv", "rm"]
+
+    for path in ("", "model/", "a/b/c/d"):
+        with pytest.raises(ValueError, match="Expected a path"):
+            await resolver.resolve(path)
+
+
+async def test_resolve_expires_ids():
+    now = 0.0
+    api = FakeApi()
+    resolver = PathResolver(api, ttl=10, max_size=1, clock=lambda: now)  # type: ignore[arg-type]
+    await resolver.model_artifact("model", "1.2.0")
+    api.calls.clear()
+    # only the version ID fits
+    await resolver.model_version("model", "1.2.0")
+    assert api.calls == ["rm", "mv"]
+
+    api.calls.clear()
+    now = 11
+    await resolver.model_artifact("model", "1.2.0")
+    assert api.calls == ["rm", "mv", "ma"]
+
+    with pytest.raises(ValueError, match="TTL"):
+        PathResolver(api, ttl=0)  # type: ignore[arg-type]
+
+
+async def test_resolve_through_external_ids():
+    api = FakeApi()
+    resolver = PathResolver(
+        api,  # type: ignore[arg-type]
+        version_external_id=lambda name, version: f"{name}:{version}",
+    )
+    assert await resolver.resolve("model/1.2.0/model") == api.ma
+    assert api.calls == ["mv", "ma"]
+
+    resolver = PathResolver(
+        api,  # type: ignore[arg-type]
+        # artifacts have no external IDs
+        artifact_external_id=lambda *_: None,
+    )
+    api.calls.clear()
+    assert await resolver.resolve("model/1.2.0/model") == api.ma
+    assert api.calls == ["rm", "mv", "ma"]
+
+
+@pytest.mark.e2e
+async def test_resolve_paths(async_client: AsyncModelRegistry):
+    await async_client.register_model(
+        "model",
+        "s3://model",
+        model_format_name="test_format",
+        model_format_version="test_version",
+        version="1.2.0",
+    )
+    ma = await async_client.resolve("model/1.2.0/model")
+    assert isinstance(ma, ModelArtifact)
+    assert ma.uri == "s3://model"
+    assert ma == await async_client.get_model_artifact("model", "1.2.0")
+    mv = await async_client.resolve("model/1.2.0")
+    assert isinstance(mv, ModelVersion)
+    assert mv.name == "1.2.0"
+    assert await async_client.resolve("model/2.0.0/model") is None
+    assert await async_client.resolve("other") is None
@@ -0,0 +1,163 @@
+import asyncio
+from collections.abc import Iterator
+
+import aiohttp
+import pytest
+
+from mr_openapi import ApiClient, Configuration
+from mr_openapi import retry as retry_module
+from mr_openapi.retry import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    send,
+)
+
+
+class FakeResponse:
+    def __init__(self, status: int, retry_after: str | None = None):
+        self.status = status
+        self.headers = {"Retry-After": retry_after} if retry_after else {}
+        self.released = False
+
+    def release(self) -> None:
+        self.released = True
+
+
+class Server:
+    """Answers requests with the given responses, raising the exceptions."""
+
+    def __init__(self, *outcomes: int | str | Exception):
+        self.outcomes: Iterator[int | str | Exception] = iter(outcomes)
+        self.requests = 0
+        self.responses: list[FakeResponse] = []
+
+    async def request(self) -> aiohttp.ClientResponse:
+        self.requests += 1
+        outcome = next(self.outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        status, _, retry_after = str(outcome).partition(":")
+        self.responses.append(FakeResponse(int(status), retry_after))
+        return self.responses[-1]  # type: ignore[return-value]
+
+
+@pytest.fixture
+def delays(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    delays = []
+    sleep = asyncio.sleep
+
+    async def record(delay: float) -> None:
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(retry_module.asyncio, "sleep", record)
+    return delays
+
+
+async def test_retries_with_jitter(delays: list[float]):
+    server = Server(503, asyncio.TimeoutError(), 502, 200)
+    policy = RetryPolicy(base_delay=1, max_delay=5)
+    response = await send(server.request, method="GET", attempts=4, policy=policy)
+    assert response.status == 200
+    assert server.requests == 4
+    assert server.responses[0].released
+    assert len(delays) == 3
+    previous = 0.0
+    for delay in delays:
+        assert 1 <= delay <= min(5, max(1, previous * 3))
+        previous = delay
+
+    # out of attempts
+    server = Server(503, 503)
+    response = await send(server.request, method="GET", attempts=2, policy=policy)
+    assert response.status == 503
+    # not retried by default
+    server = Server(500)
+    response = await send(server.request, method="GET", attempts=2, policy=policy)
+    assert response.status == 500
+
+    with pytest.raises(ValueError, match="at least 1 attempt"):
+        await send(server.request, method="GET", attempts=0, policy=policy)
+
+
+async def test_retry_after(delays: list[float]):
+    server = Server("429:2", "503:120", 200)
+    response = await send(
+        server.request, method="GET", attempts=4, policy=RetryPolicy()
+    )
+    # too long to wait for
+    assert response.status == 503
+    assert delays == [2.0]
+
+
+async def test_only_retries_unprocessed_writes(delays: list[float]):
+    policy = RetryPolicy()
+    server = Server(502)
+    response = await send(server.request, method="POST", attempts=4, policy=policy)
+    assert response.status == 502
+
+    server = Server(aiohttp.ServerDisconnectedError())
+    with pytest.raises(aiohttp.ServerDisconnectedError):
+        await send(server.request, method="POST", attempts=4, policy=policy)
+
+    connection_error = aiohttp.ClientConnectorError(
+        connection_key=None,  # type: ignore[arg-type]
+        os_error=OSError("refused"),
+    )
+    server = Server(connection_error, 429, 201)
+    response = await send(server.request, method="POST", attempts=4, policy=policy)
+    assert response.status == 201
+    assert len(delays) == 2
+
+
+async def test_circuit_breaker(delays: list[float]):
+    now = 0.0
+    breaker = CircuitBreaker(
+        "http://registry", BreakerPolicy(failure_threshold=2), clock=lambda: now
+    )
+    server = Server(503, 504, 200, 503, 200)
+    response = await send(
+        server.request, method="GET", attempts=6, policy=RetryPolicy(), breaker=breaker
+    )
+    assert response.status == 504
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError, match="Circuit open"):
+        await send(
+            server.request,
+            method="GET",
+            attempts=1,
+            policy=RetryPolicy(),
+            breaker=breaker,
+        )
+
+    # a single probe goes through once the circuit half-opens
+    now = 30
+    assert breaker.state == "half-open"
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    now = 60
+    response = await send(
+        server.request, method="GET", attempts=1, policy=RetryPolicy(), breaker=breaker
+    )
+    assert response.status == 200
+    assert breaker.state == "closed"
+
+
+async def test_client_fails_fast():
+    config = Configuration("http://127.0.0.1:1")
+    config.retries = 2
+    config.retry_policy = RetryPolicy(base_delay=0, max_delay=0)
+    config.circuit_breaker = BreakerPolicy(failure_threshold=2, reset_timeout=60)
+    async with ApiClient(config) as api_client:
+        with pytest.raises(aiohttp.ClientConnectorError):
+            await api_client.rest_client.request("GET", "http://127.0.0.1:1/x")
+        assert api_client.rest_client.breaker
+        assert api_client.rest_client.breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await api_client.rest_client.request("GET", "http://127.0.0.1:1/x")
@@ -0,0 +1,46 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from model_registry._runner import AsyncRunner
+
+
+@pytest.fixture
+def runner():
+    runner = AsyncRunner()
+    yield runner
+    runner.close()
+
+
+async def _loop_id() -> int:
+    await asyncio.sleep(0)
+    return id(asyncio.get_running_loop())
+
+
+def test_run_uses_single_loop_across_threads(runner: AsyncRunner):
+    with ThreadPoolExecutor(8) as pool:
+        loops = set(pool.map(lambda _: runner.run(_loop_id()), range(32)))
+    assert loops == {id(runner.loop)}
+
+
+async def test_run_from_running_loop(runner: AsyncRunner):
+    assert runner.run(_loop_id()) != id(asyncio.get_running_loop())
+
+
+def test_run_from_runner_loop_raises(runner: AsyncRunner):
+    async def nested():
+        return runner.run(_loop_id())
+
+    with pytest.raises(RuntimeError, match="within itself"):
+        runner.run(nested())
+
+
+def test_close_and_restart(runner: AsyncRunner):
+    loop = runner.loop
+    thread = runner._thread
+    assert thread
+    runner.close()
+    assert loop.is_closed()
+    assert not thread.is_alive()
+    assert runner.run(_loop_id()) != id(loop)
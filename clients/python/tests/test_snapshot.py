@@ -0,0 +1,104 @@
+import pytest
+
+from model_registry.mirror import RegistryMirror
+from model_registry.snapshot import Snapshot, SnapshotRecord, encode, write_snapshot
+from model_registry.types import ModelArtifact, RegisteredModel
+
+
+def mirror_of(n: int) -> RegistryMirror:
+    mirror = RegistryMirror(None)  # type: ignore[arg-type]
+    for i in range(n):
+        mirror._put_model(
+            RegisteredModel(
+                id=str(i),
+                name=f"model{i}",
+                owner="owner",
+                custom_properties={"team": "ml", "i": i, "f": 0.5, "b": True},
+                last_update_time_since_epoch=str(1000 + i),
+            )
+        )
+        mirror._put_version(
+            {
+                "id": str(i),
+                "name": "v1",
+                "author": "author",
+                "registeredModelId": str(i),
+                "state": "LIVE",
+                "lastUpdateTimeSinceEpoch": str(2000 + i),
+            }
+        )
+        mirror._put_artifact(
+            str(i),
+            ModelArtifact(
+                id=str(i),
+                name=f"model{i}",
+                uri=f"s3://bucket/{i}",
+                model_format_name="onnx",
+            ),
+        )
+    return mirror
+
+
+def test_snapshot_roundtrip(tmp_path):
+    mirror = mirror_of(5)
+    path = tmp_path / "registry.snap"
+    mirror.save(path)
+
+    restored = RegistryMirror(None)  # type: ignore[arg-type]
+    assert restored.load_snapshot(path) == 15
+    assert restored._watermarks == mirror._watermarks
+    # nothing is decoded before being looked up
+    assert all(isinstance(v, SnapshotRecord) for v in restored._models.values())
+
+    for i in range(5):
+        assert restored.get_registered_model(f"model{i}") == (
+            mirror.get_registered_model(f"model{i}")
+        )
+        assert restored.get_model_version(f"model{i}", "v1") == (
+            mirror.get_model_version(f"model{i}", "v1")
+        )
+        assert restored.get_model_artifact(f"model{i}", "v1") == (
+            mirror.get_model_artifact(f"model{i}", "v1")
+        )
+    assert isinstance(restored._models["model0"], RegisteredModel)
+    assert restored.get_registered_model("missing") is None
+
+    # partially decoded mirrors are saved as well
+    restored._reset()
+    restored.load_snapshot(path)
+    restored.get_registered_model("model1")
+    restored.save(tmp_path / "copy.snap")
+    copy = RegistryMirror(None)  # type: ignore[arg-type]
+    copy.load_snapshot(tmp_path / "copy.snap")
+    assert [copy.get_model_versions(f"model{i}") for i in range(5)] == [
+        mirror.get_model_versions(f"model{i}") for i in range(5)
+    ]
+
+
+def test_snapshot_interns_strings(tmp_path):
+    path = tmp_path / "registry.snap"
+    rows = [encode(RegisteredModel(id=str(i), name="model")) for i in range(100)]
+    write_snapshot(path, {"models": rows}, {})
+    with Snapshot(path) as snapshot:
+        assert snapshot.rows("models") == 100
+        assert snapshot.rows("versions") == 0
+        record = snapshot.records("models")[42]
+        assert record["id"] == "42"
+        assert record["missing"] is None
+        assert record.materialize(RegisteredModel) == RegisteredModel(
+            id="42", name="model"
+        )
+    # IDs, a single name and state, and the column names
+    assert path.stat().st_size < 100 * 4 * len(rows[0]) + 2000
+
+
+def test_snapshot_errors(tmp_path):
+    path = tmp_path / "registry.snap"
+    path.write_bytes(b"not a snapshot" * 10)
+    with pytest.raises(ValueError, match="Not a registry snapshot"):
+        Snapshot(path)
+
+    mirror_of(3).save(path)
+    path.write_bytes(path.read_bytes()[:-10])
+    with pytest.raises(ValueError, match="truncated"):
+        Snapshot(path)
@@ -0,0 +1,60 @@
+from model_registry.types import (
+    InferenceService,
+    InferenceServiceState,
+    ModelVersion,
+    RegisteredModel,
+)
+from mr_openapi import InferenceService as InferenceServiceBaseModel
+
+
+def test_props_as_dict():
+    rm = RegisteredModel(name="model", description="desc", custom_properties={"a": 1})
+    props = rm._props_as_dict(exclude=("id", "custom_properties"))
+    assert "id" not in props
+    assert "custom_properties" not in props
+    assert props["name"] == "model"
+    assert props["description"] == "desc"
+    assert list(props) == [
+        k for k in RegisteredModel.model_fields if k not in ("id", "custom_properties")
+    ]
+    # a bare string excludes that one field
+    assert set(rm._props_as_dict(exclude="custom_properties")) == set(
+        RegisteredModel.model_fields
+    ) - {"custom_properties"}
+
+
+def test_create_does_not_build_schema(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(ModelVersion, "model_json_schema", fail)
+    mv = ModelVersion(
+        name="version", author="author", custom_properties={"key": "value"}
+    )
+    assert mv.create(registered_model_id="1").name == "version"
+    assert mv.update().author == "author"
+
+
+def test_inference_service_conversions():
+    payload = {
+        "id": "1",
+        "name": "isvc",
+        "servingEnvironmentId": "2",
+        "registeredModelId": "3",
+        "desiredState": "UNDEPLOYED",
+        "customProperties": {
+            "key": {"string_value": "value", "metadataType": "MetadataStringValue"}
+        },
+    }
+    isvc = InferenceService.from_payload(payload)
+    assert isvc.desired_state == InferenceServiceState.UNDEPLOYED
+    assert isvc.custom_properties == {"key": "value"}
+    assert isvc == InferenceService.from_basemodel(
+        InferenceServiceBaseModel.from_dict(payload)
+    )
+
+    assert isvc.create().serving_environment_id == "2"
+    # the environment and model of a service can't change
+    update = isvc.update().to_dict()
+    assert "servingEnvironmentId" not in update
+    assert update["desiredState"] == "UNDEPLOYED"
@@ -0,0 +1,157 @@
+import asyncio
+
+import pytest
+
+from model_registry import watch as watch_module
+from model_registry.types import ListOptions, RegisteredModel
+from model_registry.watch import payload_times, watch
+
+
+class Store:
+    """Registered models, listed by descending update time."""
+
+    def __init__(self, size: int = 2):
+        self.items: dict[str, RegisteredModel] = {}
+        self.size = size
+        self.now = 0
+        self.calls = 0
+
+    def put(self, name: str, **kwargs) -> None:
+        self.now += 1
+        if rm := self.items.get(name):
+            rm = rm.model_copy(update=kwargs)
+        else:
+            rm = RegisteredModel(
+                name=name,
+                id=str(len(self.items)),
+                create_time_since_epoch=str(self.now),
+                **kwargs,
+            )
+        rm.last_update_time_since_epoch = str(self.now)
+        self.items[name] = rm
+
+    async def fetch(self, options: ListOptions) -> list[RegisteredModel]:
+        assert options.order_by == "LAST_UPDATE_TIME"
+        assert options.is_asc is False
+        self.calls += 1
+        items = sorted(
+            self.items.values(),
+            key=lambda rm: int(rm.last_update_time_since_epoch or 0),
+            reverse=True,
+        )
+        start = int(options.next_page_token or 0)
+        end = start + self.size
+        options.next_page_token = str(end) if end < len(items) else ""
+        return items[start:end]
+
+
+@pytest.fixture
+def intervals(monkeypatch) -> list[float]:
+    intervals = []
+    sleep = asyncio.sleep
+
+    async def record(interval: float) -> None:
+        # the tests themselves only yield to the loop
+        if interval:
+            intervals.append(interval)
+        await sleep(0)
+
+    monkeypatch.setattr(watch_module.asyncio, "sleep", record)
+    return intervals
+
+
+async def test_watch_reports_changes_once(intervals: list[float]):
+    store = Store()
+    store.put("existing")
+    events = watch(store.fetch)
+
+    # the first poll only finds where to start from
+    async def next_event():
+        return await events.__anext__()
+
+    task = asyncio.ensure_future(next_event())
+    await asyncio.sleep(0)
+    store.put("a")
+    store.put("b")
+    store.put("c")
+    store.put("existing", description="updated")
+
+    event = await task
+    assert (event.type, event.object.name) == ("created", "a")
+    rest = [await next_event() for _ in range(3)]
+    assert [(e.type, e.object.name) for e in rest] == [
+        ("created", "b"),
+        ("created", "c"),
+        ("updated", "existing"),
+    ]
+
+    store.put("b", description="updated")
+    event = await next_event()
+    assert (event.type, event.object.name) == ("updated", "b")
+    assert event.object.description == "updated"
+    await events.aclose()
+
+
+async def test_watch_dedups_same_update_time(intervals: list[float]):
+    store = Store()
+    store.put("a")
+    store.now -= 1
+    store.put("b")
+    events = watch(store.fetch, since=1)
+
+    first = [await events.__anext__() for _ in range(2)]
+    assert {e.object.name for e in first} == {"a", "b"}
+    assert {e.type for e in first} == {"created"}
+
+    store.now -= 1
+    store.put("c")
+    event = await events.__anext__()
+    assert event.object.name == "c"
+    await events.aclose()
+
+
+async def test_watch_adapts_interval(intervals: list[float]):
+    store = Store()
+    store.put("old")
+    store.put("existing")
+    events = watch(store.fetch, min_interval=1, max_interval=5)
+
+    task = asyncio.ensure_future(events.__anext__())
+    while len(intervals) < 5:
+        await asyncio.sleep(0)
+    store.put("a")
+    assert (await task).object.name == "a"
+    task = asyncio.ensure_future(events.__anext__())
+    while len(intervals) < 7:
+        await asyncio.sleep(0)
+    task.cancel()
+
+    assert intervals == [1, 2, 4, 5, 5, 1, 2]
+    # idle polls stop at the first page, the one finding "a" reads both
+    assert store.calls == 1 + 5 + 2
+
+
+async def test_watch_payloads(intervals: list[float]):
+    items = [
+        {"id": "1", "createTimeSinceEpoch": "1", "lastUpdateTimeSinceEpoch": "3"},
+        {"id": "2", "createTimeSinceEpoch": "2", "lastUpdateTimeSinceEpoch": "2"},
+        {"id": "3", "createTimeSinceEpoch": "1", "lastUpdateTimeSinceEpoch": "1"},
+    ]
+
+    async def fetch(options: ListOptions) -> list[dict]:
+        return items
+
+    events = watch(fetch, times=payload_times, since=2)
+    changes = [await events.__anext__() for _ in range(2)]
+    assert [(e.type, e.object["id"]) for e in changes] == [
+        ("created", "2"),
+        ("updated", "1"),
+    ]
+    await events.aclose()
+
+
+async def test_watch_invalid_intervals():
+    with pytest.raises(ValueError, match="intervals"):
+        await watch(Store().fetch, min_interval=2, max_interval=1).__anext__()
+    with pytest.raises(ValueError, match="Backoff"):
+        await watch(Store().fetch, backoff=0.5).__anext__()